@@ -37,8 +37,7 @@ impl<'alloc> ParserTrait<'alloc, StackValue<'alloc>> for Parser<'alloc> {
         while !self.node_stack.queue_empty() {
             let term_index: usize = self.node_stack.next().unwrap().term.into();
             debug_assert!(term_index < TABLES.shift_width);
-            let index = state * TABLES.shift_width + term_index;
-            let goto = TABLES.shift_table[index];
+            let goto = TABLES.shift(state, term_index);
             json_trace!({
                 "from": state,
                 "to": goto,
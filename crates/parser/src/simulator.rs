@@ -40,8 +40,7 @@ impl<'alloc, 'parser> ParserTrait<'alloc, ()> for Simulator<'alloc, 'parser> {
         loop {
             let term_index: usize = tv.term.into();
             assert!(term_index < TABLES.shift_width);
-            let index = state * TABLES.shift_width + term_index;
-            let goto = TABLES.shift_table[index];
+            let goto = TABLES.shift(state, term_index);
             if goto < 0 {
                 // Error handling is in charge of shifting an ErrorSymbol from the
                 // current state.
@@ -82,6 +81,15 @@ impl<'alloc, 'parser> ParserTrait<'alloc, ()> for Simulator<'alloc, 'parser> {
         self.sp -= 1;
         TermValue { term: t, value: () }
     }
+    fn discard(&mut self, n: usize) {
+        // Same as calling pop() n times, without reading the terms.
+        let sim_len = self.sim_node_stack.len().saturating_sub(n);
+        let popped = self.sim_node_stack.len() - sim_len;
+        self.sim_node_stack.truncate(sim_len);
+        let state_len = self.sim_state_stack.len().saturating_sub(popped);
+        self.sim_state_stack.truncate(state_len);
+        self.sp -= n - popped;
+    }
     fn replay(&mut self, tv: TermValue<()>) {
         self.replay_stack.push(tv)
     }
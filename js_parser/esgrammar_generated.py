@@ -0,0 +1,2034 @@
+# type: ignore
+
+from jsparagus import runtime
+from jsparagus.runtime import (Nt, InitNt, End, ErrorToken, StateTermValue,
+                               ShiftError, ShiftAccept)
+
+def state_119_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt(InitNt(goal=Nt('rust_edsl'))), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_120_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt(InitNt(goal=Nt('grammar'))), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_121_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('nt_def_list'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_122_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.blank_line()
+    replay = [StateTermValue(0, Nt('nt_def_or_blank_line'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_123_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nt_def_to_list(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('nt_def_or_blank_line'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_124_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nt_lhs_no_params(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('nt_lhs'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_125_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('rust_nt_def_list'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_126_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.blank_line()
+    replay = [StateTermValue(0, Nt('rust_nt_def_or_blank_line'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_127_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nt_def_to_list(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('rust_nt_def_or_blank_line'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_128_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.simple_type(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('nt_type'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_129_actions(parser, lexer):
+
+    value = None
+    raise ShiftAccept()
+    replay = [StateTermValue(0, Nt(InitNt(goal=Nt('rust_edsl'))), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_130_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concat(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('nt_def_list'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_131_actions(parser, lexer):
+
+    value = None
+    raise ShiftAccept()
+    replay = [StateTermValue(0, Nt(InitNt(goal=Nt('grammar'))), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_132_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concat(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('rust_nt_def_list'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_133_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('nt_type_params'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_134_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('nt_type_param'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_135_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('params'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_136_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('param'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_137_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.lifetime_type(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('nt_type_param'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_138_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('rhs_lines'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_139_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('symbols'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_140_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('symbol'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_141_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.terminal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('terminal'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_142_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.chr(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('terminal'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_143_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nonterminal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('nonterminal'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_144_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nt_lhs_with_params(parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('nt_lhs'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_145_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('nt_type_line'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_146_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.parameterized_type(parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('nt_type'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_147_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('nt_type_params'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_148_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nt_def(None, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('nt_def'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_149_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('rhs_lines'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_150_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('symbols'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_151_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.optional(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('symbol'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_152_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.sigil_false()
+    replay = [StateTermValue(0, Nt('definite_sigil'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_153_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.sigil_true()
+    replay = [StateTermValue(0, Nt('definite_sigil'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_154_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rhs_line_prose(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('rhs_line'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_155_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('params'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_156_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('rust_symbols'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_157_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('rust_symbol'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_158_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.empty()
+    replay = [StateTermValue(0, Nt('rust_symbol'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_159_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rhs_line(None, parser.stack[-3].value, parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('rhs_line'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_160_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('reducer'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_161_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.expr_match_ref(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('expr'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_162_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.expr_none()
+    replay = [StateTermValue(0, Nt('expr'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_163_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rhs_line(None, parser.stack[-3].value, None, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('rhs_line'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_164_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.args_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('args'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_165_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('sigil'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_166_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('line_terminator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_167_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.empty_rhs()
+    replay = [StateTermValue(0, Nt('rhs'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_168_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('t_list_lines'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_169_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('terminal_seq'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_170_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nt_def(parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('nt_def'), value, False)]
+    del parser.stack[-6:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_171_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concat(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('rust_symbols'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_172_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rust_expr(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('rust_expr'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_173_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rust_impl(parser.stack[-6].value, parser.stack[-4].value)
+    replay = [StateTermValue(0, Nt('rust_impl'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_174_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('reducer'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_175_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rhs_line(None, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('rhs_line'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_176_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.but_not(parser.stack[-4].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('symbol'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_177_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.exclusion_terminal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('exclusion'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_178_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.exclusion_nonterminal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('exclusion'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_179_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nonterminal_apply(parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('nonterminal'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_180_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arg_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('arg'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_181_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('symbol'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_182_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.la_eq(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('lookahead_assertion'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_183_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.la_ne(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('lookahead_assertion'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_184_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.la_not_in_nonterminal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('lookahead_assertion'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_185_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.ifdef(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ifdef'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_186_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rhs_line(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('rhs_line'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_187_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rhs_line(parser.stack[-4].value, parser.stack[-3].value, None, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('rhs_line'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_188_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nt_def_one_of(None, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('nt_def'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_189_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concat(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('t_list_lines'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_190_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.t_list_line(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('t_list_line'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_191_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('terminal_seq'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_192_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rust_nt_def(parser.stack[-6].value, parser.stack[-3].value)
+    replay = [StateTermValue(0, Nt('rust_nt_def'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_193_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('rust_symbol'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_194_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('expr_args'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_195_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.args_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('args'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_196_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('lookahead_exclusion'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_197_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('lookahead_exclusion_element'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_198_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.no_line_terminator_here(parser.stack[-3].value)
+    replay = [StateTermValue(0, Nt('no_line_terminator_here'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_199_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rhs_line(parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('rhs_line'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_200_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.nt_def_one_of(parser.stack[-8].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('nt_def'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_201_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.expr_call(parser.stack[-4].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('expr'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_202_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('expr_try'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_203_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.expr_some(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('expr'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_204_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.exclusion_chr_range(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('exclusion'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_205_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('exclusion_list'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_206_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.la_not_in_set(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('lookahead_assertion'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_207_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('lookahead_exclusion'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_208_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rust_param_impl(parser.stack[-6].value, parser.stack[-4].value, parser.stack[-8].value)
+    replay = [StateTermValue(0, Nt('rust_impl'), value, False)]
+    del parser.stack[-10:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_209_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.expr_call(parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('expr'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_210_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('expr_args'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_211_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('exclusion_list'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_212_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('grammar'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_213_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rust_edsl(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('rust_edsl'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_214_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('rhs'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_215_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('symbol'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_216_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rhs_line(None, parser.stack[-3].value, None, None)
+    replay = [StateTermValue(0, Nt('rhs_line'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_217_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rust_rhs_line(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('rust_rhs_line'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_218_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.rhs_line(parser.stack[-4].value, parser.stack[-3].value, None, None)
+    replay = [StateTermValue(0, Nt('rhs_line'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_219_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.chr(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('terminal'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_220_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.expr_call(parser.stack[-4].value, None, None)
+    replay = [StateTermValue(0, Nt('expr'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_221_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('lookahead_exclusions'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_222_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.expr_call(parser.stack[-5].value, parser.stack[-3].value, None)
+    replay = [StateTermValue(0, Nt('expr'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_223_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.but_not_one_of(parser.stack[-7].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('symbol'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_224_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.append(parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('lookahead_exclusions'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+actions = [
+    # 0.
+
+    {'impl': 3, Nt('rust_edsl'): 119, Nt('rust_impl'): 2, Nt(InitNt(goal=Nt('rust_edsl'))): 4},
+
+    # 1.
+
+    {'NL': 122, 'NT': 124, 'NTCALL': 7, '@': 9, Nt('grammar'): 120, Nt('nt_def_list'): 5, Nt('nt_def_or_blank_line'): 121, Nt('nt_def'): 123, Nt('nt_lhs'): 6, Nt('nt_type_line'): 8, Nt(InitNt(goal=Nt('grammar'))): 10},
+
+    # 2.
+
+    {'NL': 126, 'RUSTCOMMENT': 126, 'let': 13, Nt('rust_nt_def_list'): 12, Nt('rust_nt_def_or_blank_line'): 125, Nt('rust_nt_def'): 127},
+
+    # 3.
+
+    {'NT': 128, 'NTCALL': 15, '<': 16, Nt('nt_type'): 14},
+
+    # 4.
+
+    {End(): 129},
+
+    # 5.
+
+    {End(): 212, '@': 9, 'NTCALL': 7, 'NT': 124, 'NL': 122, Nt('nt_type_line'): 8, Nt('nt_lhs'): 6, Nt('nt_def'): 123, Nt('nt_def_or_blank_line'): 130},
+
+    # 6.
+
+    {'EQ': 17},
+
+    # 7.
+
+    {'[': 18},
+
+    # 8.
+
+    {'NT': 124, 'NTCALL': 7, Nt('nt_lhs'): 19},
+
+    # 9.
+
+    {'returns': 20},
+
+    # 10.
+
+    {End(): 131},
+
+    # 11.
+
+    {},
+
+    # 12.
+
+    {End(): 213, 'let': 13, 'RUSTCOMMENT': 126, 'NL': 126, Nt('rust_nt_def'): 127, Nt('rust_nt_def_or_blank_line'): 132},
+
+    # 13.
+
+    {'NT': 124, 'NTCALL': 7, Nt('nt_lhs'): 21},
+
+    # 14.
+
+    {'for': 22},
+
+    # 15.
+
+    {'<': 23},
+
+    # 16.
+
+    {'NT': 128, 'NTCALL': 15, "'": 25, Nt('nt_type_params'): 24, Nt('nt_type_param'): 133, Nt('nt_type'): 134},
+
+    # 17.
+
+    {'NL': 26, 'one': 27},
+
+    # 18.
+
+    {'NT': 136, Nt('params'): 28, Nt('param'): 135},
+
+    # 19.
+
+    {'EQ': 29},
+
+    # 20.
+
+    {'NT': 128, 'NTCALL': 15, Nt('nt_type'): 30},
+
+    # 21.
+
+    {'=': 31},
+
+    # 22.
+
+    {'NT': 128, 'NTCALL': 15, Nt('nt_type'): 32},
+
+    # 23.
+
+    {'NT': 128, 'NTCALL': 15, "'": 25, Nt('nt_type_params'): 33, Nt('nt_type_param'): 133, Nt('nt_type'): 134},
+
+    # 24.
+
+    {'>': 34, ',': 35},
+
+    # 25.
+
+    {'NT': 137},
+
+    # 26.
+
+    {'T': 141, 'CHR': 142, 'NT': 143, 'NTCALL': 40, '[': 41, 'WPROSE': 140, 'PROSE': 43, Nt('rhs_lines'): 36, Nt('rhs_line'): 138, Nt('rhs'): 37, Nt('symbols'): 38, Nt('symbol'): 139, Nt('terminal'): 140, Nt('nonterminal'): 39, Nt('no_line_terminator_here'): 140, Nt('ifdef'): 42},
+
+    # 27.
+
+    {'of': 44},
+
+    # 28.
+
+    {']': 144, ',': 45},
+
+    # 29.
+
+    {'NL': 46, 'one': 47},
+
+    # 30.
+
+    {'NL': 145},
+
+    # 31.
+
+    {'{': 48},
+
+    # 32.
+
+    {'{': 49},
+
+    # 33.
+
+    {'>': 146, ',': 35},
+
+    # 34.
+
+    {'NT': 128, 'NTCALL': 15, Nt('nt_type'): 50},
+
+    # 35.
+
+    {'NT': 128, 'NTCALL': 15, "'": 25, Nt('nt_type_param'): 147, Nt('nt_type'): 134},
+
+    # 36.
+
+    {'NL': 148, 'T': 141, 'CHR': 142, 'NT': 143, 'NTCALL': 40, '[': 41, 'WPROSE': 140, 'PROSE': 43, Nt('rhs_line'): 149, Nt('rhs'): 37, Nt('symbols'): 38, Nt('symbol'): 139, Nt('terminal'): 140, Nt('nonterminal'): 39, Nt('no_line_terminator_here'): 140, Nt('ifdef'): 42},
+
+    # 37.
+
+    {'NL': 51, '=>': 53, 'PRODID': 54, Nt('reducer'): 52},
+
+    # 38.
+
+    {'PRODID': 214, '=>': 214, 'NL': 214, 'WPROSE': 140, '[': 55, 'NTCALL': 40, 'NT': 143, 'CHR': 142, 'T': 141, Nt('reducer'): 214, Nt('no_line_terminator_here'): 140, Nt('nonterminal'): 39, Nt('terminal'): 140, Nt('symbol'): 150},
+
+    # 39.
+
+    {'T': 215, 'CHR': 215, 'NT': 215, 'NTCALL': 215, '[': 215, 'WPROSE': 215, 'NL': 215, '=>': 215, 'PRODID': 215, '}': 215, '{': 215, 'but': 56, '?': 151, Nt('symbol'): 215, Nt('terminal'): 215, Nt('nonterminal'): 215, Nt('no_line_terminator_here'): 215, Nt('reducer'): 215, Nt('rust_symbol'): 215},
+
+    # 40.
+
+    {'[': 57},
+
+    # 41.
+
+    {'lookahead': 58, 'no': 59, 'empty': 60, '~': 152, '+': 153, Nt('definite_sigil'): 61},
+
+    # 42.
+
+    {'T': 141, 'CHR': 142, 'NT': 143, 'NTCALL': 40, '[': 63, 'WPROSE': 140, Nt('rhs'): 62, Nt('symbols'): 38, Nt('symbol'): 139, Nt('terminal'): 140, Nt('nonterminal'): 39, Nt('no_line_terminator_here'): 140},
+
+    # 43.
+
+    {'NL': 154},
+
+    # 44.
+
+    {'NL': 64},
+
+    # 45.
+
+    {'NT': 136, Nt('param'): 155},
+
+    # 46.
+
+    {'T': 141, 'CHR': 142, 'NT': 143, 'NTCALL': 40, '[': 41, 'WPROSE': 140, 'PROSE': 43, Nt('rhs_lines'): 65, Nt('rhs_line'): 138, Nt('rhs'): 37, Nt('symbols'): 38, Nt('symbol'): 139, Nt('terminal'): 140, Nt('nonterminal'): 39, Nt('no_line_terminator_here'): 140, Nt('ifdef'): 42},
+
+    # 47.
+
+    {'of': 66},
+
+    # 48.
+
+    {'{': 69, 'T': 141, 'CHR': 142, 'NT': 143, 'NTCALL': 40, '[': 55, 'WPROSE': 140, 'NL': 158, Nt('rust_rhs_line'): 67, Nt('rust_symbols'): 68, Nt('rust_symbol'): 156, Nt('symbol'): 157, Nt('terminal'): 140, Nt('nonterminal'): 39, Nt('no_line_terminator_here'): 140},
+
+    # 49.
+
+    {'}': 70},
+
+    # 50.
+
+    {'for': 71},
+
+    # 51.
+
+    {'PROSE': 216, 'WPROSE': 216, '[': 216, 'NTCALL': 216, 'NT': 216, 'CHR': 216, 'T': 216, 'NL': 216, '=>': 72, Nt('ifdef'): 216, Nt('no_line_terminator_here'): 216, Nt('nonterminal'): 216, Nt('terminal'): 216, Nt('symbol'): 216, Nt('symbols'): 216, Nt('rhs'): 216, Nt('rhs_line'): 216},
+
+    # 52.
+
+    {'NL': 159, 'PRODID': 73},
+
+    # 53.
+
+    {'MATCH_REF': 161, 'NT': 74, 'Some': 75, 'None': 162, Nt('expr'): 160},
+
+    # 54.
+
+    {'NL': 163},
+
+    # 55.
+
+    {'lookahead': 58, 'no': 59},
+
+    # 56.
+
+    {'not': 76},
+
+    # 57.
+
+    {'~': 152, '+': 153, '?': 165, Nt('args'): 77, Nt('arg'): 164, Nt('sigil'): 78, Nt('definite_sigil'): 165},
+
+    # 58.
+
+    {'==': 80, '!=': 81, '<!': 82, Nt('lookahead_assertion'): 79},
+
+    # 59.
+
+    {'NT': 166, 'NTALT': 166, Nt('line_terminator'): 83},
+
+    # 60.
+
+    {']': 167},
+
+    # 61.
+
+    {'NT': 84},
+
+    # 62.
+
+    {'NL': 85, '=>': 53, 'PRODID': 87, Nt('reducer'): 86},
+
+    # 63.
+
+    {'lookahead': 58, 'no': 59, 'empty': 60},
+
+    # 64.
+
+    {'T': 141, 'CHR': 142, Nt('t_list_lines'): 88, Nt('t_list_line'): 168, Nt('terminal_seq'): 89, Nt('terminal'): 169},
+
+    # 65.
+
+    {'NL': 170, 'T': 141, 'CHR': 142, 'NT': 143, 'NTCALL': 40, '[': 41, 'WPROSE': 140, 'PROSE': 43, Nt('rhs_line'): 149, Nt('rhs'): 37, Nt('symbols'): 38, Nt('symbol'): 139, Nt('terminal'): 140, Nt('nonterminal'): 39, Nt('no_line_terminator_here'): 140, Nt('ifdef'): 42},
+
+    # 66.
+
+    {'NL': 90},
+
+    # 67.
+
+    {'}': 91},
+
+    # 68.
+
+    {'}': 217, 'NL': 158, 'WPROSE': 140, '[': 55, 'NTCALL': 40, 'NT': 143, 'CHR': 142, 'T': 141, '{': 69, Nt('no_line_terminator_here'): 140, Nt('nonterminal'): 39, Nt('terminal'): 140, Nt('symbol'): 157, Nt('rust_symbol'): 171},
+
+    # 69.
+
+    {'MATCH_REF': 161, 'NT': 74, 'Some': 75, 'None': 162, Nt('rust_expr'): 92, Nt('expr'): 172},
+
+    # 70.
+
+    {';': 173},
+
+    # 71.
+
+    {'NT': 128, 'NTCALL': 15, Nt('nt_type'): 93},
+
+    # 72.
+
+    {'MATCH_REF': 161, 'NT': 74, 'Some': 75, 'None': 162, Nt('expr'): 174},
+
+    # 73.
+
+    {'NL': 175},
+
+    # 74.
+
+    {'(': 94},
+
+    # 75.
+
+    {'(': 95},
+
+    # 76.
+
+    {'T': 141, 'CHR': 96, 'NT': 143, 'NTCALL': 40, 'one': 97, Nt('exclusion'): 176, Nt('terminal'): 177, Nt('nonterminal'): 178},
+
+    # 77.
+
+    {']': 179, ',': 98},
+
+    # 78.
+
+    {'NT': 180},
+
+    # 79.
+
+    {']': 181},
+
+    # 80.
+
+    {'T': 141, 'CHR': 142, Nt('terminal'): 182},
+
+    # 81.
+
+    {'T': 141, 'CHR': 142, Nt('terminal'): 183},
+
+    # 82.
+
+    {'NT': 184, '{': 99},
+
+    # 83.
+
+    {'here': 100},
+
+    # 84.
+
+    {']': 185},
+
+    # 85.
+
+    {'PROSE': 218, 'WPROSE': 218, '[': 218, 'NTCALL': 218, 'NT': 218, 'CHR': 218, 'T': 218, 'NL': 218, '=>': 72, Nt('ifdef'): 218, Nt('no_line_terminator_here'): 218, Nt('nonterminal'): 218, Nt('terminal'): 218, Nt('symbol'): 218, Nt('symbols'): 218, Nt('rhs'): 218, Nt('rhs_line'): 218},
+
+    # 86.
+
+    {'NL': 186, 'PRODID': 101},
+
+    # 87.
+
+    {'NL': 187},
+
+    # 88.
+
+    {'NL': 188, 'T': 141, 'CHR': 142, Nt('t_list_line'): 189, Nt('terminal_seq'): 89, Nt('terminal'): 169},
+
+    # 89.
+
+    {'NL': 190, 'T': 141, 'CHR': 142, Nt('terminal'): 191},
+
+    # 90.
+
+    {'T': 141, 'CHR': 142, Nt('t_list_lines'): 102, Nt('t_list_line'): 168, Nt('terminal_seq'): 89, Nt('terminal'): 169},
+
+    # 91.
+
+    {';': 192},
+
+    # 92.
+
+    {'}': 193},
+
+    # 93.
+
+    {'{': 103},
+
+    # 94.
+
+    {')': 104, 'MATCH_REF': 161, 'NT': 74, 'Some': 75, 'None': 162, Nt('expr_args'): 105, Nt('expr'): 194},
+
+    # 95.
+
+    {'MATCH_REF': 161, 'NT': 74, 'Some': 75, 'None': 162, Nt('expr'): 106},
+
+    # 96.
+
+    {'{': 219, 'T': 219, 'CHR': 219, 'NT': 219, 'NTCALL': 219, '[': 219, 'WPROSE': 219, 'NL': 219, '}': 219, '=>': 219, 'PRODID': 219, 'or': 219, 'through': 107, Nt('rust_symbol'): 219, Nt('symbol'): 219, Nt('terminal'): 219, Nt('nonterminal'): 219, Nt('no_line_terminator_here'): 219, Nt('reducer'): 219},
+
+    # 97.
+
+    {'of': 108},
+
+    # 98.
+
+    {'~': 152, '+': 153, '?': 165, Nt('arg'): 195, Nt('sigil'): 78, Nt('definite_sigil'): 165},
+
+    # 99.
+
+    {'T': 141, 'CHR': 142, '[': 111, Nt('lookahead_exclusions'): 109, Nt('lookahead_exclusion'): 110, Nt('lookahead_exclusion_element'): 196, Nt('terminal'): 197, Nt('no_line_terminator_here'): 197},
+
+    # 100.
+
+    {']': 198},
+
+    # 101.
+
+    {'NL': 199},
+
+    # 102.
+
+    {'NL': 200, 'T': 141, 'CHR': 142, Nt('t_list_line'): 189, Nt('terminal_seq'): 89, Nt('terminal'): 169},
+
+    # 103.
+
+    {'}': 112},
+
+    # 104.
+
+    {',': 220, ')': 220, 'PRODID': 220, 'NL': 220, '}': 220, '?': 202, Nt('expr_try'): 201},
+
+    # 105.
+
+    {')': 113, ',': 114},
+
+    # 106.
+
+    {')': 203},
+
+    # 107.
+
+    {'CHR': 204},
+
+    # 108.
+
+    {'T': 141, 'CHR': 96, 'NT': 143, 'NTCALL': 40, Nt('exclusion_list'): 115, Nt('exclusion'): 205, Nt('terminal'): 177, Nt('nonterminal'): 178},
+
+    # 109.
+
+    {'}': 206, ',': 116},
+
+    # 110.
+
+    {',': 221, '}': 221, '[': 111, 'CHR': 142, 'T': 141, Nt('no_line_terminator_here'): 197, Nt('terminal'): 197, Nt('lookahead_exclusion_element'): 207},
+
+    # 111.
+
+    {'no': 59},
+
+    # 112.
+
+    {';': 208},
+
+    # 113.
+
+    {',': 222, ')': 222, 'PRODID': 222, 'NL': 222, '}': 222, '?': 202, Nt('expr_try'): 209},
+
+    # 114.
+
+    {'MATCH_REF': 161, 'NT': 74, 'Some': 75, 'None': 162, Nt('expr'): 210},
+
+    # 115.
+
+    {'{': 223, 'T': 223, 'CHR': 223, 'NT': 223, 'NTCALL': 223, '[': 223, 'WPROSE': 223, 'NL': 223, '}': 223, '=>': 223, 'PRODID': 223, 'or': 117, Nt('rust_symbol'): 223, Nt('symbol'): 223, Nt('terminal'): 223, Nt('nonterminal'): 223, Nt('no_line_terminator_here'): 223, Nt('reducer'): 223},
+
+    # 116.
+
+    {'T': 141, 'CHR': 142, '[': 111, Nt('lookahead_exclusion'): 118, Nt('lookahead_exclusion_element'): 196, Nt('terminal'): 197, Nt('no_line_terminator_here'): 197},
+
+    # 117.
+
+    {'T': 141, 'CHR': 96, 'NT': 143, 'NTCALL': 40, Nt('exclusion'): 211, Nt('terminal'): 177, Nt('nonterminal'): 178},
+
+    # 118.
+
+    {',': 224, '}': 224, '[': 111, 'CHR': 142, 'T': 141, Nt('no_line_terminator_here'): 197, Nt('terminal'): 197, Nt('lookahead_exclusion_element'): 207},
+
+    # 119.
+
+    state_119_actions,
+
+    # 120.
+
+    state_120_actions,
+
+    # 121.
+
+    state_121_actions,
+
+    # 122.
+
+    state_122_actions,
+
+    # 123.
+
+    state_123_actions,
+
+    # 124.
+
+    state_124_actions,
+
+    # 125.
+
+    state_125_actions,
+
+    # 126.
+
+    state_126_actions,
+
+    # 127.
+
+    state_127_actions,
+
+    # 128.
+
+    state_128_actions,
+
+    # 129.
+
+    state_129_actions,
+
+    # 130.
+
+    state_130_actions,
+
+    # 131.
+
+    state_131_actions,
+
+    # 132.
+
+    state_132_actions,
+
+    # 133.
+
+    state_133_actions,
+
+    # 134.
+
+    state_134_actions,
+
+    # 135.
+
+    state_135_actions,
+
+    # 136.
+
+    state_136_actions,
+
+    # 137.
+
+    state_137_actions,
+
+    # 138.
+
+    state_138_actions,
+
+    # 139.
+
+    state_139_actions,
+
+    # 140.
+
+    state_140_actions,
+
+    # 141.
+
+    state_141_actions,
+
+    # 142.
+
+    state_142_actions,
+
+    # 143.
+
+    state_143_actions,
+
+    # 144.
+
+    state_144_actions,
+
+    # 145.
+
+    state_145_actions,
+
+    # 146.
+
+    state_146_actions,
+
+    # 147.
+
+    state_147_actions,
+
+    # 148.
+
+    state_148_actions,
+
+    # 149.
+
+    state_149_actions,
+
+    # 150.
+
+    state_150_actions,
+
+    # 151.
+
+    state_151_actions,
+
+    # 152.
+
+    state_152_actions,
+
+    # 153.
+
+    state_153_actions,
+
+    # 154.
+
+    state_154_actions,
+
+    # 155.
+
+    state_155_actions,
+
+    # 156.
+
+    state_156_actions,
+
+    # 157.
+
+    state_157_actions,
+
+    # 158.
+
+    state_158_actions,
+
+    # 159.
+
+    state_159_actions,
+
+    # 160.
+
+    state_160_actions,
+
+    # 161.
+
+    state_161_actions,
+
+    # 162.
+
+    state_162_actions,
+
+    # 163.
+
+    state_163_actions,
+
+    # 164.
+
+    state_164_actions,
+
+    # 165.
+
+    state_165_actions,
+
+    # 166.
+
+    state_166_actions,
+
+    # 167.
+
+    state_167_actions,
+
+    # 168.
+
+    state_168_actions,
+
+    # 169.
+
+    state_169_actions,
+
+    # 170.
+
+    state_170_actions,
+
+    # 171.
+
+    state_171_actions,
+
+    # 172.
+
+    state_172_actions,
+
+    # 173.
+
+    state_173_actions,
+
+    # 174.
+
+    state_174_actions,
+
+    # 175.
+
+    state_175_actions,
+
+    # 176.
+
+    state_176_actions,
+
+    # 177.
+
+    state_177_actions,
+
+    # 178.
+
+    state_178_actions,
+
+    # 179.
+
+    state_179_actions,
+
+    # 180.
+
+    state_180_actions,
+
+    # 181.
+
+    state_181_actions,
+
+    # 182.
+
+    state_182_actions,
+
+    # 183.
+
+    state_183_actions,
+
+    # 184.
+
+    state_184_actions,
+
+    # 185.
+
+    state_185_actions,
+
+    # 186.
+
+    state_186_actions,
+
+    # 187.
+
+    state_187_actions,
+
+    # 188.
+
+    state_188_actions,
+
+    # 189.
+
+    state_189_actions,
+
+    # 190.
+
+    state_190_actions,
+
+    # 191.
+
+    state_191_actions,
+
+    # 192.
+
+    state_192_actions,
+
+    # 193.
+
+    state_193_actions,
+
+    # 194.
+
+    state_194_actions,
+
+    # 195.
+
+    state_195_actions,
+
+    # 196.
+
+    state_196_actions,
+
+    # 197.
+
+    state_197_actions,
+
+    # 198.
+
+    state_198_actions,
+
+    # 199.
+
+    state_199_actions,
+
+    # 200.
+
+    state_200_actions,
+
+    # 201.
+
+    state_201_actions,
+
+    # 202.
+
+    state_202_actions,
+
+    # 203.
+
+    state_203_actions,
+
+    # 204.
+
+    state_204_actions,
+
+    # 205.
+
+    state_205_actions,
+
+    # 206.
+
+    state_206_actions,
+
+    # 207.
+
+    state_207_actions,
+
+    # 208.
+
+    state_208_actions,
+
+    # 209.
+
+    state_209_actions,
+
+    # 210.
+
+    state_210_actions,
+
+    # 211.
+
+    state_211_actions,
+
+    # 212.
+
+    state_212_actions,
+
+    # 213.
+
+    state_213_actions,
+
+    # 214.
+
+    state_214_actions,
+
+    # 215.
+
+    state_215_actions,
+
+    # 216.
+
+    state_216_actions,
+
+    # 217.
+
+    state_217_actions,
+
+    # 218.
+
+    state_218_actions,
+
+    # 219.
+
+    state_219_actions,
+
+    # 220.
+
+    state_220_actions,
+
+    # 221.
+
+    state_221_actions,
+
+    # 222.
+
+    state_222_actions,
+
+    # 223.
+
+    state_223_actions,
+
+    # 224.
+
+    state_224_actions,
+
+]
+
+error_codes = [
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None,
+]
+
+goal_nt_to_init_state = {'rust_edsl': 0, 'grammar': 1}
+
+class DefaultMethods:
+    def blank_line(self, ):
+        return ('blank_line', )
+    def nt_def_to_list(self, x0):
+        return ('nt_def_to_list', x0)
+    def nt_lhs_no_params(self, x0):
+        return ('nt_lhs_no_params', x0)
+    def simple_type(self, x0):
+        return ('simple_type', x0)
+    def concat(self, x0, x1):
+        return ('concat', x0, x1)
+    def single(self, x0):
+        return ('single', x0)
+    def lifetime_type(self, x0):
+        return ('lifetime_type', x0)
+    def terminal(self, x0):
+        return ('terminal', x0)
+    def chr(self, x0):
+        return ('chr', x0)
+    def nonterminal(self, x0):
+        return ('nonterminal', x0)
+    def nt_lhs_with_params(self, x0, x1):
+        return ('nt_lhs_with_params', x0, x1)
+    def parameterized_type(self, x0, x1):
+        return ('parameterized_type', x0, x1)
+    def append(self, x0, x1):
+        return ('append', x0, x1)
+    def nt_def(self, x0, x1, x2, x3):
+        return ('nt_def', x0, x1, x2, x3)
+    def append(self, x0, x1):
+        return ('append', x0, x1)
+    def optional(self, x0):
+        return ('optional', x0)
+    def sigil_false(self, ):
+        return ('sigil_false', )
+    def sigil_true(self, ):
+        return ('sigil_true', )
+    def rhs_line_prose(self, x0):
+        return ('rhs_line_prose', x0)
+    def empty(self, ):
+        return ('empty', )
+    def rhs_line(self, x0, x1, x2, x3):
+        return ('rhs_line', x0, x1, x2, x3)
+    def expr_match_ref(self, x0):
+        return ('expr_match_ref', x0)
+    def expr_none(self, ):
+        return ('expr_none', )
+    def rhs_line(self, x0, x1, x2, x3):
+        return ('rhs_line', x0, x1, x2, x3)
+    def args_single(self, x0):
+        return ('args_single', x0)
+    def empty_rhs(self, ):
+        return ('empty_rhs', )
+    def nt_def(self, x0, x1, x2, x3):
+        return ('nt_def', x0, x1, x2, x3)
+    def rust_expr(self, x0):
+        return ('rust_expr', x0)
+    def rust_impl(self, x0, x1):
+        return ('rust_impl', x0, x1)
+    def rhs_line(self, x0, x1, x2, x3):
+        return ('rhs_line', x0, x1, x2, x3)
+    def but_not(self, x0, x1):
+        return ('but_not', x0, x1)
+    def exclusion_terminal(self, x0):
+        return ('exclusion_terminal', x0)
+    def exclusion_nonterminal(self, x0):
+        return ('exclusion_nonterminal', x0)
+    def nonterminal_apply(self, x0, x1):
+        return ('nonterminal_apply', x0, x1)
+    def arg_expr(self, x0, x1):
+        return ('arg_expr', x0, x1)
+    def la_eq(self, x0):
+        return ('la_eq', x0)
+    def la_ne(self, x0):
+        return ('la_ne', x0)
+    def la_not_in_nonterminal(self, x0):
+        return ('la_not_in_nonterminal', x0)
+    def ifdef(self, x0, x1):
+        return ('ifdef', x0, x1)
+    def rhs_line(self, x0, x1, x2, x3):
+        return ('rhs_line', x0, x1, x2, x3)
+    def rhs_line(self, x0, x1, x2, x3):
+        return ('rhs_line', x0, x1, x2, x3)
+    def nt_def_one_of(self, x0, x1, x2, x3):
+        return ('nt_def_one_of', x0, x1, x2, x3)
+    def t_list_line(self, x0):
+        return ('t_list_line', x0)
+    def rust_nt_def(self, x0, x1):
+        return ('rust_nt_def', x0, x1)
+    def single(self, x0):
+        return ('single', x0)
+    def args_append(self, x0, x1):
+        return ('args_append', x0, x1)
+    def no_line_terminator_here(self, x0):
+        return ('no_line_terminator_here', x0)
+    def rhs_line(self, x0, x1, x2, x3):
+        return ('rhs_line', x0, x1, x2, x3)
+    def nt_def_one_of(self, x0, x1, x2, x3):
+        return ('nt_def_one_of', x0, x1, x2, x3)
+    def expr_call(self, x0, x1, x2):
+        return ('expr_call', x0, x1, x2)
+    def expr_some(self, x0):
+        return ('expr_some', x0)
+    def exclusion_chr_range(self, x0, x1):
+        return ('exclusion_chr_range', x0, x1)
+    def la_not_in_set(self, x0):
+        return ('la_not_in_set', x0)
+    def rust_param_impl(self, x0, x1, x2):
+        return ('rust_param_impl', x0, x1, x2)
+    def expr_call(self, x0, x1, x2):
+        return ('expr_call', x0, x1, x2)
+    def rust_edsl(self, x0, x1):
+        return ('rust_edsl', x0, x1)
+    def rhs_line(self, x0, x1, x2, x3):
+        return ('rhs_line', x0, x1, x2, x3)
+    def rust_rhs_line(self, x0):
+        return ('rust_rhs_line', x0)
+    def rhs_line(self, x0, x1, x2, x3):
+        return ('rhs_line', x0, x1, x2, x3)
+    def chr(self, x0):
+        return ('chr', x0)
+    def expr_call(self, x0, x1, x2):
+        return ('expr_call', x0, x1, x2)
+    def single(self, x0):
+        return ('single', x0)
+    def expr_call(self, x0, x1, x2):
+        return ('expr_call', x0, x1, x2)
+    def but_not_one_of(self, x0, x1):
+        return ('but_not_one_of', x0, x1)
+    def append(self, x0, x1):
+        return ('append', x0, x1)
+
+class Parser(runtime.Parser):
+    def __init__(self, goal, builder=None):
+        if builder is None:
+            builder = DefaultMethods()
+        super().__init__(actions, error_codes, goal_nt_to_init_state[goal], builder)
+
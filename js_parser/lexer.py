@@ -302,13 +302,6 @@ class JSLexer(jsparagus.lexer.FlatStringLexer):
     def take(self):
         return self._current_match.group(1)
 
-    def saw_line_terminator(self):
-        """True if there's a LineTerminator before the current token."""
-        i = self.previous_token_end
-        j = self.current_token_start
-        ws_between = self.src[i:j]
-        return any(c in ws_between for c in '\r\n\u2028\u2029')
-
     def can_close(self):
         match = TOKEN_RE.match(self.src)
         return match.group(1) == '' and self.parser.can_close()
@@ -4,12 +4,15 @@ from __future__ import annotations
 # mypy: no-implicit-optional
 
 import os
+import sys
 import collections
-from typing import Dict, Iterable, Optional, Tuple
+import functools
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
 
 from jsparagus import parse_pgen, gen, grammar, extension, types
 from jsparagus.lexer import LexicalGrammar
 from jsparagus.ordered import OrderedSet, OrderedFrozenSet
+from . import esgrammar_generated
 
 
 ESGrammarLexer = LexicalGrammar(
@@ -55,14 +58,11 @@ ESGrammarLexer = LexicalGrammar(
 )
 
 
-ESGrammarParser = gen.compile(
-    parse_pgen.load_grammar(
-        os.path.join(os.path.dirname(__file__), "esgrammar.pgen")))
-
-
 SIGIL_FALSE = '~'
 SIGIL_TRUE = '+'
 
+_is_concrete = grammar.is_concrete_element
+
 # Abbreviations for single-character terminals, used in the lexical grammar.
 ECMASCRIPT_CODE_POINTS = {
     # From <https://tc39.es/ecma262/#table-31>
@@ -88,6 +88,11 @@ ECMASCRIPT_CODE_POINTS = {
 
 
 class ESGrammarBuilder:
+    # The generated parser does not look methods up on the builder itself:
+    # parse_esgrammar binds them all once, in BoundMethods, and the parser
+    # calls those.
+    __slots__ = ['terminal_names', 'lexer', 'method_trait']
+
     def __init__(self, terminal_names):
         # Names of terminals that are written as nonterminals in the grammar.
         # For example, "BooleanLiteral" is a terminal name when parsing the
@@ -155,20 +160,21 @@ class ESGrammarBuilder:
 
     def to_production(self, lhs, i, rhs, is_sole_production):
         """Wrap a list of grammar symbols `rhs` in a Production object."""
+        assert isinstance(lhs, grammar.Nt)
+        return self._to_production(lhs.name, i, rhs, is_sole_production)
+
+    def _to_production(self, nt_name, i, rhs, is_sole_production):
         body, reducer, condition = rhs
         if reducer is None:
-            reducer = self.default_reducer(lhs, i, body, is_sole_production)
+            reducer = self.default_reducer(nt_name, i, body, is_sole_production)
         return grammar.Production(body, reducer, condition=condition)
 
-    def default_reducer(self, lhs, i, body, is_sole_production):
-        assert isinstance(lhs, grammar.Nt)
-        nt_name = lhs.name
-
-        nargs = sum(1 for e in body if grammar.is_concrete_element(e))
+    def default_reducer(self, nt_name, i, body, is_sole_production):
+        nargs = sum(map(_is_concrete, body))
         if is_sole_production:
             method_name = nt_name
         else:
-            method_name = '{} {}'.format(nt_name, i)
+            method_name = f'{nt_name} {i}'
         return self.expr_call(method_name, tuple(range(nargs)), None)
 
     def needs_asi(self, lhs, p):
@@ -233,13 +239,15 @@ class ESGrammarBuilder:
         return [out, reducer, condition]
 
     def nt_def(self, nt_type, lhs, eq, rhs_list):
+        assert isinstance(lhs, grammar.Nt)
+        nt_name = lhs.name
         has_sole_production = (len(rhs_list) == 1)
         production_list = []
         for i, rhs in enumerate(rhs_list):
             if eq == ':':
                 # Syntactic grammar. A hack is needed for ASI.
                 reducer_was_autogenerated = rhs[1] is None
-                p = self.to_production(lhs, i, rhs, has_sole_production)
+                p = self._to_production(nt_name, i, rhs, has_sole_production)
                 if self.needs_asi(lhs, p):
                     production_list += self.apply_asi(p, reducer_was_autogenerated)
                 else:
@@ -248,9 +256,9 @@ class ESGrammarBuilder:
                 # Lexical grammar. A hack is needed to replace multicharacter
                 # terminals like `!==` into sequences of character terminals.
                 rhs = self.expand_lexical_rhs(rhs)
-                p = self.to_production(lhs, i, rhs, has_sole_production)
+                p = self._to_production(nt_name, i, rhs, has_sole_production)
                 production_list.append(p)
-        return (lhs.name, eq, grammar.NtDef(lhs.args, production_list, nt_type))
+        return (nt_name, eq, grammar.NtDef(lhs.args, production_list, nt_type))
 
     def nt_def_one_of(self, nt_type, nt_lhs, eq, terminals):
         return self.nt_def(nt_type, nt_lhs, eq, [([t], None, None) for t in terminals])
@@ -274,9 +282,11 @@ class ESGrammarBuilder:
         return terminals
 
     def terminal(self, t):
-        assert t[0] == "`"
-        assert t[-1] == "`"
-        return t[1:-1]
+        # The T token pattern guarantees that `t` is wrapped in backticks.
+        #
+        # Interned, because the same few terminals occur over and over in a
+        # grammar and are used as set and dict keys throughout the generator.
+        return sys.intern(t[1:-1])
 
     def terminal_chr(self, chr):
         raise ValueError("FAILED: %r" % chr)
@@ -291,7 +301,7 @@ class ESGrammarBuilder:
         return []
 
     def expr_match_ref(self, token):
-        assert token.startswith('$')
+        # The MATCH_REF token pattern guarantees a leading `$`.
         return int(token[1:])
 
     def expr_call(self, method, args, fallible):
@@ -317,11 +327,11 @@ class ESGrammarBuilder:
 
     def but_not(self, nt, exclusion):
         _, exclusion = exclusion
-        return grammar.Exclude(nt, [exclusion])
+        return grammar.Exclude(nt, (exclusion,))
         # return ('-', nt, exclusion)
 
     def but_not_one_of(self, nt, exclusion_list):
-        exclusion_list = [exclusion for _, exclusion in exclusion_list]
+        exclusion_list = tuple(exclusion for _, exclusion in exclusion_list)
         return grammar.Exclude(nt, exclusion_list)
         # return ('-', nt, exclusion_list)
 
@@ -338,9 +348,20 @@ class ESGrammarBuilder:
     def nonterminal_apply(self, name, args):
         if name in self.terminal_names:
             raise ValueError("parameters applied to terminal {!r}".format(name))
-        if len(set(k for k, expr in args)) != len(args):
-            raise ValueError("parameter passed multiple times")
-        return grammar.Nt(name, tuple(args))
+        seen = set()
+        for k, _ in args:
+            if k in seen:
+                raise ValueError("parameter passed multiple times")
+            seen.add(k)
+        return grammar.Nt(name, args)
+
+    # Argument lists are built as tuples, so that nonterminal_apply can use
+    # them as-is. They are short, so appending by concatenation is cheap.
+    def args_single(self, arg):
+        return (arg,)
+
+    def args_append(self, args, arg):
+        return args + (arg,)
 
     def arg_expr(self, sigil, argname):
         if sigil == '?':
@@ -381,26 +402,52 @@ class ESGrammarBuilder:
                          .format(lookahead_exclusions))
 
     def chr(self, t):
-        assert t[0] == "<" or t[0] == 'U'
+        # The CHR token pattern guarantees that `t` is either `<NAME>` or
+        # `U+XXXX`.
         if t[0] == "<":
-            assert t[-1] == ">"
             if t not in ECMASCRIPT_CODE_POINTS:
                 raise ValueError("unrecognized character abbreviation {!r}".format(t))
             return ECMASCRIPT_CODE_POINTS[t]
         else:
-            assert t[1] == "+"
             return grammar.Literal(chr(int(t[2:], base=16)))
 
 
+class BoundMethods:
+    """The methods of an ESGrammarBuilder, bound once up front.
+
+    The generated parser calls `parser.methods.<name>(...)` for every
+    reduction. Looking the name up here finds it in the instance __dict__,
+    instead of searching the builder's class and making a new bound method
+    each time.
+    """
+
+    def __init__(self, builder):
+        for name in _BUILDER_METHOD_NAMES:
+            setattr(self, name, getattr(builder, name))
+
+
+_BUILDER_METHOD_NAMES = [
+    name
+    for name in dir(ESGrammarBuilder)
+    if not name.startswith('_') and callable(getattr(ESGrammarBuilder, name))
+]
+
+
 def finish_grammar(nt_defs, goals, variable_terminals, synthetic_terminals,
                    single_grammar=True, extensions=[]):
+    # Walk nt_defs once, sorting the definitions by grammar (":" or "::") as
+    # they arrive, so nt_defs may be any iterable.
     nt_grammars = {}
-    for nt_name, eq, _ in nt_defs:
+    all_nonterminals = {}
+    nonterminals_by_grammar = collections.defaultdict(dict)
+    for nt_name, eq, rhs_list_or_lambda in nt_defs:
         if nt_name in nt_grammars:
             raise ValueError(
                 "duplicate definitions for nonterminal {!r}"
                 .format(nt_name))
         nt_grammars[nt_name] = eq
+        all_nonterminals[nt_name] = rhs_list_or_lambda
+        nonterminals_by_grammar[eq][nt_name] = rhs_list_or_lambda
 
     # Figure out which grammar we were trying to get (":" for syntactic,
     # "::" for lexical) based on the goal symbols.
@@ -416,43 +463,16 @@ def finish_grammar(nt_defs, goals, variable_terminals, synthetic_terminals,
                 "got {!r} (matching these grammars: {!r})"
                 .format(set(goals), set(selected_grammars)))
         [selected_grammar] = selected_grammars
+        nonterminals = nonterminals_by_grammar[selected_grammar]
+    else:
+        nonterminals = all_nonterminals
 
-    terminal_set = set()
-
-    def hack_production(p):
-        for i, e in enumerate(p.body):
-            if isinstance(e, str) and e[:1] == "`":
-                if len(e) < 3 or e[-1:] != "`":
-                    raise ValueError(
-                        "Unrecognized grammar symbol: {!r} (in {!r})"
-                        .format(e, p))
-                p[i] = token = e[1:-1]
-                terminal_set.add(token)
-
-    nonterminals = {}
-    for nt_name, eq, rhs_list_or_lambda in nt_defs:
-        if single_grammar and eq != selected_grammar:
-            continue
-
-        if isinstance(rhs_list_or_lambda, grammar.NtDef):
-            nonterminals[nt_name] = rhs_list_or_lambda
-        else:
-            rhs_list = rhs_list_or_lambda
-            for p in rhs_list:
+    for rhs_list_or_lambda in nonterminals.values():
+        if not isinstance(rhs_list_or_lambda, grammar.NtDef):
+            for p in rhs_list_or_lambda:
                 if not isinstance(p, grammar.Production):
                     raise ValueError(
                         "invalid grammar: ifdef in non-function-call context")
-                hack_production(p)
-            if nt_name in nonterminals:
-                raise ValueError(
-                    "unsupported: multiple definitions for nt " + nt_name)
-            nonterminals[nt_name] = rhs_list
-
-    for t in terminal_set:
-        if t in nonterminals:
-            raise ValueError(
-                "grammar contains both a terminal `{}` and nonterminal {}"
-                .format(t, t))
 
     # Add execution modes to generate the various functions needed to handle
     # syntax parsing and full parsing execution modes.
@@ -507,24 +527,60 @@ def parse_esgrammar(
         synthetic_terminals: Optional[Dict[str, OrderedSet[str]]] = None,
         single_grammar: bool = True
 ) -> grammar.Grammar:
+    terminal_names = frozenset(terminal_names)
+    nt_defs, grammar_extensions = _parse_esgrammar_text(
+        text, filename, tuple(extensions), terminal_names)
+
+    if synthetic_terminals is None:
+        synthetic_terminals = {}
+
+    if goals is None:
+        # Default to the first nonterminal in the input.
+        goals = [nt_defs[0][0]]
+
+    return finish_grammar(
+        nt_defs,
+        goals=goals,
+        variable_terminals=terminal_names - frozenset(synthetic_terminals),
+        synthetic_terminals=synthetic_terminals,
+        single_grammar=single_grammar,
+        extensions=list(grammar_extensions))
+
+
+# Parsing the text is the slow part, and the same grammar is often loaded
+# several times in a process (by the tests and the build), so the parse is
+# cached. Only the parse: finish_grammar() builds a new Grammar on each call,
+# which copies the nonterminal definitions, so callers are free to modify the
+# Grammar they get. The key is the text itself rather than the file's mtime, as
+# callers pass the text in and it need not match what is on disk.
+@functools.lru_cache(maxsize=16)
+def _parse_esgrammar_text(
+        text: str,
+        filename: Optional[str],
+        extensions: Tuple[Tuple[os.PathLike, int, str], ...],
+        terminal_names: FrozenSet[str]
+) -> Tuple[Tuple, Tuple]:
     if not text.endswith("\n\n"):
         # Horrible hack: add a blank line at the end of the document so that
         # the esgrammar grammar can use newlines as delimiters. :-P
         text += "\n"
 
-    terminal_names = frozenset(terminal_names)
-    if synthetic_terminals is None:
-        synthetic_terminals = {}
-
+    # The parser for esgrammar.pgen is generated ahead of time, like
+    # jsparagus/parse_pgen_generated.py. After changing esgrammar.pgen, run
+    # `python -m js_parser.parse_esgrammar --regenerate` (or update.sh). It is
+    # only looked up here, so that --regenerate works even when the generated
+    # module is empty or stale.
+    Parser = esgrammar_generated.Parser  # type: ignore[attr-defined]
     builder = ESGrammarBuilder(terminal_names)
-    parser = ESGrammarParser(builder=builder, goal="grammar")
+    methods = BoundMethods(builder)
+    parser = Parser(builder=methods, goal="grammar")
     lexer = ESGrammarLexer(parser, filename=filename)
     lexer.write(text)
     nt_defs = lexer.close()
     grammar_extensions = []
     for ext_filename, start_lineno, content in extensions:
         builder.reset()
-        parser = ESGrammarParser(builder=builder, goal="rust_edsl")
+        parser = Parser(builder=methods, goal="rust_edsl")
         lexer = ESGrammarLexer(parser, filename=ext_filename)
         builder.lexer = lexer
         lexer.start_lineno = start_lineno
@@ -532,14 +588,17 @@ def parse_esgrammar(
         result = lexer.close()
         grammar_extensions.append(result)
 
-    if goals is None:
-        # Default to the first nonterminal in the input.
-        goals = [nt_defs[0][0]]
+    return tuple(nt_defs), tuple(grammar_extensions)
 
-    return finish_grammar(
-        nt_defs,
-        goals=goals,
-        variable_terminals=terminal_names - frozenset(synthetic_terminals),
-        synthetic_terminals=synthetic_terminals,
-        single_grammar=single_grammar,
-        extensions=grammar_extensions)
+
+def regenerate():
+    filename = os.path.join(os.path.dirname(__file__), "esgrammar.pgen")
+    gen.generate_parser(sys.stdout, parse_pgen.load_grammar(filename))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--regenerate']:
+        regenerate()
+    else:
+        print("usage: python -m js_parser.parse_esgrammar --regenerate")
+        sys.exit(1)
@@ -0,0 +1,10855 @@
+# type: ignore
+
+from jsparagus import runtime
+from jsparagus.runtime import (Nt, InitNt, End, ErrorToken, StateTermValue,
+                               ShiftError, ShiftAccept)
+
+def state_644_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt(InitNt(goal=Nt('Script'))), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_645_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.script(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Script'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_646_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.statement_list_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('StatementList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_647_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('StatementListItem'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_648_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('Statement'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_649_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.block_statement(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BlockStatement'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_650_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.empty_statement(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('EmptyStatement'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_651_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('BreakableStatement'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_652_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.label_identifier(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LabelIdentifier'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_653_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('Identifier'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_654_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('Declaration'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_655_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('HoistableDeclaration', (('Default', False),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_656_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.const_kind(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LetOrConst'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_657_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt(InitNt(goal=Nt('Module'))), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_658_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.module(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Module'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_659_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.module_item_list_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ModuleItemList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_660_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('ModuleItem'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_661_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.statement_list_append(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('StatementList'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_662_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.block(parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Block'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_663_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration_list_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('VariableDeclarationList', (('In', True),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_664_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingIdentifier'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_665_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier_yield(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingIdentifier'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_666_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier_await(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingIdentifier'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_667_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('BindingPattern'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_668_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('Expression', (('In', True),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_669_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('AssignmentExpression', (('In', True),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_670_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('MultiplicativeExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_671_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('ExponentiationExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_672_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('LeftHandSideExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_673_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('MemberExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_674_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.this_expr(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PrimaryExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_675_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.identifier_expr(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PrimaryExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_676_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('PrimaryExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_677_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.null_literal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Literal'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_678_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.boolean_literal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Literal'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_679_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.numeric_literal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Literal'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_680_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.bigint_literal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Literal'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_681_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.string_literal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Literal'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_682_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.regexp_literal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PrimaryExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_683_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.untagged_template_expr(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PrimaryExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_684_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.template_literal(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('TemplateLiteral'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_685_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('TemplateLiteral'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_686_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('MetaProperty'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_687_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('CallExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_688_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('UnaryExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_689_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arrow_parameters_bare(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrowParameters'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_690_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.continue_statement(parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('ContinueStatement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_691_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.break_statement(parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('BreakStatement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_692_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.return_statement(parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('ReturnStatement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_693_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.debugger_statement(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('DebuggerStatement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_694_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration_list_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingList', (('In', True),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_695_actions(parser, lexer):
+
+    value = None
+    raise ShiftAccept()
+    replay = [StateTermValue(0, Nt(InitNt(goal=Nt('Script'))), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_696_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.module_item_list_append(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ModuleItemList'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_697_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('ImportedDefaultBinding'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_698_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('ImportedBinding'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_699_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_clause(None, parser.stack[-1].value, None)
+    replay = [StateTermValue(0, Nt('ImportClause'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_700_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_clause(None, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ImportClause'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_701_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.module_specifier(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ModuleSpecifier'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_702_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_vars(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ExportDeclaration'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_703_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_declaration(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ExportDeclaration'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_704_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.let_kind(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LetOrConst'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_705_actions(parser, lexer):
+
+    value = None
+    raise ShiftAccept()
+    replay = [StateTermValue(0, Nt(InitNt(goal=Nt('Module'))), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_706_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.block(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Block'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_707_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_statement(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('VariableStatement'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_708_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.variable_declaration(value_0, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('VariableDeclaration', (('In', True),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_709_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('VariableDeclaration', (('In', True),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_710_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.binding_property_list_empty()
+    value = parser.methods.object_binding_pattern(parser.stack[-2].value, value_1, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ObjectBindingPattern'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_711_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_property_list_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingPropertyList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_712_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_property_shorthand(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingProperty'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_713_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('PropertyName'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_714_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_name_identifier(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LiteralPropertyName'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_715_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('IdentifierName'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_716_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_name_string(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LiteralPropertyName'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_717_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_name_numeric(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LiteralPropertyName'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_718_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_name_bigint(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LiteralPropertyName'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_719_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.binding_element_list_empty()
+    value = parser.methods.array_binding_pattern(parser.stack[-2].value, value_1, None, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayBindingPattern'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_720_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.elision_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Elision'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_721_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('BindingElementList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_722_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_elision_element(None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingElisionElement'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_723_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('BindingElement'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_724_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.expression_statement(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ExpressionStatement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_725_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.mul_op(parser.stack[-1].value)
+    value = parser.methods.box_op(value_0)
+    replay = [StateTermValue(0, Nt('MultiplicativeOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_726_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.div_op(parser.stack[-1].value)
+    value = parser.methods.box_op(value_0)
+    replay = [StateTermValue(0, Nt('MultiplicativeOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_727_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.mod_op(parser.stack[-1].value)
+    value = parser.methods.box_op(value_0)
+    replay = [StateTermValue(0, Nt('MultiplicativeOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_728_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.mul_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_729_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.div_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_730_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.mod_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_731_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.add_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_732_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.sub_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_733_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.left_shift_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_734_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.right_shift_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_735_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.right_shift_ext_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_736_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.bitwise_and_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_737_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.bitwise_xor_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_738_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.bitwise_or_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_739_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.pow_assign_op(parser.stack[-1].value)
+    value = parser.methods.box_assign_op(value_0)
+    replay = [StateTermValue(0, Nt('AssignmentOperator'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_740_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.tagged_template_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('MemberExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_741_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.call_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CoverCallExpressionAndAsyncArrowHead'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_742_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_literal_empty(parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayLiteral'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_743_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.element_list_first(None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ElementList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_744_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.element_list_first_spread(None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ElementList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_745_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.object_literal_empty(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ObjectLiteral'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_746_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_definition_list_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PropertyDefinitionList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_747_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.identifier_reference(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IdentifierReference'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_748_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('PropertyDefinition'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_749_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_definition_method(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PropertyDefinition'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_750_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('MethodDefinition'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_751_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_expression(parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_752_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.empty_parameter_list()
+    value = parser.methods.cover_arrow_parameter_list(parser.stack[-2].value, value_1, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CoverParenthesizedExpressionAndArrowParameterList'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_753_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.super_call(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('SuperCall'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_754_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.uncover_parenthesized_expression(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PrimaryExpression'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_755_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.new_expr_without_arguments(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('NewExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_756_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.call_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CallExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_757_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.tagged_template_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CallExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_758_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.pre_decrement_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UpdateExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_759_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.delete_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UnaryExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_760_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.void_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UnaryExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_761_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.typeof_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UnaryExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_762_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.unary_plus_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UnaryExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_763_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.unary_minus_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UnaryExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_764_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.bitwise_not_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UnaryExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_765_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.logical_not_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UnaryExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_766_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.await_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AwaitExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_767_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.labelled_statement(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LabelledStatement'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_768_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('LabelledItem'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_769_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.try_statement(parser.stack[-3].value, parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('TryStatement'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_770_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_declaration(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassDeclaration', (('Default', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_771_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.lexical_declaration(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('LexicalDeclaration', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_772_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.variable_declaration(value_0, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LexicalBinding', (('In', True),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_773_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LexicalBinding', (('In', True),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_774_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.imports_list_empty()
+    replay = [StateTermValue(0, Nt('NamedImports'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_775_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.imports_list_empty()
+    value = parser.methods.imports_list_append(value_0, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ImportsList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_776_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_specifier(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ImportSpecifier'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_777_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_declaration(None, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ImportDeclaration'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_778_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_set(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ExportDeclaration'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_779_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.exports_list_empty()
+    replay = [StateTermValue(0, Nt('ExportClause'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_780_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.exports_list_empty()
+    value = parser.methods.exports_list_append(value_0, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ExportsList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_781_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_default_hoistable(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ExportDeclaration'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_782_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('HoistableDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_783_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_default_class(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ExportDeclaration'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_784_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('VariableDeclarationList', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_785_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('Initializer', (('In', True),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_786_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.binding_property_list_empty()
+    value = parser.methods.object_binding_pattern(parser.stack[-3].value, value_1, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ObjectBindingPattern'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_787_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('BindingRestProperty'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_788_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.object_binding_pattern(parser.stack[-3].value, parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ObjectBindingPattern'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_789_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single_name_binding(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('SingleNameBinding'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_790_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.binding_element_list_empty()
+    value = parser.methods.array_binding_pattern(parser.stack[-3].value, value_1, parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayBindingPattern'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_791_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.elision_append(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Elision'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_792_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_elision_element(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingElisionElement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_793_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.binding_element_list_empty()
+    value = parser.methods.array_binding_pattern(parser.stack[-3].value, value_1, None, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayBindingPattern'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_794_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier_to_binding(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingRestElement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_795_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('BindingRestElement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_796_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_binding_pattern(parser.stack[-3].value, parser.stack[-2].value, None, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayBindingPattern'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_797_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_element_pattern(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingElement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_798_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.comma_op(parser.stack[-2].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Expression', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_799_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.multiplicative_expr(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('MultiplicativeExpression'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_800_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.pow_op(parser.stack[-2].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ExponentiationExpression'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_801_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.post_increment_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UpdateExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_802_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.post_decrement_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UpdateExpression'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_803_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.assignment_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AssignmentExpression', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_804_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.compound_assignment_expr(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AssignmentExpression', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_805_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.static_member_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('MemberExpression'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_806_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.private_field_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('MemberExpression'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_807_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arguments_empty(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Arguments'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_808_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arguments_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArgumentList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_809_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.optional_call_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('OptionalChain'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_810_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.error_optional_chain_with_template()
+    replay = [StateTermValue(0, Nt('OptionalChain'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_811_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.optional_static_member_expr_tail(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('OptionalChain'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_812_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.optional_call_expr_tail(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('OptionalChain'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_813_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('AsyncArrowBindingIdentifier'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_814_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_literal_empty(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayLiteral'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_815_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.element_list_first(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ElementList'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_816_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.element_list_first_spread(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ElementList'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_817_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_literal(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayLiteral'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_818_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.spread_element(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('SpreadElement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_819_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.object_literal(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ObjectLiteral'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_820_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.cover_initialized_name(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CoverInitializedName'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_821_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_definition_spread(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PropertyDefinition'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_822_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.empty_formal_parameters()
+    value = parser.methods.with_rest_parameter(value_0, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('FormalParameters'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_823_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('FunctionRestParameter'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_824_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.formal_parameter_list_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('FormalParameterList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_825_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('FormalParameter'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_826_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_tail(None, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassTail'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_827_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('ClassElementList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_828_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_element(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassElement'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_829_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_element_name_private(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassElementName'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_830_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_element_empty()
+    replay = [StateTermValue(0, Nt('ClassElement'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_831_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('ClassHeritage'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_832_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_expression(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassExpression'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_833_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.substitution_template(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('SubstitutionTemplate'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_834_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.template_spans(None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('TemplateSpans'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_835_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.cover_parenthesized_expression(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CoverParenthesizedExpressionAndArrowParameterList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_836_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.super_property_static(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('SuperProperty'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_837_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.new_target_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('NewTarget'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_838_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.new_expr_with_arguments(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('MemberExpression'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_839_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.static_member_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CallExpression'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_840_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.private_field_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CallExpression'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_841_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.yield_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('YieldExpression', (('In', True),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_842_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('Expression', (('In', False),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_843_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('AssignmentExpression', (('In', False),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_844_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration_list_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('VariableDeclarationList', (('In', False),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_845_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration_list_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingList', (('In', False),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_846_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.for_declaration(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ForDeclaration'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_847_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.continue_statement(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ContinueStatement'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_848_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.break_statement(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BreakStatement'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_849_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.return_statement(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ReturnStatement'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_850_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.throw_statement(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ThrowStatement'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_851_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.try_statement(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('TryStatement'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_852_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.catch_no_param(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Catch'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_853_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('Finally'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_854_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingList', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_855_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_declaration(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ImportDeclaration'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_856_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('FromClause'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_857_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_clause(parser.stack[-3].value, parser.stack[-1].value, None)
+    replay = [StateTermValue(0, Nt('ImportClause'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_858_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_clause(parser.stack[-3].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ImportClause'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_859_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.name_space_import(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('NameSpaceImport'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_860_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('NamedImports'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_861_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_all_from(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ExportDeclaration'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_862_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_set_from(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ExportDeclaration'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_863_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('ExportClause'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_864_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_declaration(parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_865_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_property_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingPropertyList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_866_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.object_binding_pattern(parser.stack[-4].value, parser.stack[-3].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ObjectBindingPattern'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_867_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_property(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingProperty'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_868_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.computed_property_name(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ComputedPropertyName'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_869_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.binding_element_list_empty()
+    value = parser.methods.array_binding_pattern(parser.stack[-4].value, value_1, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayBindingPattern'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_870_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_element_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingElementList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_871_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_binding_pattern(parser.stack[-4].value, parser.stack[-3].value, None, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayBindingPattern'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_872_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.computed_member_expr(parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('MemberExpression'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_873_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arguments(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Arguments'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_874_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arguments_spread_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArgumentList'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_875_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.optional_static_member_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('OptionalChain'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_876_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.element_list_append(parser.stack[-3].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ElementList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_877_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.element_list_append_spread(parser.stack[-3].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ElementList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_878_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_literal_with_trailing_elision(parser.stack[-4].value, parser.stack[-3].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayLiteral'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_879_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_definition_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PropertyDefinitionList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_880_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.object_literal(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ObjectLiteral'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_881_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_definition(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('PropertyDefinition'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_882_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.unique_formal_parameters(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('UniqueFormalParameters'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_883_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_tail(None, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassTail'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_884_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_element_list_append(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassElementList'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_885_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_element_static(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassElement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_886_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_element_to_vec(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ClassElement'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_887_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_field_definition(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('FieldDefinition'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_888_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_tail(parser.stack[-3].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassTail'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_889_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.template_spans(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('TemplateSpans'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_890_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.expression_to_parameter_list(parser.stack[-3].value)
+    value = parser.methods.cover_arrow_parameter_list(parser.stack[-4].value, value_1, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CoverParenthesizedExpressionAndArrowParameterList'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_891_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.empty_parameter_list()
+    value_2 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.cover_arrow_parameter_list(parser.stack[-4].value, value_1, value_2, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CoverParenthesizedExpressionAndArrowParameterList'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_892_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.empty_parameter_list()
+    value = parser.methods.cover_arrow_parameter_list(parser.stack[-4].value, value_1, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CoverParenthesizedExpressionAndArrowParameterList'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_893_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.super_property_computed(parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('SuperProperty'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_894_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.computed_member_expr(parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CallExpression'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_895_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.async_arrow_function(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncArrowFunction', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_896_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_call(parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ImportCall'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_897_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.yield_star_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('YieldExpression', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_898_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arrow_function(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrowFunction', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_899_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.while_statement(parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_900_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('VariableDeclaration', (('In', False),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_901_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.for_lexical_declaration(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ForLexicalDeclaration', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_902_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.variable_declaration(value_0, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LexicalBinding', (('In', False),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_903_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('LexicalBinding', (('In', False),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_904_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier_to_binding(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ForBinding'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_905_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('ForBinding'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_906_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.switch_statement(parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('SwitchStatement'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_907_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.with_statement(parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('WithStatement'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_908_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier_to_binding(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CatchParameter'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_909_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('CatchParameter'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_910_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.imports_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ImportsList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_911_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-3].value
+    replay = [StateTermValue(0, Nt('NamedImports'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_912_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_specifier_renaming(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ImportSpecifier'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_913_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.exports_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ExportsList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_914_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-3].value
+    replay = [StateTermValue(0, Nt('ExportClause'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_915_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_specifier_renaming(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ExportSpecifier'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_916_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_declaration(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_917_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_default_value(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ExportDeclaration'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_918_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.object_binding_pattern(parser.stack[-5].value, parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ObjectBindingPattern'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_919_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_binding_pattern(parser.stack[-5].value, parser.stack[-4].value, parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayBindingPattern'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_920_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_binding_pattern(parser.stack[-5].value, parser.stack[-4].value, None, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayBindingPattern'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_921_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.conditional_expr(parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ConditionalExpression', (('In', True),)), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_922_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arguments_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArgumentList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_923_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arguments(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Arguments'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_924_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.optional_computed_member_expr(parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('OptionalChain'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_925_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.optional_computed_member_expr_tail(parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('OptionalChain'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_926_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.element_list_append(parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ElementList'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_927_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.element_list_append_spread(parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ElementList'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_928_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_literal_with_trailing_elision(parser.stack[-5].value, parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayLiteral'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_929_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('PropertySetParameterList'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_930_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.formal_parameter_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('FormalParameterList'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_931_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.with_rest_parameter(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('FormalParameters'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_932_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_element_static_field(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ClassElement'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_933_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_tail(parser.stack[-4].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ClassTail'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_934_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concise_body_expression(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncConciseBody', (('In', True),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_935_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('AsyncFunctionBody'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_936_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.function_body(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('FunctionBody'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_937_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concise_body_expression(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ConciseBody', (('In', True),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_938_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.comma_op(parser.stack[-2].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Expression', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_939_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.assignment_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AssignmentExpression', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_940_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.compound_assignment_expr(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AssignmentExpression', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_941_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.yield_expr(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('YieldExpression', (('In', False),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_942_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('VariableDeclarationList', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_943_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('Initializer', (('In', False),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_944_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.unbox_for_lexical_declaration(parser.stack[-4].value)
+    value = parser.methods.for_statement_lexical(parser.stack[-6].value, value_1, None, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-6:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_945_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.variable_declaration_list_append(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('BindingList', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_946_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_block(parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CaseBlock'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_947_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_clauses_single(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CaseClauses'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_948_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.array_binding_pattern(parser.stack[-6].value, parser.stack[-5].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrayBindingPattern'), value, False)]
+    del parser.stack[-6:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_949_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arguments_append_spread(parser.stack[-4].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArgumentList'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_950_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.async_arrow_function_bare(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncArrowFunction', (('In', True),)), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_951_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.expression_to_parameter_list(parser.stack[-5].value)
+    value_2 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.cover_arrow_parameter_list(parser.stack[-6].value, value_1, value_2, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CoverParenthesizedExpressionAndArrowParameterList'), value, False)]
+    del parser.stack[-6:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_952_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.expression_to_parameter_list(parser.stack[-5].value)
+    value = parser.methods.cover_arrow_parameter_list(parser.stack[-6].value, value_1, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CoverParenthesizedExpressionAndArrowParameterList'), value, False)]
+    del parser.stack[-6:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_953_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concise_body_block(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncConciseBody', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_954_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concise_body_block(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ConciseBody', (('In', True),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_955_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.if_statement(parser.stack[-7].value, parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IfStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_956_actions(parser, lexer):
+
+    value = None
+    value_3 = parser.methods.make_block_stmt_from_function_decl(parser.stack[-1].value)
+    value = parser.methods.if_statement(parser.stack[-7].value, parser.stack[-5].value, parser.stack[-3].value, value_3)
+    replay = [StateTermValue(0, Nt('IfStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_957_actions(parser, lexer):
+
+    value = None
+    value_2 = parser.methods.make_block_stmt_from_function_decl(parser.stack[-3].value)
+    value = parser.methods.if_statement(parser.stack[-7].value, parser.stack[-5].value, value_2, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IfStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_958_actions(parser, lexer):
+
+    value = None
+    value_2 = parser.methods.make_block_stmt_from_function_decl(parser.stack[-3].value)
+    value_3 = parser.methods.make_block_stmt_from_function_decl(parser.stack[-1].value)
+    value = parser.methods.if_statement(parser.stack[-7].value, parser.stack[-5].value, value_2, value_3)
+    replay = [StateTermValue(0, Nt('IfStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_959_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.do_while_statement(parser.stack[-7].value, parser.stack[-6].value, parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_960_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_expression(None)
+    value = parser.methods.for_statement(parser.stack[-6].value, value_1, None, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-6:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_961_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.async_arrow_function(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncArrowFunction', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_962_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.yield_star_expr(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('YieldExpression', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_963_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.arrow_function(parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ArrowFunction', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_964_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.variable_declaration(value_0, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('VariableDeclaration', (('In', False),)), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_965_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.unbox_for_lexical_declaration(parser.stack[-5].value)
+    value = parser.methods.for_statement_lexical(parser.stack[-7].value, value_1, None, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_966_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.unbox_for_lexical_declaration(parser.stack[-5].value)
+    value = parser.methods.for_statement_lexical(parser.stack[-7].value, value_1, parser.stack[-4].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_967_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.unbox_for_declaration(parser.stack[-5].value)
+    value = parser.methods.for_in_statement_lexical(parser.stack[-7].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_968_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.unbox_for_declaration(parser.stack[-5].value)
+    value = parser.methods.for_of_statement_lexical(parser.stack[-7].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_969_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_block(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CaseBlock'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_970_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_clauses_append(parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CaseClauses'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_971_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_block_with_default(parser.stack[-3].value, None, parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CaseBlock'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_972_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.catch(parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('Catch'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_973_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.function(parser.stack[-7].value, None, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_expr(value_0)
+    replay = [StateTermValue(0, Nt('FunctionExpression'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_974_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('GeneratorBody'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_975_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_expression(None)
+    value = parser.methods.for_statement(parser.stack[-7].value, value_1, None, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_976_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_expression(None)
+    value = parser.methods.for_statement(parser.stack[-7].value, value_1, parser.stack[-4].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_977_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_expression(parser.stack[-5].value)
+    value = parser.methods.for_statement(parser.stack[-7].value, value_1, None, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_978_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.conditional_expr(parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ConditionalExpression', (('In', False),)), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_979_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_assignment_target(parser.stack[-5].value)
+    value = parser.methods.for_in_statement(parser.stack[-7].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_980_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concise_body_expression(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncConciseBody', (('In', False),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_981_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concise_body_expression(parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ConciseBody', (('In', False),)), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_982_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_var_declaration(parser.stack[-6].value, parser.stack[-5].value)
+    value = parser.methods.for_statement(parser.stack[-8].value, value_1, None, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_983_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_in_or_of_var_declaration(parser.stack[-6].value, parser.stack[-5].value, None)
+    value = parser.methods.for_in_statement(parser.stack[-8].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_984_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_in_or_of_var_declaration(parser.stack[-6].value, parser.stack[-5].value, None)
+    value = parser.methods.for_of_statement(parser.stack[-8].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_985_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.unbox_for_lexical_declaration(parser.stack[-6].value)
+    value = parser.methods.for_statement_lexical(parser.stack[-8].value, value_1, parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_986_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_assignment_target(parser.stack[-5].value)
+    value = parser.methods.for_of_statement(parser.stack[-7].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_987_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.unbox_for_declaration(parser.stack[-5].value)
+    value = parser.methods.for_await_of_statement_lexical(parser.stack[-8].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_988_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_block_with_default(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CaseBlock'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_989_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_block_with_default(parser.stack[-4].value, None, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CaseBlock'), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_990_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.catch_block(parser.stack[-2].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CatchBlock'), value, False)]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_991_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.function(parser.stack[-8].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('FunctionDeclaration', (('Default', False),)), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_992_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.getter(parser.stack[-7].value, parser.stack[-6].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('MethodDefinition'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_993_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.method_definition(parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('MethodDefinition'), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_994_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.function(parser.stack[-8].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_expr(value_0)
+    replay = [StateTermValue(0, Nt('FunctionExpression'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_995_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.generator(parser.stack[-8].value, None, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_expr(value_0)
+    replay = [StateTermValue(0, Nt('GeneratorExpression'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_996_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_expression(None)
+    value = parser.methods.for_statement(parser.stack[-8].value, value_1, parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_997_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_expression(parser.stack[-6].value)
+    value = parser.methods.for_statement(parser.stack[-8].value, value_1, None, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_998_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_expression(parser.stack[-6].value)
+    value = parser.methods.for_statement(parser.stack[-8].value, value_1, parser.stack[-4].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_999_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.async_arrow_function_bare(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncArrowFunction', (('In', False),)), value, False)]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1000_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concise_body_block(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncConciseBody', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1001_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.concise_body_block(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('ConciseBody', (('In', False),)), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1002_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_var_declaration(parser.stack[-7].value, parser.stack[-6].value)
+    value = parser.methods.for_statement(parser.stack[-9].value, value_1, None, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1003_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_var_declaration(parser.stack[-7].value, parser.stack[-6].value)
+    value = parser.methods.for_statement(parser.stack[-9].value, value_1, parser.stack[-4].value, None, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1004_actions(parser, lexer):
+
+    value = None
+    value_1_1 = parser.methods.binding_identifier_to_binding(parser.stack[-6].value)
+    value_1 = parser.methods.for_in_or_of_var_declaration(parser.stack[-7].value, value_1_1, parser.stack[-5].value)
+    value = parser.methods.for_in_statement(parser.stack[-9].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1005_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_assignment_target(parser.stack[-5].value)
+    value = parser.methods.for_await_of_statement(parser.stack[-8].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1006_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_in_or_of_var_declaration(parser.stack[-6].value, parser.stack[-5].value, None)
+    value = parser.methods.for_await_of_statement(parser.stack[-9].value, value_1, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1007_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_block_with_default(parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CaseBlock'), value, False)]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1008_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.catch_block(parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('CatchBlock'), value, False)]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1009_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.generator(parser.stack[-9].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('GeneratorDeclaration', (('Default', False),)), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1010_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.function(parser.stack[-7].value, None, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('FunctionDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-7:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1011_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_function(parser.stack[-8].value, None, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_expr(value_0)
+    replay = [StateTermValue(0, Nt('AsyncFunctionExpression'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1012_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-1].value
+    replay = [StateTermValue(0, Nt('AsyncGeneratorBody'), value, False)]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1013_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.setter(parser.stack[-8].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('MethodDefinition'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1014_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.generator_method(parser.stack[-8].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('GeneratorMethod'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1015_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.generator(parser.stack[-9].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_expr(value_0)
+    replay = [StateTermValue(0, Nt('GeneratorExpression'), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1016_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_expression(parser.stack[-7].value)
+    value = parser.methods.for_statement(parser.stack[-9].value, value_1, parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1017_actions(parser, lexer):
+
+    value = None
+    value_1 = parser.methods.for_var_declaration(parser.stack[-8].value, parser.stack[-7].value)
+    value = parser.methods.for_statement(parser.stack[-10].value, value_1, parser.stack[-5].value, parser.stack[-3].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('IterationStatement'), value, False)]
+    del parser.stack[-10:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1018_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_function(parser.stack[-9].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('AsyncFunctionDeclaration', (('Default', False),)), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1019_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.function(parser.stack[-8].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('FunctionDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1020_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.generator(parser.stack[-8].value, None, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('GeneratorDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1021_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_function(parser.stack[-9].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_expr(value_0)
+    replay = [StateTermValue(0, Nt('AsyncFunctionExpression'), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1022_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_function(parser.stack[-9].value, None, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_expr(value_0)
+    replay = [StateTermValue(0, Nt('AsyncGeneratorExpression'), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1023_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.async_method(parser.stack[-8].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncMethod'), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1024_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_generator(parser.stack[-10].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('AsyncGeneratorDeclaration', (('Default', False),)), value, False)]
+    del parser.stack[-10:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1025_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.generator(parser.stack[-9].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('GeneratorDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1026_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_function(parser.stack[-8].value, None, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('AsyncFunctionDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-8:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1027_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_function(parser.stack[-10].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_expr(value_0)
+    replay = [StateTermValue(0, Nt('AsyncGeneratorExpression'), value, False)]
+    del parser.stack[-10:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1028_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.async_generator_method(parser.stack[-9].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    replay = [StateTermValue(0, Nt('AsyncGeneratorMethod'), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1029_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_function(parser.stack[-9].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('AsyncFunctionDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1030_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_generator(parser.stack[-9].value, None, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('AsyncGeneratorDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-9:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1031_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.async_generator(parser.stack[-10].value, parser.stack[-7].value, parser.stack[-6].value, parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, parser.stack[-1].value)
+    value = parser.methods.function_decl(value_0)
+    replay = [StateTermValue(0, Nt('AsyncGeneratorDeclaration', (('Default', True),)), value, False)]
+    del parser.stack[-10:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1032_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.script(None)
+    replay = [StateTermValue(0, Nt('Script'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1033_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.module(None)
+    replay = [StateTermValue(0, Nt('Module'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1034_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.script_body(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ScriptBody'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1035_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_653_actions(parser, lexer)
+    return
+
+def state_1036_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(75, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1037_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(72, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1038_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(71, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1039_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(70, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1040_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(69, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1041_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(68, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1042_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(67, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1043_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(66, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1044_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(65, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1045_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(64, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1046_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(62, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1047_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(59, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1048_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(58, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1049_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(57, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1050_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(55, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1051_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_684_actions(parser, lexer)
+    return
+
+def state_1052_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_682_actions(parser, lexer)
+    return
+
+def state_1053_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(54, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1054_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(53, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1055_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(52, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1056_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(51, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1057_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_681_actions(parser, lexer)
+    return
+
+def state_1058_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_680_actions(parser, lexer)
+    return
+
+def state_1059_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_679_actions(parser, lexer)
+    return
+
+def state_1060_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_678_actions(parser, lexer)
+    return
+
+def state_1061_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_677_actions(parser, lexer)
+    return
+
+def state_1062_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(50, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1063_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_674_actions(parser, lexer)
+    return
+
+def state_1064_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.let_kind(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('LetOrConst'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1065_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('Identifier'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1066_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(197, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1067_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('ModuleBody'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1068_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.variable_declaration(value_0, None)
+    replay = [StateTermValue(0, Nt('VariableDeclaration', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1069_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('ConditionalExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1070_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('ShortCircuitExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1071_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('LogicalORExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1072_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('CoalesceExpressionHead', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1073_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('LogicalANDExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1074_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('BitwiseORExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1075_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('BitwiseXORExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1076_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('BitwiseANDExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1077_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1078_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1079_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('ShiftExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1080_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('AdditiveExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1081_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('UnaryExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1082_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_802_actions(parser, lexer)
+    return
+
+def state_1083_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_801_actions(parser, lexer)
+    return
+
+def state_1084_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('UpdateExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1085_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('NewExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1086_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BindingIdentifier'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1087_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.identifier_reference(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('IdentifierReference'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1088_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_666_actions(parser, lexer)
+    return
+
+def state_1089_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_665_actions(parser, lexer)
+    return
+
+def state_1090_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(251, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1091_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.uncover_arrow_parameters(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ArrowParameters'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1092_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.uncover_parenthesized_expression(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('PrimaryExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1093_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('LeftHandSideExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1094_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(282, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1095_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('CallExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1096_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier_await(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BindingIdentifier'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1097_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier_yield(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BindingIdentifier'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1098_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(285, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1099_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.yield_expr(parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('YieldExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1100_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(286, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1101_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.variable_declaration(value_0, None)
+    replay = [StateTermValue(0, Nt('LexicalBinding', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1102_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.import_clause(parser.stack[-2].value, None, None)
+    replay = [StateTermValue(0, Nt('ImportClause'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1103_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.single_name_binding(parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('SingleNameBinding'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1104_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('IdentifierName'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1105_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_element_pattern(parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('BindingElement'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1106_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.optional_expr(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('OptionalExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1107_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.shorthand_property(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('PropertyDefinition'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1108_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(349, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1109_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(113, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1110_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_718_actions(parser, lexer)
+    return
+
+def state_1111_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_717_actions(parser, lexer)
+    return
+
+def state_1112_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_716_actions(parser, lexer)
+    return
+
+def state_1113_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    state_715_actions(parser, lexer)
+    return
+
+def state_1114_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.empty_formal_parameters()
+    replay = [StateTermValue(0, Nt('FormalParameters'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1115_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.try_statement(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('TryStatement'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1116_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.export_specifier(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ExportSpecifier'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1117_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(417, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1118_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.logical_or_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('LogicalORExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1119_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.logical_and_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('LogicalANDExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1120_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.bitwise_or_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BitwiseORExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1121_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.bitwise_xor_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BitwiseXORExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1122_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.bitwise_and_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BitwiseANDExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1123_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.equals_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1124_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.not_equals_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1125_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.strict_equals_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1126_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.strict_not_equals_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1127_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.less_than_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1128_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.greater_than_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1129_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.less_than_or_equal_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1130_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.greater_than_or_equal_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1131_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.instanceof_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1132_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.in_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1133_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.left_shift_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ShiftExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1134_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.right_shift_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ShiftExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1135_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.right_shift_ext_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ShiftExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1136_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.add_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('AdditiveExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1137_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.sub_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('AdditiveExpression'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1138_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(424, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1139_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('FormalParameters'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1140_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('ClassBody'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1141_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.property_name_to_class_element_name(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ClassElementName'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1142_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.class_field_definition(parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('FieldDefinition'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1143_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.coalesce_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('CoalesceExpression', (('In', True),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1144_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('ConditionalExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1145_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('ShortCircuitExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1146_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('LogicalORExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1147_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('CoalesceExpressionHead', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1148_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('LogicalANDExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1149_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('BitwiseORExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1150_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('BitwiseXORExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1151_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('BitwiseANDExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1152_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1153_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1154_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(468, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1155_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(470, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1156_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(305, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1157_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(301, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1158_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.yield_expr(parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('YieldExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1159_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(471, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1160_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('ForBinding'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1161_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.variable_declaration(value_0, None)
+    replay = [StateTermValue(0, Nt('VariableDeclaration', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1162_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-2].value
+    replay = [StateTermValue(0, Nt('ForBinding'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1163_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.binding_identifier_to_binding(parser.stack[-2].value)
+    value = parser.methods.variable_declaration(value_0, None)
+    replay = [StateTermValue(0, Nt('LexicalBinding', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1164_actions(parser, lexer):
+
+    value = None
+    value = parser.stack[-3].value
+    replay = [StateTermValue(0, Nt('FormalParameters'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1165_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.template_middle_list_single(parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('TemplateMiddleList'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1166_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.function_statement_list(None)
+    replay = [StateTermValue(0, Nt('FunctionStatementList'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-1:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1167_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.if_statement(parser.stack[-6].value, parser.stack[-4].value, parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('IfStatement'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-6:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1168_actions(parser, lexer):
+
+    value = None
+    value_2 = parser.methods.make_block_stmt_from_function_decl(parser.stack[-2].value)
+    value = parser.methods.if_statement(parser.stack[-6].value, parser.stack[-4].value, value_2, None)
+    replay = [StateTermValue(0, Nt('IfStatement'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-6:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1169_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.binding_identifier_to_binding(parser.stack[-3].value)
+    value = parser.methods.variable_declaration(value_0, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('VariableDeclaration', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1170_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.template_middle_list_append(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('TemplateMiddleList'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1171_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.function_statement_list(parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('FunctionStatementList'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-2:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1172_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.logical_or_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('LogicalORExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1173_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.logical_and_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('LogicalANDExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1174_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.bitwise_or_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BitwiseORExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1175_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.bitwise_xor_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BitwiseXORExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1176_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.bitwise_and_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('BitwiseANDExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1177_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.equals_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1178_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.not_equals_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1179_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.strict_equals_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1180_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.strict_not_equals_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('EqualityExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1181_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.less_than_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1182_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.greater_than_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1183_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.less_than_or_equal_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1184_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.greater_than_or_equal_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1185_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.instanceof_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('RelationalExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1186_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 1):
+        return
+    top = parser.stack.pop()
+    top = StateTermValue(575, top.term, top.value, top.new_line)
+    parser.stack.append(top)
+    return
+
+def state_1187_actions(parser, lexer):
+
+    value = None
+    value_0 = parser.methods.coalesce_op(parser.stack[-3].value)
+    value = parser.methods.binary_expr(value_0, parser.stack[-4].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('CoalesceExpression', (('In', False),)), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1188_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.default_clause(parser.stack[-3].value, parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('DefaultClause'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1189_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_clause(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value, None)
+    replay = [StateTermValue(0, Nt('CaseClause'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1190_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.default_clause(parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('DefaultClause'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-4:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1191_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.case_clause(parser.stack[-5].value, parser.stack[-4].value, parser.stack[-3].value, parser.stack[-2].value)
+    replay = [StateTermValue(0, Nt('CaseClause'), value, False)]
+    replay = replay + parser.stack[-1:]
+    del parser.stack[-5:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1192_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.let_kind(parser.stack[-3].value)
+    replay = [StateTermValue(0, Nt('LetOrConst'), value, False)]
+    replay = replay + parser.stack[-2:]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+def state_1193_actions(parser, lexer):
+
+    value = None
+    if not parser.check_not_on_new_line(lexer, 2):
+        return
+    state_1065_actions(parser, lexer)
+    return
+
+def state_1194_actions(parser, lexer):
+
+    value = None
+    value = parser.methods.label_identifier(parser.stack[-3].value)
+    replay = [StateTermValue(0, Nt('LabelIdentifier'), value, False)]
+    replay = replay + parser.stack[-2:]
+    del parser.stack[-3:]
+    parser.shift_list(replay, lexer)
+    return
+
+actions = [
+    # 0.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, End(): 1032, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt(InitNt(goal=Nt('Script'))): 24, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 3, Nt('ScriptBody'): 645, Nt('Script'): 644},
+
+    # 1.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 638, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, End(): 1033, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, 'export': 26, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt(InitNt(goal=Nt('Module'))): 27, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 660, Nt('ExportDeclaration'): 660, Nt('ImportDeclaration'): 660, Nt('ModuleItem'): 659, Nt('ModuleItemList'): 25, Nt('ModuleBody'): 658, Nt('Module'): 657},
+
+    # 2.
+
+    {},
+
+    # 3.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, End(): 1034, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 661},
+
+    # 4.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, '}': 662, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 28},
+
+    # 5.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('VariableDeclarationList', (('In', True),)): 29, Nt('VariableDeclaration', (('In', True),)): 663, Nt('BindingIdentifier'): 30, Nt('Identifier'): 664, Nt('BindingPattern'): 31, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 6.
+
+    {'(': 77},
+
+    # 7.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 78},
+
+    # 8.
+
+    {'(': 79},
+
+    # 9.
+
+    {'(': 80, 'await': 81},
+
+    # 10.
+
+    {'(': 82},
+
+    # 11.
+
+    {'target': 1035, 'set': 1035, 'of': 1035, 'get': 1035, 'from': 1035, 'async': 1035, 'as': 1035, 'public': 1035, 'protected': 1035, 'private': 1035, 'package': 1035, 'interface': 1035, 'implements': 1035, 'static': 1035, 'let': 1035, 'NameWithEscape': 1035, 'Name': 1035, ';': 690, Nt('Identifier'): 652, Nt('LabelIdentifier'): 192, ErrorToken: 690},
+
+    # 12.
+
+    {'target': 1035, 'set': 1035, 'of': 1035, 'get': 1035, 'from': 1035, 'async': 1035, 'as': 1035, 'public': 1035, 'protected': 1035, 'private': 1035, 'package': 1035, 'interface': 1035, 'implements': 1035, 'static': 1035, 'let': 1035, 'NameWithEscape': 1035, 'Name': 1035, ';': 691, Nt('Identifier'): 652, Nt('LabelIdentifier'): 193, ErrorToken: 691},
+
+    # 13.
+
+    {'yield': 1036, 'await': 1037, '!': 1038, '~': 1039, '-': 1040, '+': 1041, 'typeof': 1042, 'void': 1043, 'delete': 1044, '--': 1045, '++': 1045, 'import': 1046, 'new': 1047, 'super': 1048, '(': 1049, 'TemplateHead': 1050, 'NoSubstitutionTemplate': 1051, 'RegularExpressionLiteral': 1052, 'class': 1053, 'function': 1054, '{': 1055, '[': 1056, 'StringLiteral': 1057, 'BigIntLiteral': 1058, 'NumericLiteral': 1059, 'BooleanLiteral': 1060, 'NullLiteral': 1061, 'target': 1035, 'set': 1035, 'of': 1035, 'get': 1035, 'from': 1035, 'async': 1062, 'as': 1035, 'public': 1035, 'protected': 1035, 'private': 1035, 'package': 1035, 'interface': 1035, 'implements': 1035, 'static': 1035, 'let': 1035, 'NameWithEscape': 1035, 'Name': 1035, 'this': 1063, ';': 692, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 194, ErrorToken: 692},
+
+    # 14.
+
+    {'(': 83},
+
+    # 15.
+
+    {':': 84},
+
+    # 16.
+
+    {'[': 639, '{': 1064, 'await': 1064, 'yield': 1064, 'target': 1064, 'set': 1064, 'of': 1064, 'get': 1064, 'from': 1064, 'async': 1064, 'as': 1064, 'public': 1064, 'protected': 1064, 'private': 1064, 'package': 1064, 'interface': 1064, 'implements': 1064, 'static': 1064, 'let': 1064, 'NameWithEscape': 1064, 'Name': 1064, ':': 1065, '=>': 1065, '--': 1065, '++': 1065, '??': 1065, ',': 1065, ';': 1065, '?': 1065, '||': 1065, '&&': 1065, '|': 1065, '^': 1065, '&': 1065, '!==': 1065, '===': 1065, '!=': 1065, '==': 1065, 'in': 1065, 'instanceof': 1065, '>=': 1065, '<=': 1065, '>': 1065, '<': 1065, '>>>': 1065, '>>': 1065, '<<': 1065, '-': 1065, '+': 1065, '%': 1065, '/': 1065, '*': 1065, '**': 1065, '**=': 1065, '|=': 1065, '^=': 1065, '&=': 1065, '>>>=': 1065, '>>=': 1065, '<<=': 1065, '-=': 1065, '+=': 1065, '%=': 1065, '/=': 1065, '*=': 1065, '=': 1065, '?.': 1065, '(': 1065, 'TemplateHead': 1065, 'NoSubstitutionTemplate': 1065, '.': 1065, Nt('ArrayBindingPattern'): 1064, Nt('ObjectBindingPattern'): 1064, Nt('BindingPattern'): 1064, Nt('Identifier'): 1064, Nt('BindingIdentifier'): 1064, Nt('LexicalBinding', (('In', True),)): 1064, Nt('BindingList', (('In', True),)): 1064, Nt('MultiplicativeOperator'): 1065, Nt('AssignmentOperator'): 1065, Nt('OptionalChain'): 1065, Nt('Arguments'): 1065, Nt('SubstitutionTemplate'): 1065, Nt('TemplateLiteral'): 1065, ErrorToken: 1065},
+
+    # 17.
+
+    {'function': 1066, ':': 1065, '=>': 1065, '--': 1065, '++': 1065, '??': 1065, ',': 1065, ';': 1065, '?': 1065, '||': 1065, '&&': 1065, '|': 1065, '^': 1065, '&': 1065, '!==': 1065, '===': 1065, '!=': 1065, '==': 1065, 'in': 1065, 'instanceof': 1065, '>=': 1065, '<=': 1065, '>': 1065, '<': 1065, '>>>': 1065, '>>': 1065, '<<': 1065, '-': 1065, '+': 1065, '%': 1065, '/': 1065, '*': 1065, '**': 1065, '**=': 1065, '|=': 1065, '^=': 1065, '&=': 1065, '>>>=': 1065, '>>=': 1065, '<<=': 1065, '-=': 1065, '+=': 1065, '%=': 1065, '/=': 1065, '*=': 1065, '=': 1065, '?.': 1065, '(': 1065, 'TemplateHead': 1065, 'NoSubstitutionTemplate': 1065, '.': 1065, '[': 1065, Nt('MultiplicativeOperator'): 1065, Nt('AssignmentOperator'): 1065, Nt('OptionalChain'): 1065, Nt('Arguments'): 1065, Nt('SubstitutionTemplate'): 1065, Nt('TemplateLiteral'): 1065, ErrorToken: 1065},
+
+    # 18.
+
+    {'yield': 1036, 'await': 1037, '!': 1038, '~': 1039, '-': 1040, '+': 1041, 'typeof': 1042, 'void': 1043, 'delete': 1044, '--': 1045, '++': 1045, 'import': 1046, 'new': 1047, 'super': 1048, '(': 1049, 'TemplateHead': 1050, 'NoSubstitutionTemplate': 1051, 'RegularExpressionLiteral': 1052, 'class': 1053, 'function': 1054, '{': 1055, '[': 1056, 'StringLiteral': 1057, 'BigIntLiteral': 1058, 'NumericLiteral': 1059, 'BooleanLiteral': 1060, 'NullLiteral': 1061, 'target': 1035, 'set': 1035, 'of': 1035, 'get': 1035, 'from': 1035, 'async': 1062, 'as': 1035, 'public': 1035, 'protected': 1035, 'private': 1035, 'package': 1035, 'interface': 1035, 'implements': 1035, 'static': 1035, 'let': 1035, 'NameWithEscape': 1035, 'Name': 1035, 'this': 1063, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 198},
+
+    # 19.
+
+    {'{': 4, Nt('Block'): 85},
+
+    # 20.
+
+    {';': 693, ErrorToken: 693},
+
+    # 21.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '*': 87, Nt('BindingIdentifier'): 86, Nt('Identifier'): 664},
+
+    # 22.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('BindingIdentifier'): 88, Nt('Identifier'): 664},
+
+    # 23.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('BindingList', (('In', True),)): 89, Nt('LexicalBinding', (('In', True),)): 694, Nt('BindingIdentifier'): 90, Nt('Identifier'): 664, Nt('BindingPattern'): 91, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 24.
+
+    {End(): 695},
+
+    # 25.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 638, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, End(): 1067, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, 'export': 26, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 660, Nt('ExportDeclaration'): 660, Nt('ImportDeclaration'): 660, Nt('ModuleItem'): 696},
+
+    # 26.
+
+    {'*': 97, '{': 99, 'var': 5, 'function': 21, 'async': 100, 'class': 22, 'let': 704, 'const': 656, 'default': 101, Nt('ExportClause'): 98, Nt('VariableStatement'): 702, Nt('Declaration'): 703, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('LetOrConst'): 23},
+
+    # 27.
+
+    {End(): 705},
+
+    # 28.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, '}': 706, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 661},
+
+    # 29.
+
+    {';': 707, ',': 102, ErrorToken: 707},
+
+    # 30.
+
+    {',': 1068, ';': 1068, '=': 103, Nt('Initializer', (('In', True),)): 708, ErrorToken: 1068},
+
+    # 31.
+
+    {'=': 103, Nt('Initializer', (('In', True),)): 709},
+
+    # 32.
+
+    {'}': 710, '...': 105, 'Name': 108, 'NameWithEscape': 108, 'let': 108, 'static': 108, 'implements': 108, 'interface': 108, 'package': 108, 'private': 108, 'protected': 108, 'public': 108, 'as': 108, 'async': 109, 'from': 108, 'get': 109, 'of': 108, 'set': 109, 'target': 108, 'yield': 110, 'await': 111, 'BooleanLiteral': 715, 'NullLiteral': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'StringLiteral': 716, 'NumericLiteral': 717, 'BigIntLiteral': 718, '[': 113, Nt('BindingRestProperty'): 104, Nt('BindingPropertyList'): 106, Nt('BindingProperty'): 711, Nt('SingleNameBinding'): 712, Nt('BindingIdentifier'): 107, Nt('Identifier'): 664, Nt('PropertyName'): 112, Nt('LiteralPropertyName'): 713, Nt('IdentifierName'): 714, Nt('ComputedPropertyName'): 713},
+
+    # 33.
+
+    {']': 719, ',': 720, '...': 116, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('Elision'): 114, Nt('BindingRestElement'): 115, Nt('BindingElementList'): 117, Nt('BindingElisionElement'): 721, Nt('BindingElement'): 722, Nt('SingleNameBinding'): 723, Nt('BindingIdentifier'): 107, Nt('Identifier'): 664, Nt('BindingPattern'): 118, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 34.
+
+    {';': 724, ',': 119, ErrorToken: 724},
+
+    # 35.
+
+    {',': 1069, ';': 1069, ')': 1069, ':': 1069, 'TemplateMiddle': 1069, 'TemplateTail': 1069, ']': 1069, '}': 1069, '?': 120, Nt('TemplateMiddleList'): 1069, Nt('TemplateSpans'): 1069, ErrorToken: 1069},
+
+    # 36.
+
+    {'?': 1070, '}': 1070, ']': 1070, 'TemplateTail': 1070, 'TemplateMiddle': 1070, ':': 1070, ')': 1070, ';': 1070, ',': 1070, '||': 121, Nt('TemplateSpans'): 1070, Nt('TemplateMiddleList'): 1070, ErrorToken: 1070},
+
+    # 37.
+
+    {'||': 1071, ',': 1071, ';': 1071, ')': 1071, ':': 1071, 'TemplateMiddle': 1071, 'TemplateTail': 1071, ']': 1071, '}': 1071, '?': 1071, '&&': 122, Nt('TemplateMiddleList'): 1071, Nt('TemplateSpans'): 1071, ErrorToken: 1071},
+
+    # 38.
+
+    {'??': 1072, '&&': 1073, '?': 1073, '}': 1073, ']': 1073, 'TemplateTail': 1073, 'TemplateMiddle': 1073, ':': 1073, ')': 1073, ';': 1073, ',': 1073, '||': 1073, '|': 123, Nt('TemplateSpans'): 1073, Nt('TemplateMiddleList'): 1073, ErrorToken: 1073},
+
+    # 39.
+
+    {'|': 1074, '||': 1074, ',': 1074, ';': 1074, ')': 1074, ':': 1074, 'TemplateMiddle': 1074, 'TemplateTail': 1074, ']': 1074, '}': 1074, '?': 1074, '&&': 1074, '??': 1074, '^': 124, Nt('TemplateMiddleList'): 1074, Nt('TemplateSpans'): 1074, ErrorToken: 1074},
+
+    # 40.
+
+    {'^': 1075, '??': 1075, '&&': 1075, '?': 1075, '}': 1075, ']': 1075, 'TemplateTail': 1075, 'TemplateMiddle': 1075, ':': 1075, ')': 1075, ';': 1075, ',': 1075, '||': 1075, '|': 1075, '&': 125, Nt('TemplateSpans'): 1075, Nt('TemplateMiddleList'): 1075, ErrorToken: 1075},
+
+    # 41.
+
+    {'&': 1076, '|': 1076, '||': 1076, ',': 1076, ';': 1076, ')': 1076, ':': 1076, 'TemplateMiddle': 1076, 'TemplateTail': 1076, ']': 1076, '}': 1076, '?': 1076, '&&': 1076, '??': 1076, '^': 1076, '!==': 129, '===': 128, '!=': 127, '==': 126, Nt('TemplateMiddleList'): 1076, Nt('TemplateSpans'): 1076, ErrorToken: 1076},
+
+    # 42.
+
+    {'==': 1077, '!=': 1077, '===': 1077, '!==': 1077, '^': 1077, '??': 1077, '&&': 1077, '?': 1077, '}': 1077, ']': 1077, 'TemplateTail': 1077, 'TemplateMiddle': 1077, ':': 1077, ')': 1077, ';': 1077, ',': 1077, '||': 1077, '|': 1077, '&': 1077, 'in': 135, 'instanceof': 134, '>=': 133, '<=': 132, '>': 131, '<': 130, Nt('TemplateSpans'): 1077, Nt('TemplateMiddleList'): 1077, ErrorToken: 1077},
+
+    # 43.
+
+    {'<': 1078, '>': 1078, '<=': 1078, '>=': 1078, 'instanceof': 1078, 'in': 1078, '&': 1078, '|': 1078, '||': 1078, ',': 1078, ';': 1078, ')': 1078, ':': 1078, 'TemplateMiddle': 1078, 'TemplateTail': 1078, ']': 1078, '}': 1078, '?': 1078, '&&': 1078, '??': 1078, '^': 1078, '!==': 1078, '===': 1078, '!=': 1078, '==': 1078, '>>>': 138, '>>': 137, '<<': 136, Nt('TemplateMiddleList'): 1078, Nt('TemplateSpans'): 1078, ErrorToken: 1078},
+
+    # 44.
+
+    {'<<': 1079, '>>': 1079, '>>>': 1079, '==': 1079, '!=': 1079, '===': 1079, '!==': 1079, '^': 1079, '??': 1079, '&&': 1079, '?': 1079, '}': 1079, ']': 1079, 'TemplateTail': 1079, 'TemplateMiddle': 1079, ':': 1079, ')': 1079, ';': 1079, ',': 1079, '||': 1079, '|': 1079, '&': 1079, 'in': 1079, 'instanceof': 1079, '>=': 1079, '<=': 1079, '>': 1079, '<': 1079, '-': 140, '+': 139, Nt('TemplateSpans'): 1079, Nt('TemplateMiddleList'): 1079, ErrorToken: 1079},
+
+    # 45.
+
+    {'+': 1080, '-': 1080, '<': 1080, '>': 1080, '<=': 1080, '>=': 1080, 'instanceof': 1080, 'in': 1080, '&': 1080, '|': 1080, '||': 1080, ',': 1080, ';': 1080, ')': 1080, ':': 1080, 'TemplateMiddle': 1080, 'TemplateTail': 1080, ']': 1080, '}': 1080, '?': 1080, '&&': 1080, '??': 1080, '^': 1080, '!==': 1080, '===': 1080, '!=': 1080, '==': 1080, '>>>': 1080, '>>': 1080, '<<': 1080, '%': 727, '/': 726, '*': 725, Nt('TemplateMiddleList'): 1080, Nt('TemplateSpans'): 1080, Nt('MultiplicativeOperator'): 141, ErrorToken: 1080},
+
+    # 46.
+
+    {'*': 1081, '/': 1081, '%': 1081, '<<': 1081, '>>': 1081, '>>>': 1081, '==': 1081, '!=': 1081, '===': 1081, '!==': 1081, '^': 1081, '??': 1081, '&&': 1081, '?': 1081, '}': 1081, ']': 1081, 'TemplateTail': 1081, 'TemplateMiddle': 1081, ':': 1081, ')': 1081, ';': 1081, ',': 1081, '||': 1081, '|': 1081, '&': 1081, 'in': 1081, 'instanceof': 1081, '>=': 1081, '<=': 1081, '>': 1081, '<': 1081, '-': 1081, '+': 1081, '**': 142, Nt('MultiplicativeOperator'): 1081, Nt('TemplateSpans'): 1081, Nt('TemplateMiddleList'): 1081, ErrorToken: 1081},
+
+    # 47.
+
+    {'--': 1082, '++': 1083, '**': 1084, '+': 1084, '-': 1084, '<': 1084, '>': 1084, '<=': 1084, '>=': 1084, 'instanceof': 1084, 'in': 1084, '&': 1084, '|': 1084, '||': 1084, ',': 1084, ';': 1084, ')': 1084, ':': 1084, 'TemplateMiddle': 1084, 'TemplateTail': 1084, ']': 1084, '}': 1084, '?': 1084, '&&': 1084, '??': 1084, '^': 1084, '!==': 1084, '===': 1084, '!=': 1084, '==': 1084, '>>>': 1084, '>>': 1084, '<<': 1084, '%': 1084, '/': 1084, '*': 1084, '**=': 739, '|=': 738, '^=': 737, '&=': 736, '>>>=': 735, '>>=': 734, '<<=': 733, '-=': 732, '+=': 731, '%=': 730, '/=': 729, '*=': 728, '=': 143, Nt('TemplateMiddleList'): 1084, Nt('TemplateSpans'): 1084, Nt('MultiplicativeOperator'): 1084, Nt('AssignmentOperator'): 144, ErrorToken: 1084},
+
+    # 48.
+
+    {'=': 1085, '*=': 1085, '/=': 1085, '%=': 1085, '+=': 1085, '-=': 1085, '<<=': 1085, '>>=': 1085, '>>>=': 1085, '&=': 1085, '^=': 1085, '|=': 1085, '**=': 1085, '*': 1085, '/': 1085, '%': 1085, '<<': 1085, '>>': 1085, '>>>': 1085, '==': 1085, '!=': 1085, '===': 1085, '!==': 1085, '^': 1085, '??': 1085, '&&': 1085, '?': 1085, '}': 1085, ']': 1085, 'TemplateTail': 1085, 'TemplateMiddle': 1085, ':': 1085, ')': 1085, ';': 1085, ',': 1085, '||': 1085, '|': 1085, '&': 1085, 'in': 1085, 'instanceof': 1085, '>=': 1085, '<=': 1085, '>': 1085, '<': 1085, '-': 1085, '+': 1085, '**': 1085, '++': 1085, '--': 1085, 'of': 1085, '{': 1085, '?.': 149, '(': 147, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, '.': 146, '[': 145, Nt('AssignmentOperator'): 1085, Nt('MultiplicativeOperator'): 1085, Nt('TemplateSpans'): 1085, Nt('TemplateMiddleList'): 1085, Nt('OptionalChain'): 148, Nt('Arguments'): 741, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 740, ErrorToken: 1085},
+
+    # 49.
+
+    {'=>': 1086, '[': 1087, '.': 1087, 'NoSubstitutionTemplate': 1087, 'TemplateHead': 1087, '(': 1087, '?.': 1087, '{': 1087, 'of': 1087, '--': 1087, '++': 1087, '**': 1087, '+': 1087, '-': 1087, '<': 1087, '>': 1087, '<=': 1087, '>=': 1087, 'instanceof': 1087, 'in': 1087, '&': 1087, '|': 1087, '||': 1087, ',': 1087, ';': 1087, ')': 1087, ':': 1087, 'TemplateMiddle': 1087, 'TemplateTail': 1087, ']': 1087, '}': 1087, '?': 1087, '&&': 1087, '??': 1087, '^': 1087, '!==': 1087, '===': 1087, '!=': 1087, '==': 1087, '>>>': 1087, '>>': 1087, '<<': 1087, '%': 1087, '/': 1087, '*': 1087, '**=': 1087, '|=': 1087, '^=': 1087, '&=': 1087, '>>>=': 1087, '>>=': 1087, '<<=': 1087, '-=': 1087, '+=': 1087, '%=': 1087, '/=': 1087, '*=': 1087, '=': 1087, Nt('TemplateLiteral'): 1087, Nt('SubstitutionTemplate'): 1087, Nt('Arguments'): 1087, Nt('OptionalChain'): 1087, Nt('TemplateMiddleList'): 1087, Nt('TemplateSpans'): 1087, Nt('MultiplicativeOperator'): 1087, Nt('AssignmentOperator'): 1087, ErrorToken: 1087},
+
+    # 50.
+
+    {'await': 1088, 'yield': 1089, 'target': 1035, 'set': 1035, 'of': 640, 'get': 1035, 'from': 1035, 'async': 1035, 'as': 1035, 'public': 1035, 'protected': 1035, 'private': 1035, 'package': 1035, 'interface': 1035, 'implements': 1035, 'static': 1035, 'let': 1035, 'NameWithEscape': 1035, 'Name': 1035, 'function': 1090, '=': 1065, '*=': 1065, '/=': 1065, '%=': 1065, '+=': 1065, '-=': 1065, '<<=': 1065, '>>=': 1065, '>>>=': 1065, '&=': 1065, '^=': 1065, '|=': 1065, '**=': 1065, '*': 1065, '/': 1065, '%': 1065, '<<': 1065, '>>': 1065, '>>>': 1065, '==': 1065, '!=': 1065, '===': 1065, '!==': 1065, '^': 1065, '??': 1065, '&&': 1065, '?': 1065, '}': 1065, ']': 1065, 'TemplateTail': 1065, 'TemplateMiddle': 1065, ':': 1065, ')': 1065, ';': 1065, ',': 1065, '||': 1065, '|': 1065, '&': 1065, 'in': 1065, 'instanceof': 1065, '>=': 1065, '<=': 1065, '>': 1065, '<': 1065, '-': 1065, '+': 1065, '**': 1065, '++': 1065, '--': 1065, '{': 1065, '?.': 1065, '(': 1065, 'TemplateHead': 1065, 'NoSubstitutionTemplate': 1065, '.': 1065, '[': 1065, '=>': 1065, Nt('Identifier'): 664, Nt('BindingIdentifier'): 813, Nt('AsyncArrowBindingIdentifier'): 252, Nt('AssignmentOperator'): 1065, Nt('MultiplicativeOperator'): 1065, Nt('TemplateSpans'): 1065, Nt('TemplateMiddleList'): 1065, Nt('OptionalChain'): 1065, Nt('Arguments'): 1065, Nt('SubstitutionTemplate'): 1065, Nt('TemplateLiteral'): 1065, ErrorToken: 1065},
+
+    # 51.
+
+    {']': 742, ',': 720, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, '...': 152, Nt('Elision'): 150, Nt('ElementList'): 151, Nt('AssignmentExpression', (('In', True),)): 743, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('SpreadElement'): 744},
+
+    # 52.
+
+    {'}': 745, 'Name': 108, 'NameWithEscape': 108, 'let': 108, 'static': 108, 'implements': 108, 'interface': 108, 'package': 108, 'private': 108, 'protected': 108, 'public': 108, 'as': 108, 'async': 155, 'from': 108, 'get': 156, 'of': 108, 'set': 157, 'target': 108, 'BooleanLiteral': 715, 'NullLiteral': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'StringLiteral': 716, 'NumericLiteral': 717, 'BigIntLiteral': 718, '[': 113, '*': 159, '...': 160, Nt('PropertyDefinitionList'): 153, Nt('PropertyDefinition'): 746, Nt('IdentifierReference'): 154, Nt('Identifier'): 747, Nt('CoverInitializedName'): 748, Nt('PropertyName'): 158, Nt('LiteralPropertyName'): 713, Nt('IdentifierName'): 714, Nt('ComputedPropertyName'): 713, Nt('MethodDefinition'): 749, Nt('GeneratorMethod'): 750, Nt('AsyncMethod'): 750, Nt('AsyncGeneratorMethod'): 750},
+
+    # 53.
+
+    {'(': 161, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '*': 163, Nt('BindingIdentifier'): 162, Nt('Identifier'): 664},
+
+    # 54.
+
+    {'{': 164, 'extends': 166, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('ClassTail'): 751, Nt('ClassHeritage'): 165, Nt('BindingIdentifier'): 167, Nt('Identifier'): 664},
+
+    # 55.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 168, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 56.
+
+    {'=>': 1091, '[': 1092, '.': 1092, 'NoSubstitutionTemplate': 1092, 'TemplateHead': 1092, '(': 1092, '?.': 1092, '{': 1092, 'of': 1092, '--': 1092, '++': 1092, '**': 1092, '+': 1092, '-': 1092, '<': 1092, '>': 1092, '<=': 1092, '>=': 1092, 'instanceof': 1092, 'in': 1092, '&': 1092, '|': 1092, '||': 1092, ',': 1092, ';': 1092, ')': 1092, ':': 1092, 'TemplateMiddle': 1092, 'TemplateTail': 1092, ']': 1092, '}': 1092, '?': 1092, '&&': 1092, '??': 1092, '^': 1092, '!==': 1092, '===': 1092, '!=': 1092, '==': 1092, '>>>': 1092, '>>': 1092, '<<': 1092, '%': 1092, '/': 1092, '*': 1092, '**=': 1092, '|=': 1092, '^=': 1092, '&=': 1092, '>>>=': 1092, '>>=': 1092, '<<=': 1092, '-=': 1092, '+=': 1092, '%=': 1092, '/=': 1092, '*=': 1092, '=': 1092, Nt('TemplateLiteral'): 1092, Nt('SubstitutionTemplate'): 1092, Nt('Arguments'): 1092, Nt('OptionalChain'): 1092, Nt('TemplateMiddleList'): 1092, Nt('TemplateSpans'): 1092, Nt('MultiplicativeOperator'): 1092, Nt('AssignmentOperator'): 1092, ErrorToken: 1092},
+
+    # 57.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, ')': 752, '...': 170, Nt('Expression', (('In', True),)): 169, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 58.
+
+    {'[': 171, '.': 172, '(': 147, Nt('Arguments'): 753},
+
+    # 59.
+
+    {'.': 173, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 176, 'new': 59, Nt('MemberExpression'): 174, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('NewExpression'): 755},
+
+    # 60.
+
+    {'=': 1093, '*=': 1093, '/=': 1093, '%=': 1093, '+=': 1093, '-=': 1093, '<<=': 1093, '>>=': 1093, '>>>=': 1093, '&=': 1093, '^=': 1093, '|=': 1093, '**=': 1093, '*': 1093, '/': 1093, '%': 1093, '<<': 1093, '>>': 1093, '>>>': 1093, '==': 1093, '!=': 1093, '===': 1093, '!==': 1093, '^': 1093, '??': 1093, '&&': 1093, '?': 1093, '}': 1093, ']': 1093, 'TemplateTail': 1093, 'TemplateMiddle': 1093, ':': 1093, ')': 1093, ';': 1093, ',': 1093, '||': 1093, '|': 1093, '&': 1093, 'in': 1093, 'instanceof': 1093, '>=': 1093, '<=': 1093, '>': 1093, '<': 1093, '-': 1093, '+': 1093, '**': 1093, '++': 1093, '--': 1093, 'of': 1093, '{': 1093, '?.': 149, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, '.': 178, '[': 177, '(': 147, Nt('AssignmentOperator'): 1093, Nt('MultiplicativeOperator'): 1093, Nt('TemplateSpans'): 1093, Nt('TemplateMiddleList'): 1093, Nt('OptionalChain'): 148, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 757, Nt('Arguments'): 756, ErrorToken: 1093},
+
+    # 61.
+
+    {'=>': 1094, '(': 1095, '[': 1095, '.': 1095, 'NoSubstitutionTemplate': 1095, 'TemplateHead': 1095, '?.': 1095, '{': 1095, 'of': 1095, '--': 1095, '++': 1095, '**': 1095, '+': 1095, '-': 1095, '<': 1095, '>': 1095, '<=': 1095, '>=': 1095, 'instanceof': 1095, 'in': 1095, '&': 1095, '|': 1095, '||': 1095, ',': 1095, ';': 1095, ')': 1095, ':': 1095, 'TemplateMiddle': 1095, 'TemplateTail': 1095, ']': 1095, '}': 1095, '?': 1095, '&&': 1095, '??': 1095, '^': 1095, '!==': 1095, '===': 1095, '!=': 1095, '==': 1095, '>>>': 1095, '>>': 1095, '<<': 1095, '%': 1095, '/': 1095, '*': 1095, '**=': 1095, '|=': 1095, '^=': 1095, '&=': 1095, '>>>=': 1095, '>>=': 1095, '<<=': 1095, '-=': 1095, '+=': 1095, '%=': 1095, '/=': 1095, '*=': 1095, '=': 1095, Nt('Arguments'): 1095, Nt('TemplateLiteral'): 1095, Nt('SubstitutionTemplate'): 1095, Nt('OptionalChain'): 1095, Nt('TemplateMiddleList'): 1095, Nt('TemplateSpans'): 1095, Nt('MultiplicativeOperator'): 1095, Nt('AssignmentOperator'): 1095, ErrorToken: 1095},
+
+    # 62.
+
+    {'(': 179},
+
+    # 63.
+
+    {'=': 1093, '*=': 1093, '/=': 1093, '%=': 1093, '+=': 1093, '-=': 1093, '<<=': 1093, '>>=': 1093, '>>>=': 1093, '&=': 1093, '^=': 1093, '|=': 1093, '**=': 1093, '*': 1093, '/': 1093, '%': 1093, '<<': 1093, '>>': 1093, '>>>': 1093, '==': 1093, '!=': 1093, '===': 1093, '!==': 1093, '^': 1093, '??': 1093, '&&': 1093, '?': 1093, '}': 1093, ']': 1093, 'TemplateTail': 1093, 'TemplateMiddle': 1093, ':': 1093, ')': 1093, ';': 1093, ',': 1093, '||': 1093, '|': 1093, '&': 1093, 'in': 1093, 'instanceof': 1093, '>=': 1093, '<=': 1093, '>': 1093, '<': 1093, '-': 1093, '+': 1093, '**': 1093, '++': 1093, '--': 1093, 'of': 1093, '{': 1093, '?.': 149, Nt('AssignmentOperator'): 1093, Nt('MultiplicativeOperator'): 1093, Nt('TemplateSpans'): 1093, Nt('TemplateMiddleList'): 1093, Nt('OptionalChain'): 148, ErrorToken: 1093},
+
+    # 64.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('UnaryExpression'): 758, Nt('UpdateExpression'): 688, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 65.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('UnaryExpression'): 759, Nt('UpdateExpression'): 688, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 66.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('UnaryExpression'): 760, Nt('UpdateExpression'): 688, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 67.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('UnaryExpression'): 761, Nt('UpdateExpression'): 688, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 68.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('UnaryExpression'): 762, Nt('UpdateExpression'): 688, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 69.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('UnaryExpression'): 763, Nt('UpdateExpression'): 688, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 70.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('UnaryExpression'): 764, Nt('UpdateExpression'): 688, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 71.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('UnaryExpression'): 765, Nt('UpdateExpression'): 688, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 72.
+
+    {'=>': 1096, 'await': 181, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '{': 52, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 175, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 747, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 180, Nt('UpdateExpression'): 688, Nt('UnaryExpression'): 766},
+
+    # 73.
+
+    {'??': 1072, '?': 1070, '}': 1070, ']': 1070, 'TemplateTail': 1070, 'TemplateMiddle': 1070, ':': 1070, ')': 1070, ';': 1070, ',': 1070, Nt('TemplateSpans'): 1070, Nt('TemplateMiddleList'): 1070, ErrorToken: 1070},
+
+    # 74.
+
+    {'??': 182},
+
+    # 75.
+
+    {'=>': 1097, '*': 1098, 'yield': 1036, 'await': 1037, '!': 1038, '~': 1039, '-': 1040, '+': 1041, 'typeof': 1042, 'void': 1043, 'delete': 1044, '--': 1045, '++': 1045, 'import': 1046, 'new': 1047, 'super': 1048, '(': 1049, 'TemplateHead': 1050, 'NoSubstitutionTemplate': 1051, 'RegularExpressionLiteral': 1052, 'class': 1053, 'function': 1054, '{': 1055, '[': 1056, 'StringLiteral': 1057, 'BigIntLiteral': 1058, 'NumericLiteral': 1059, 'BooleanLiteral': 1060, 'NullLiteral': 1061, 'target': 1035, 'set': 1035, 'of': 1035, 'get': 1035, 'from': 1035, 'async': 1062, 'as': 1035, 'public': 1035, 'protected': 1035, 'private': 1035, 'package': 1035, 'interface': 1035, 'implements': 1035, 'static': 1035, 'let': 1035, 'NameWithEscape': 1035, 'Name': 1035, 'this': 1063, ',': 1099, ';': 1099, ')': 1099, ':': 1099, 'TemplateMiddle': 1099, 'TemplateTail': 1099, ']': 1099, '}': 1099, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 841, Nt('TemplateMiddleList'): 1099, Nt('TemplateSpans'): 1099, ErrorToken: 1099},
+
+    # 76.
+
+    {'=>': 1100},
+
+    # 77.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 183, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 78.
+
+    {'while': 184},
+
+    # 79.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 185, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 80.
+
+    {'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '{': 52, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'yield': 305, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'async': 301, ';': 290, 'const': 656, 'let': 704, 'var': 186, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 641, Nt('AsyncArrowFunction', (('In', False),)): 843, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 306, Nt('ArrowFunction', (('In', False),)): 843, Nt('YieldExpression', (('In', False),)): 843, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('CoalesceExpression', (('In', False),)): 303, Nt('AwaitExpression'): 688, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 300, Nt('RelationalExpression', (('In', False),)): 299, Nt('EqualityExpression', (('In', False),)): 298, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('LogicalORExpression', (('In', False),)): 293, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('ConditionalExpression', (('In', False),)): 843, Nt('AssignmentExpression', (('In', False),)): 842, Nt('Expression', (('In', False),)): 291, Nt('ForDeclaration'): 189, Nt('LetOrConst'): 188, Nt('ForLexicalDeclaration', (('In', False),)): 187},
+
+    # 81.
+
+    {'(': 190},
+
+    # 82.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 191, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 83.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 195, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 84.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'function': 196, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('FunctionDeclaration', (('Default', False),)): 768, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 768, Nt('LabelledItem'): 767},
+
+    # 85.
+
+    {'catch': 200, 'finally': 201, Nt('Catch'): 199, Nt('Finally'): 769},
+
+    # 86.
+
+    {'(': 202},
+
+    # 87.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('BindingIdentifier'): 203, Nt('Identifier'): 664},
+
+    # 88.
+
+    {'{': 164, 'extends': 166, Nt('ClassTail'): 770, Nt('ClassHeritage'): 165},
+
+    # 89.
+
+    {';': 771, ',': 204, ErrorToken: 771},
+
+    # 90.
+
+    {',': 1101, ';': 1101, '=': 103, Nt('Initializer', (('In', True),)): 772, ErrorToken: 1101},
+
+    # 91.
+
+    {'=': 103, Nt('Initializer', (('In', True),)): 773},
+
+    # 92.
+
+    {'from': 206, Nt('FromClause'): 205},
+
+    # 93.
+
+    {'from': 1102, ',': 207, Nt('FromClause'): 1102},
+
+    # 94.
+
+    {'as': 208},
+
+    # 95.
+
+    {'}': 774, 'Name': 108, 'NameWithEscape': 108, 'let': 108, 'static': 108, 'implements': 108, 'interface': 108, 'package': 108, 'private': 108, 'protected': 108, 'public': 108, 'as': 108, 'async': 109, 'from': 108, 'get': 109, 'of': 108, 'set': 109, 'target': 108, 'yield': 110, 'await': 111, 'BooleanLiteral': 715, 'NullLiteral': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, Nt('ImportsList'): 209, Nt('ImportSpecifier'): 775, Nt('ImportedBinding'): 776, Nt('BindingIdentifier'): 698, Nt('Identifier'): 664, Nt('IdentifierName'): 210},
+
+    # 96.
+
+    {';': 777, ErrorToken: 777},
+
+    # 97.
+
+    {'from': 206, Nt('FromClause'): 211},
+
+    # 98.
+
+    {'from': 206, ';': 778, Nt('FromClause'): 212, ErrorToken: 778},
+
+    # 99.
+
+    {'}': 779, 'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, Nt('ExportsList'): 213, Nt('ExportSpecifier'): 780, Nt('IdentifierName'): 214},
+
+    # 100.
+
+    {'function': 1066},
+
+    # 101.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '{': 52, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'class': 217, 'async': 216, 'function': 215, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 336, Nt('ClassDeclaration', (('Default', True),)): 783, Nt('AsyncGeneratorDeclaration', (('Default', True),)): 782, Nt('AsyncFunctionDeclaration', (('Default', True),)): 782, Nt('GeneratorDeclaration', (('Default', True),)): 782, Nt('FunctionDeclaration', (('Default', True),)): 782, Nt('HoistableDeclaration', (('Default', True),)): 781},
+
+    # 102.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('VariableDeclaration', (('In', True),)): 784, Nt('BindingIdentifier'): 30, Nt('Identifier'): 664, Nt('BindingPattern'): 31, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 103.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 785, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 104.
+
+    {'}': 786},
+
+    # 105.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('BindingIdentifier'): 787, Nt('Identifier'): 664},
+
+    # 106.
+
+    {'}': 788, ',': 218},
+
+    # 107.
+
+    {')': 1103, ',': 1103, ']': 1103, '}': 1103, '=': 103, Nt('Initializer', (('In', True),)): 789},
+
+    # 108.
+
+    {'as': 1104, '(': 1104, ':': 1104, ',': 1065, '}': 1065, '=': 1065, ']': 1065, ')': 1065, Nt('Initializer', (('In', True),)): 1065},
+
+    # 109.
+
+    {'as': 1104, ':': 1104, ',': 1065, '}': 1065, '=': 1065, ']': 1065, ')': 1065, Nt('Initializer', (('In', True),)): 1065},
+
+    # 110.
+
+    {'as': 1104, ':': 1104, ',': 1097, '}': 1097, '=': 1097, ']': 1097, ')': 1097, Nt('Initializer', (('In', True),)): 1097},
+
+    # 111.
+
+    {'as': 1104, ':': 1104, ',': 1096, '}': 1096, '=': 1096, ']': 1096, ')': 1096, Nt('Initializer', (('In', True),)): 1096},
+
+    # 112.
+
+    {':': 219},
+
+    # 113.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 220, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 114.
+
+    {']': 790, ',': 791, '...': 116, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('BindingRestElement'): 221, Nt('BindingElement'): 792, Nt('SingleNameBinding'): 723, Nt('BindingIdentifier'): 107, Nt('Identifier'): 664, Nt('BindingPattern'): 118, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 115.
+
+    {']': 793},
+
+    # 116.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('BindingIdentifier'): 794, Nt('Identifier'): 664, Nt('BindingPattern'): 795, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 117.
+
+    {']': 796, ',': 222},
+
+    # 118.
+
+    {')': 1105, ',': 1105, ']': 1105, '}': 1105, '=': 103, Nt('Initializer', (('In', True),)): 797},
+
+    # 119.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 798, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 120.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 223, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 121.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('LogicalANDExpression', (('In', True),)): 224, Nt('BitwiseORExpression', (('In', True),)): 225, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 122.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('BitwiseORExpression', (('In', True),)): 226, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 123.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('BitwiseXORExpression', (('In', True),)): 227, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 124.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('BitwiseANDExpression', (('In', True),)): 228, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 125.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('EqualityExpression', (('In', True),)): 229, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 126.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('RelationalExpression', (('In', True),)): 230, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 127.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('RelationalExpression', (('In', True),)): 231, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 128.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('RelationalExpression', (('In', True),)): 232, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 129.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('RelationalExpression', (('In', True),)): 233, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 130.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 234, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 131.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 235, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 132.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 236, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 133.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 237, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 134.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 238, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 135.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 239, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 136.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('AdditiveExpression'): 240, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 137.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('AdditiveExpression'): 241, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 138.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('AdditiveExpression'): 242, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 139.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('MultiplicativeExpression'): 243, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 140.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('MultiplicativeExpression'): 244, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 141.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ExponentiationExpression'): 799, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 142.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ExponentiationExpression'): 800, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 143.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 803, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 144.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 804, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 145.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 245, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 146.
+
+    {'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, 'PrivateIdentifier': 806, Nt('IdentifierName'): 805},
+
+    # 147.
+
+    {')': 807, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, '...': 247, Nt('ArgumentList'): 246, Nt('AssignmentExpression', (('In', True),)): 808, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 148.
+
+    {'?.': 1106, '{': 1106, 'of': 1106, '--': 1106, '++': 1106, '**': 1106, '+': 1106, '-': 1106, '<': 1106, '>': 1106, '<=': 1106, '>=': 1106, 'instanceof': 1106, 'in': 1106, '&': 1106, '|': 1106, '||': 1106, ',': 1106, ';': 1106, ')': 1106, ':': 1106, 'TemplateMiddle': 1106, 'TemplateTail': 1106, ']': 1106, '}': 1106, '?': 1106, '&&': 1106, '??': 1106, '^': 1106, '!==': 1106, '===': 1106, '!=': 1106, '==': 1106, '>>>': 1106, '>>': 1106, '<<': 1106, '%': 1106, '/': 1106, '*': 1106, '**=': 1106, '|=': 1106, '^=': 1106, '&=': 1106, '>>>=': 1106, '>>=': 1106, '<<=': 1106, '-=': 1106, '+=': 1106, '%=': 1106, '/=': 1106, '*=': 1106, '=': 1106, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, '(': 147, '.': 249, '[': 248, Nt('OptionalChain'): 1106, Nt('TemplateMiddleList'): 1106, Nt('TemplateSpans'): 1106, Nt('MultiplicativeOperator'): 1106, Nt('AssignmentOperator'): 1106, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 810, Nt('Arguments'): 809, ErrorToken: 1106},
+
+    # 149.
+
+    {'[': 250, 'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, '(': 147, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, Nt('IdentifierName'): 811, Nt('Arguments'): 812, Nt('TemplateLiteral'): 810, Nt('SubstitutionTemplate'): 685},
+
+    # 150.
+
+    {']': 814, ',': 791, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, '...': 152, Nt('AssignmentExpression', (('In', True),)): 815, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('SpreadElement'): 816},
+
+    # 151.
+
+    {']': 817, ',': 253},
+
+    # 152.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 818, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 153.
+
+    {'}': 819, ',': 254},
+
+    # 154.
+
+    {',': 1107, '}': 1107, '=': 103, Nt('Initializer', (('In', True),)): 820},
+
+    # 155.
+
+    {'*': 1108, '[': 1109, 'BigIntLiteral': 1110, 'NumericLiteral': 1111, 'StringLiteral': 1112, 'target': 1113, 'set': 1113, 'of': 1113, 'get': 1113, 'from': 1113, 'async': 1113, 'as': 1113, 'public': 1113, 'protected': 1113, 'private': 1113, 'package': 1113, 'interface': 1113, 'implements': 1113, 'static': 1113, 'let': 1113, 'yield': 1113, 'with': 1113, 'while': 1113, 'void': 1113, 'var': 1113, 'typeof': 1113, 'try': 1113, 'throw': 1113, 'this': 1113, 'switch': 1113, 'super': 1113, 'return': 1113, 'new': 1113, 'instanceof': 1113, 'in': 1113, 'import': 1113, 'if': 1113, 'function': 1113, 'for': 1113, 'finally': 1113, 'extends': 1113, 'export': 1113, 'enum': 1113, 'else': 1113, 'do': 1113, 'delete': 1113, 'default': 1113, 'debugger': 1113, 'continue': 1113, 'const': 1113, 'class': 1113, 'catch': 1113, 'case': 1113, 'break': 1113, 'await': 1113, 'NameWithEscape': 1113, 'NullLiteral': 1113, 'BooleanLiteral': 1113, 'Name': 1113, '(': 1104, ':': 1104, '=': 1065, '}': 1065, ',': 1065, Nt('ComputedPropertyName'): 713, Nt('IdentifierName'): 714, Nt('LiteralPropertyName'): 713, Nt('PropertyName'): 348, Nt('Initializer', (('In', True),)): 1065},
+
+    # 156.
+
+    {'(': 1104, ':': 1104, '=': 1065, '}': 1065, ',': 1065, '[': 113, 'BigIntLiteral': 718, 'NumericLiteral': 717, 'StringLiteral': 716, 'target': 715, 'set': 715, 'of': 715, 'get': 715, 'from': 715, 'async': 715, 'as': 715, 'public': 715, 'protected': 715, 'private': 715, 'package': 715, 'interface': 715, 'implements': 715, 'static': 715, 'let': 715, 'yield': 715, 'with': 715, 'while': 715, 'void': 715, 'var': 715, 'typeof': 715, 'try': 715, 'throw': 715, 'this': 715, 'switch': 715, 'super': 715, 'return': 715, 'new': 715, 'instanceof': 715, 'in': 715, 'import': 715, 'if': 715, 'function': 715, 'for': 715, 'finally': 715, 'extends': 715, 'export': 715, 'enum': 715, 'else': 715, 'do': 715, 'delete': 715, 'default': 715, 'debugger': 715, 'continue': 715, 'const': 715, 'class': 715, 'catch': 715, 'case': 715, 'break': 715, 'await': 715, 'NameWithEscape': 715, 'NullLiteral': 715, 'BooleanLiteral': 715, 'Name': 715, Nt('Initializer', (('In', True),)): 1065, Nt('ComputedPropertyName'): 713, Nt('IdentifierName'): 714, Nt('LiteralPropertyName'): 713, Nt('PropertyName'): 255},
+
+    # 157.
+
+    {'(': 1104, ':': 1104, '=': 1065, '}': 1065, ',': 1065, '[': 113, 'BigIntLiteral': 718, 'NumericLiteral': 717, 'StringLiteral': 716, 'target': 715, 'set': 715, 'of': 715, 'get': 715, 'from': 715, 'async': 715, 'as': 715, 'public': 715, 'protected': 715, 'private': 715, 'package': 715, 'interface': 715, 'implements': 715, 'static': 715, 'let': 715, 'yield': 715, 'with': 715, 'while': 715, 'void': 715, 'var': 715, 'typeof': 715, 'try': 715, 'throw': 715, 'this': 715, 'switch': 715, 'super': 715, 'return': 715, 'new': 715, 'instanceof': 715, 'in': 715, 'import': 715, 'if': 715, 'function': 715, 'for': 715, 'finally': 715, 'extends': 715, 'export': 715, 'enum': 715, 'else': 715, 'do': 715, 'delete': 715, 'default': 715, 'debugger': 715, 'continue': 715, 'const': 715, 'class': 715, 'catch': 715, 'case': 715, 'break': 715, 'await': 715, 'NameWithEscape': 715, 'NullLiteral': 715, 'BooleanLiteral': 715, 'Name': 715, Nt('Initializer', (('In', True),)): 1065, Nt('ComputedPropertyName'): 713, Nt('IdentifierName'): 714, Nt('LiteralPropertyName'): 713, Nt('PropertyName'): 256},
+
+    # 158.
+
+    {':': 257, '(': 258},
+
+    # 159.
+
+    {'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, 'StringLiteral': 716, 'NumericLiteral': 717, 'BigIntLiteral': 718, '[': 113, Nt('PropertyName'): 259, Nt('LiteralPropertyName'): 713, Nt('IdentifierName'): 714, Nt('ComputedPropertyName'): 713},
+
+    # 160.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 821, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 161.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 260},
+
+    # 162.
+
+    {'(': 262},
+
+    # 163.
+
+    {'(': 263, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('BindingIdentifier'): 264, Nt('Identifier'): 664},
+
+    # 164.
+
+    {'}': 826, 'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 268, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 269, 'from': 715, 'get': 270, 'of': 715, 'set': 271, 'target': 715, 'StringLiteral': 716, 'NumericLiteral': 717, 'BigIntLiteral': 718, '[': 113, '*': 159, 'PrivateIdentifier': 829, ';': 830, Nt('ClassBody'): 265, Nt('ClassElementList'): 266, Nt('ClassElement'): 827, Nt('MethodDefinition'): 828, Nt('PropertyName'): 267, Nt('LiteralPropertyName'): 713, Nt('IdentifierName'): 714, Nt('ComputedPropertyName'): 713, Nt('GeneratorMethod'): 750, Nt('AsyncMethod'): 750, Nt('AsyncGeneratorMethod'): 750, Nt('FieldDefinition'): 272, Nt('ClassElementName'): 273},
+
+    # 165.
+
+    {'{': 274},
+
+    # 166.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, Nt('LeftHandSideExpression'): 831, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63},
+
+    # 167.
+
+    {'{': 164, 'extends': 166, Nt('ClassTail'): 832, Nt('ClassHeritage'): 165},
+
+    # 168.
+
+    {'TemplateTail': 834, 'TemplateMiddle': 276, ',': 119, Nt('TemplateSpans'): 833, Nt('TemplateMiddleList'): 275},
+
+    # 169.
+
+    {')': 835, ',': 277},
+
+    # 170.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('BindingIdentifier'): 278, Nt('Identifier'): 664, Nt('BindingPattern'): 279, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 171.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 280, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 172.
+
+    {'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, Nt('IdentifierName'): 836},
+
+    # 173.
+
+    {'target': 837},
+
+    # 174.
+
+    {'=': 1085, '*=': 1085, '/=': 1085, '%=': 1085, '+=': 1085, '-=': 1085, '<<=': 1085, '>>=': 1085, '>>>=': 1085, '&=': 1085, '^=': 1085, '|=': 1085, '**=': 1085, '*': 1085, '/': 1085, '%': 1085, '<<': 1085, '>>': 1085, '>>>': 1085, '==': 1085, '!=': 1085, '===': 1085, '!==': 1085, '^': 1085, '??': 1085, '&&': 1085, '?': 1085, '}': 1085, ']': 1085, 'TemplateTail': 1085, 'TemplateMiddle': 1085, ':': 1085, ')': 1085, ';': 1085, ',': 1085, '||': 1085, '|': 1085, '&': 1085, 'in': 1085, 'instanceof': 1085, '>=': 1085, '<=': 1085, '>': 1085, '<': 1085, '-': 1085, '+': 1085, '**': 1085, '++': 1085, '--': 1085, 'of': 1085, '{': 1085, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, '.': 146, '[': 145, '(': 147, Nt('AssignmentOperator'): 1085, Nt('MultiplicativeOperator'): 1085, Nt('TemplateSpans'): 1085, Nt('TemplateMiddleList'): 1085, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 740, Nt('Arguments'): 838, ErrorToken: 1085},
+
+    # 175.
+
+    {'function': 1090, '[': 1065, '.': 1065, 'NoSubstitutionTemplate': 1065, 'TemplateHead': 1065, '(': 1065, '?.': 1065, '{': 1065, 'of': 1065, '--': 1065, '++': 1065, '**': 1065, '+': 1065, '-': 1065, '<': 1065, '>': 1065, '<=': 1065, '>=': 1065, 'instanceof': 1065, 'in': 1065, '&': 1065, '|': 1065, '||': 1065, ',': 1065, ';': 1065, ')': 1065, ':': 1065, 'TemplateMiddle': 1065, 'TemplateTail': 1065, ']': 1065, '}': 1065, '?': 1065, '&&': 1065, '??': 1065, '^': 1065, '!==': 1065, '===': 1065, '!=': 1065, '==': 1065, '>>>': 1065, '>>': 1065, '<<': 1065, '%': 1065, '/': 1065, '*': 1065, '**=': 1065, '|=': 1065, '^=': 1065, '&=': 1065, '>>>=': 1065, '>>=': 1065, '<<=': 1065, '-=': 1065, '+=': 1065, '%=': 1065, '/=': 1065, '*=': 1065, '=': 1065, Nt('TemplateLiteral'): 1065, Nt('SubstitutionTemplate'): 1065, Nt('Arguments'): 1065, Nt('OptionalChain'): 1065, Nt('TemplateMiddleList'): 1065, Nt('TemplateSpans'): 1065, Nt('MultiplicativeOperator'): 1065, Nt('AssignmentOperator'): 1065, ErrorToken: 1065},
+
+    # 176.
+
+    {'[': 171, '.': 172},
+
+    # 177.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 281, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 178.
+
+    {'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, 'PrivateIdentifier': 840, Nt('IdentifierName'): 839},
+
+    # 179.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 283, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 180.
+
+    {'--': 1082, '++': 1083, '*': 1084, '/': 1084, '%': 1084, '<<': 1084, '>>': 1084, '>>>': 1084, '==': 1084, '!=': 1084, '===': 1084, '!==': 1084, '^': 1084, '??': 1084, '&&': 1084, '?': 1084, '}': 1084, ']': 1084, 'TemplateTail': 1084, 'TemplateMiddle': 1084, ':': 1084, ')': 1084, ';': 1084, ',': 1084, '||': 1084, '|': 1084, '&': 1084, 'in': 1084, 'instanceof': 1084, '>=': 1084, '<=': 1084, '>': 1084, '<': 1084, '-': 1084, '+': 1084, '**': 1084, Nt('MultiplicativeOperator'): 1084, Nt('TemplateSpans'): 1084, Nt('TemplateMiddleList'): 1084, ErrorToken: 1084},
+
+    # 181.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('UnaryExpression'): 766, Nt('UpdateExpression'): 688, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 182.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('BitwiseORExpression', (('In', True),)): 284, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 183.
+
+    {')': 287, ',': 119},
+
+    # 184.
+
+    {'(': 288},
+
+    # 185.
+
+    {')': 289, ',': 119},
+
+    # 186.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('VariableDeclarationList', (('In', False),)): 307, Nt('VariableDeclaration', (('In', False),)): 844, Nt('BindingIdentifier'): 308, Nt('Identifier'): 664, Nt('BindingPattern'): 309, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667, Nt('ForBinding'): 310},
+
+    # 187.
+
+    {';': 311, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 312, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 188.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('BindingList', (('In', False),)): 313, Nt('LexicalBinding', (('In', False),)): 845, Nt('BindingIdentifier'): 314, Nt('Identifier'): 664, Nt('BindingPattern'): 315, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667, Nt('ForBinding'): 846},
+
+    # 189.
+
+    {'in': 316, 'of': 317},
+
+    # 190.
+
+    {'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '{': 52, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'const': 656, 'let': 704, 'var': 318, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 747, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 404, Nt('LetOrConst'): 320, Nt('ForDeclaration'): 319},
+
+    # 191.
+
+    {')': 321, ',': 119},
+
+    # 192.
+
+    {';': 847, ErrorToken: 847},
+
+    # 193.
+
+    {';': 848, ErrorToken: 848},
+
+    # 194.
+
+    {';': 849, ',': 119, ErrorToken: 849},
+
+    # 195.
+
+    {')': 322, ',': 119},
+
+    # 196.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('BindingIdentifier'): 86, Nt('Identifier'): 664},
+
+    # 197.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '*': 324, Nt('BindingIdentifier'): 323, Nt('Identifier'): 664},
+
+    # 198.
+
+    {';': 850, ',': 119, ErrorToken: 850},
+
+    # 199.
+
+    {'}': 1115, '{': 1115, 'var': 1115, ';': 1115, 'if': 1115, 'do': 1115, 'while': 1115, 'for': 1115, 'switch': 1115, 'continue': 1115, 'break': 1115, 'return': 1115, 'with': 1115, 'let': 1115, 'async': 1115, 'throw': 1115, 'try': 1115, 'debugger': 1115, 'function': 1115, 'class': 1115, 'const': 1115, 'this': 1115, 'Name': 1115, 'NameWithEscape': 1115, 'static': 1115, 'implements': 1115, 'interface': 1115, 'package': 1115, 'private': 1115, 'protected': 1115, 'public': 1115, 'as': 1115, 'from': 1115, 'get': 1115, 'of': 1115, 'set': 1115, 'target': 1115, 'NullLiteral': 1115, 'BooleanLiteral': 1115, 'NumericLiteral': 1115, 'BigIntLiteral': 1115, 'StringLiteral': 1115, '[': 1115, 'RegularExpressionLiteral': 1115, 'NoSubstitutionTemplate': 1115, 'TemplateHead': 1115, '(': 1115, 'super': 1115, 'new': 1115, 'import': 1115, '++': 1115, '--': 1115, 'delete': 1115, 'void': 1115, 'typeof': 1115, '+': 1115, '-': 1115, '~': 1115, '!': 1115, 'await': 1115, 'yield': 1115, 'export': 1115, End(): 1115, 'case': 1115, 'default': 1115, 'else': 1115, 'finally': 201, Nt('StatementListItem'): 1115, Nt('Statement'): 1115, Nt('BlockStatement'): 1115, Nt('Block'): 1115, Nt('VariableStatement'): 1115, Nt('EmptyStatement'): 1115, Nt('ExpressionStatement'): 1115, Nt('IfStatement'): 1115, Nt('BreakableStatement'): 1115, Nt('IterationStatement'): 1115, Nt('SwitchStatement'): 1115, Nt('ContinueStatement'): 1115, Nt('BreakStatement'): 1115, Nt('ReturnStatement'): 1115, Nt('WithStatement'): 1115, Nt('LabelledStatement'): 1115, Nt('LabelIdentifier'): 1115, Nt('ThrowStatement'): 1115, Nt('TryStatement'): 1115, Nt('DebuggerStatement'): 1115, Nt('Declaration'): 1115, Nt('HoistableDeclaration', (('Default', False),)): 1115, Nt('FunctionDeclaration', (('Default', False),)): 1115, Nt('GeneratorDeclaration', (('Default', False),)): 1115, Nt('AsyncFunctionDeclaration', (('Default', False),)): 1115, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 1115, Nt('ClassDeclaration', (('Default', False),)): 1115, Nt('LexicalDeclaration', (('In', True),)): 1115, Nt('LetOrConst'): 1115, Nt('Expression', (('In', True),)): 1115, Nt('AssignmentExpression', (('In', True),)): 1115, Nt('ConditionalExpression', (('In', True),)): 1115, Nt('ShortCircuitExpression', (('In', True),)): 1115, Nt('LogicalORExpression', (('In', True),)): 1115, Nt('LogicalANDExpression', (('In', True),)): 1115, Nt('BitwiseORExpression', (('In', True),)): 1115, Nt('BitwiseXORExpression', (('In', True),)): 1115, Nt('BitwiseANDExpression', (('In', True),)): 1115, Nt('EqualityExpression', (('In', True),)): 1115, Nt('RelationalExpression', (('In', True),)): 1115, Nt('ShiftExpression'): 1115, Nt('AdditiveExpression'): 1115, Nt('MultiplicativeExpression'): 1115, Nt('ExponentiationExpression'): 1115, Nt('UnaryExpression'): 1115, Nt('UpdateExpression'): 1115, Nt('LeftHandSideExpression'): 1115, Nt('NewExpression'): 1115, Nt('MemberExpression'): 1115, Nt('PrimaryExpression'): 1115, Nt('IdentifierReference'): 1115, Nt('Identifier'): 1115, Nt('Literal'): 1115, Nt('ArrayLiteral'): 1115, Nt('ObjectLiteral'): 1115, Nt('FunctionExpression'): 1115, Nt('ClassExpression'): 1115, Nt('GeneratorExpression'): 1115, Nt('AsyncFunctionExpression'): 1115, Nt('AsyncGeneratorExpression'): 1115, Nt('TemplateLiteral'): 1115, Nt('SubstitutionTemplate'): 1115, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 1115, Nt('SuperProperty'): 1115, Nt('MetaProperty'): 1115, Nt('NewTarget'): 1115, Nt('CallExpression'): 1115, Nt('CoverCallExpressionAndAsyncArrowHead'): 1115, Nt('SuperCall'): 1115, Nt('ImportCall'): 1115, Nt('OptionalExpression'): 1115, Nt('AwaitExpression'): 1115, Nt('CoalesceExpression', (('In', True),)): 1115, Nt('CoalesceExpressionHead', (('In', True),)): 1115, Nt('YieldExpression', (('In', True),)): 1115, Nt('ArrowFunction', (('In', True),)): 1115, Nt('ArrowParameters'): 1115, Nt('BindingIdentifier'): 1115, Nt('AsyncArrowFunction', (('In', True),)): 1115, Nt('ModuleItem'): 1115, Nt('ImportDeclaration'): 1115, Nt('ExportDeclaration'): 1115, Nt('CaseClause'): 1115, Nt('DefaultClause'): 1115, Nt('CaseClauses'): 1115, Nt('Finally'): 851},
+
+    # 200.
+
+    {'(': 325, '{': 4, Nt('Block'): 852},
+
+    # 201.
+
+    {'{': 4, Nt('Block'): 853},
+
+    # 202.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 326},
+
+    # 203.
+
+    {'(': 327},
+
+    # 204.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('LexicalBinding', (('In', True),)): 854, Nt('BindingIdentifier'): 90, Nt('Identifier'): 664, Nt('BindingPattern'): 91, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 205.
+
+    {';': 855, ErrorToken: 855},
+
+    # 206.
+
+    {'StringLiteral': 701, Nt('ModuleSpecifier'): 856},
+
+    # 207.
+
+    {'*': 94, '{': 95, Nt('NameSpaceImport'): 857, Nt('NamedImports'): 858},
+
+    # 208.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('ImportedBinding'): 859, Nt('BindingIdentifier'): 698, Nt('Identifier'): 664},
+
+    # 209.
+
+    {'}': 860, ',': 328},
+
+    # 210.
+
+    {'as': 329},
+
+    # 211.
+
+    {';': 861, ErrorToken: 861},
+
+    # 212.
+
+    {';': 862, ErrorToken: 862},
+
+    # 213.
+
+    {'}': 863, ',': 330},
+
+    # 214.
+
+    {',': 1116, '}': 1116, 'as': 331},
+
+    # 215.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '(': 333, '*': 334, Nt('BindingIdentifier'): 332, Nt('Identifier'): 664},
+
+    # 216.
+
+    {'function': 1117},
+
+    # 217.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 164, 'extends': 166, Nt('BindingIdentifier'): 335, Nt('Identifier'): 664, Nt('ClassTail'): 864, Nt('ClassHeritage'): 165},
+
+    # 218.
+
+    {'Name': 108, 'NameWithEscape': 108, 'let': 108, 'static': 108, 'implements': 108, 'interface': 108, 'package': 108, 'private': 108, 'protected': 108, 'public': 108, 'as': 108, 'async': 109, 'from': 108, 'get': 109, 'of': 108, 'set': 109, 'target': 108, 'yield': 110, 'await': 111, 'BooleanLiteral': 715, 'NullLiteral': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'StringLiteral': 716, 'NumericLiteral': 717, 'BigIntLiteral': 718, '[': 113, '}': 866, '...': 105, Nt('BindingProperty'): 865, Nt('SingleNameBinding'): 712, Nt('BindingIdentifier'): 107, Nt('Identifier'): 664, Nt('PropertyName'): 112, Nt('LiteralPropertyName'): 713, Nt('IdentifierName'): 714, Nt('ComputedPropertyName'): 713, Nt('BindingRestProperty'): 337},
+
+    # 219.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('BindingElement'): 867, Nt('SingleNameBinding'): 723, Nt('BindingIdentifier'): 107, Nt('Identifier'): 664, Nt('BindingPattern'): 118, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 220.
+
+    {']': 868},
+
+    # 221.
+
+    {']': 869},
+
+    # 222.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, ',': 720, ']': 871, '...': 116, Nt('BindingElisionElement'): 870, Nt('BindingElement'): 722, Nt('SingleNameBinding'): 723, Nt('BindingIdentifier'): 107, Nt('Identifier'): 664, Nt('BindingPattern'): 118, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667, Nt('Elision'): 338, Nt('BindingRestElement'): 339},
+
+    # 223.
+
+    {':': 340},
+
+    # 224.
+
+    {'||': 1118, ',': 1118, ';': 1118, ')': 1118, ':': 1118, 'TemplateMiddle': 1118, 'TemplateTail': 1118, ']': 1118, '}': 1118, '?': 1118, '&&': 122, Nt('TemplateMiddleList'): 1118, Nt('TemplateSpans'): 1118, ErrorToken: 1118},
+
+    # 225.
+
+    {'&&': 1073, '?': 1073, '}': 1073, ']': 1073, 'TemplateTail': 1073, 'TemplateMiddle': 1073, ':': 1073, ')': 1073, ';': 1073, ',': 1073, '||': 1073, '|': 123, Nt('TemplateSpans'): 1073, Nt('TemplateMiddleList'): 1073, ErrorToken: 1073},
+
+    # 226.
+
+    {'&&': 1119, '?': 1119, '}': 1119, ']': 1119, 'TemplateTail': 1119, 'TemplateMiddle': 1119, ':': 1119, ')': 1119, ';': 1119, ',': 1119, '||': 1119, '|': 123, Nt('TemplateSpans'): 1119, Nt('TemplateMiddleList'): 1119, ErrorToken: 1119},
+
+    # 227.
+
+    {'|': 1120, '||': 1120, ',': 1120, ';': 1120, ')': 1120, ':': 1120, 'TemplateMiddle': 1120, 'TemplateTail': 1120, ']': 1120, '}': 1120, '?': 1120, '&&': 1120, '??': 1120, '^': 124, Nt('TemplateMiddleList'): 1120, Nt('TemplateSpans'): 1120, ErrorToken: 1120},
+
+    # 228.
+
+    {'^': 1121, '??': 1121, '&&': 1121, '?': 1121, '}': 1121, ']': 1121, 'TemplateTail': 1121, 'TemplateMiddle': 1121, ':': 1121, ')': 1121, ';': 1121, ',': 1121, '||': 1121, '|': 1121, '&': 125, Nt('TemplateSpans'): 1121, Nt('TemplateMiddleList'): 1121, ErrorToken: 1121},
+
+    # 229.
+
+    {'&': 1122, '|': 1122, '||': 1122, ',': 1122, ';': 1122, ')': 1122, ':': 1122, 'TemplateMiddle': 1122, 'TemplateTail': 1122, ']': 1122, '}': 1122, '?': 1122, '&&': 1122, '??': 1122, '^': 1122, '!==': 129, '===': 128, '!=': 127, '==': 126, Nt('TemplateMiddleList'): 1122, Nt('TemplateSpans'): 1122, ErrorToken: 1122},
+
+    # 230.
+
+    {'==': 1123, '!=': 1123, '===': 1123, '!==': 1123, '^': 1123, '??': 1123, '&&': 1123, '?': 1123, '}': 1123, ']': 1123, 'TemplateTail': 1123, 'TemplateMiddle': 1123, ':': 1123, ')': 1123, ';': 1123, ',': 1123, '||': 1123, '|': 1123, '&': 1123, 'in': 135, 'instanceof': 134, '>=': 133, '<=': 132, '>': 131, '<': 130, Nt('TemplateSpans'): 1123, Nt('TemplateMiddleList'): 1123, ErrorToken: 1123},
+
+    # 231.
+
+    {'==': 1124, '!=': 1124, '===': 1124, '!==': 1124, '^': 1124, '??': 1124, '&&': 1124, '?': 1124, '}': 1124, ']': 1124, 'TemplateTail': 1124, 'TemplateMiddle': 1124, ':': 1124, ')': 1124, ';': 1124, ',': 1124, '||': 1124, '|': 1124, '&': 1124, 'in': 135, 'instanceof': 134, '>=': 133, '<=': 132, '>': 131, '<': 130, Nt('TemplateSpans'): 1124, Nt('TemplateMiddleList'): 1124, ErrorToken: 1124},
+
+    # 232.
+
+    {'==': 1125, '!=': 1125, '===': 1125, '!==': 1125, '^': 1125, '??': 1125, '&&': 1125, '?': 1125, '}': 1125, ']': 1125, 'TemplateTail': 1125, 'TemplateMiddle': 1125, ':': 1125, ')': 1125, ';': 1125, ',': 1125, '||': 1125, '|': 1125, '&': 1125, 'in': 135, 'instanceof': 134, '>=': 133, '<=': 132, '>': 131, '<': 130, Nt('TemplateSpans'): 1125, Nt('TemplateMiddleList'): 1125, ErrorToken: 1125},
+
+    # 233.
+
+    {'==': 1126, '!=': 1126, '===': 1126, '!==': 1126, '^': 1126, '??': 1126, '&&': 1126, '?': 1126, '}': 1126, ']': 1126, 'TemplateTail': 1126, 'TemplateMiddle': 1126, ':': 1126, ')': 1126, ';': 1126, ',': 1126, '||': 1126, '|': 1126, '&': 1126, 'in': 135, 'instanceof': 134, '>=': 133, '<=': 132, '>': 131, '<': 130, Nt('TemplateSpans'): 1126, Nt('TemplateMiddleList'): 1126, ErrorToken: 1126},
+
+    # 234.
+
+    {'<': 1127, '>': 1127, '<=': 1127, '>=': 1127, 'instanceof': 1127, 'in': 1127, '&': 1127, '|': 1127, '||': 1127, ',': 1127, ';': 1127, ')': 1127, ':': 1127, 'TemplateMiddle': 1127, 'TemplateTail': 1127, ']': 1127, '}': 1127, '?': 1127, '&&': 1127, '??': 1127, '^': 1127, '!==': 1127, '===': 1127, '!=': 1127, '==': 1127, '>>>': 138, '>>': 137, '<<': 136, Nt('TemplateMiddleList'): 1127, Nt('TemplateSpans'): 1127, ErrorToken: 1127},
+
+    # 235.
+
+    {'<': 1128, '>': 1128, '<=': 1128, '>=': 1128, 'instanceof': 1128, 'in': 1128, '&': 1128, '|': 1128, '||': 1128, ',': 1128, ';': 1128, ')': 1128, ':': 1128, 'TemplateMiddle': 1128, 'TemplateTail': 1128, ']': 1128, '}': 1128, '?': 1128, '&&': 1128, '??': 1128, '^': 1128, '!==': 1128, '===': 1128, '!=': 1128, '==': 1128, '>>>': 138, '>>': 137, '<<': 136, Nt('TemplateMiddleList'): 1128, Nt('TemplateSpans'): 1128, ErrorToken: 1128},
+
+    # 236.
+
+    {'<': 1129, '>': 1129, '<=': 1129, '>=': 1129, 'instanceof': 1129, 'in': 1129, '&': 1129, '|': 1129, '||': 1129, ',': 1129, ';': 1129, ')': 1129, ':': 1129, 'TemplateMiddle': 1129, 'TemplateTail': 1129, ']': 1129, '}': 1129, '?': 1129, '&&': 1129, '??': 1129, '^': 1129, '!==': 1129, '===': 1129, '!=': 1129, '==': 1129, '>>>': 138, '>>': 137, '<<': 136, Nt('TemplateMiddleList'): 1129, Nt('TemplateSpans'): 1129, ErrorToken: 1129},
+
+    # 237.
+
+    {'<': 1130, '>': 1130, '<=': 1130, '>=': 1130, 'instanceof': 1130, 'in': 1130, '&': 1130, '|': 1130, '||': 1130, ',': 1130, ';': 1130, ')': 1130, ':': 1130, 'TemplateMiddle': 1130, 'TemplateTail': 1130, ']': 1130, '}': 1130, '?': 1130, '&&': 1130, '??': 1130, '^': 1130, '!==': 1130, '===': 1130, '!=': 1130, '==': 1130, '>>>': 138, '>>': 137, '<<': 136, Nt('TemplateMiddleList'): 1130, Nt('TemplateSpans'): 1130, ErrorToken: 1130},
+
+    # 238.
+
+    {'<': 1131, '>': 1131, '<=': 1131, '>=': 1131, 'instanceof': 1131, 'in': 1131, '&': 1131, '|': 1131, '||': 1131, ',': 1131, ';': 1131, ')': 1131, ':': 1131, 'TemplateMiddle': 1131, 'TemplateTail': 1131, ']': 1131, '}': 1131, '?': 1131, '&&': 1131, '??': 1131, '^': 1131, '!==': 1131, '===': 1131, '!=': 1131, '==': 1131, '>>>': 138, '>>': 137, '<<': 136, Nt('TemplateMiddleList'): 1131, Nt('TemplateSpans'): 1131, ErrorToken: 1131},
+
+    # 239.
+
+    {'<': 1132, '>': 1132, '<=': 1132, '>=': 1132, 'instanceof': 1132, 'in': 1132, '&': 1132, '|': 1132, '||': 1132, ',': 1132, ';': 1132, ')': 1132, ':': 1132, 'TemplateMiddle': 1132, 'TemplateTail': 1132, ']': 1132, '}': 1132, '?': 1132, '&&': 1132, '??': 1132, '^': 1132, '!==': 1132, '===': 1132, '!=': 1132, '==': 1132, '>>>': 138, '>>': 137, '<<': 136, Nt('TemplateMiddleList'): 1132, Nt('TemplateSpans'): 1132, ErrorToken: 1132},
+
+    # 240.
+
+    {'<<': 1133, '>>': 1133, '>>>': 1133, '==': 1133, '!=': 1133, '===': 1133, '!==': 1133, '^': 1133, '??': 1133, '&&': 1133, '?': 1133, '}': 1133, ']': 1133, 'TemplateTail': 1133, 'TemplateMiddle': 1133, ':': 1133, ')': 1133, ';': 1133, ',': 1133, '||': 1133, '|': 1133, '&': 1133, 'in': 1133, 'instanceof': 1133, '>=': 1133, '<=': 1133, '>': 1133, '<': 1133, '-': 140, '+': 139, Nt('TemplateSpans'): 1133, Nt('TemplateMiddleList'): 1133, ErrorToken: 1133},
+
+    # 241.
+
+    {'<<': 1134, '>>': 1134, '>>>': 1134, '==': 1134, '!=': 1134, '===': 1134, '!==': 1134, '^': 1134, '??': 1134, '&&': 1134, '?': 1134, '}': 1134, ']': 1134, 'TemplateTail': 1134, 'TemplateMiddle': 1134, ':': 1134, ')': 1134, ';': 1134, ',': 1134, '||': 1134, '|': 1134, '&': 1134, 'in': 1134, 'instanceof': 1134, '>=': 1134, '<=': 1134, '>': 1134, '<': 1134, '-': 140, '+': 139, Nt('TemplateSpans'): 1134, Nt('TemplateMiddleList'): 1134, ErrorToken: 1134},
+
+    # 242.
+
+    {'<<': 1135, '>>': 1135, '>>>': 1135, '==': 1135, '!=': 1135, '===': 1135, '!==': 1135, '^': 1135, '??': 1135, '&&': 1135, '?': 1135, '}': 1135, ']': 1135, 'TemplateTail': 1135, 'TemplateMiddle': 1135, ':': 1135, ')': 1135, ';': 1135, ',': 1135, '||': 1135, '|': 1135, '&': 1135, 'in': 1135, 'instanceof': 1135, '>=': 1135, '<=': 1135, '>': 1135, '<': 1135, '-': 140, '+': 139, Nt('TemplateSpans'): 1135, Nt('TemplateMiddleList'): 1135, ErrorToken: 1135},
+
+    # 243.
+
+    {'+': 1136, '-': 1136, '<': 1136, '>': 1136, '<=': 1136, '>=': 1136, 'instanceof': 1136, 'in': 1136, '&': 1136, '|': 1136, '||': 1136, ',': 1136, ';': 1136, ')': 1136, ':': 1136, 'TemplateMiddle': 1136, 'TemplateTail': 1136, ']': 1136, '}': 1136, '?': 1136, '&&': 1136, '??': 1136, '^': 1136, '!==': 1136, '===': 1136, '!=': 1136, '==': 1136, '>>>': 1136, '>>': 1136, '<<': 1136, '%': 727, '/': 726, '*': 725, Nt('TemplateMiddleList'): 1136, Nt('TemplateSpans'): 1136, Nt('MultiplicativeOperator'): 141, ErrorToken: 1136},
+
+    # 244.
+
+    {'+': 1137, '-': 1137, '<': 1137, '>': 1137, '<=': 1137, '>=': 1137, 'instanceof': 1137, 'in': 1137, '&': 1137, '|': 1137, '||': 1137, ',': 1137, ';': 1137, ')': 1137, ':': 1137, 'TemplateMiddle': 1137, 'TemplateTail': 1137, ']': 1137, '}': 1137, '?': 1137, '&&': 1137, '??': 1137, '^': 1137, '!==': 1137, '===': 1137, '!=': 1137, '==': 1137, '>>>': 1137, '>>': 1137, '<<': 1137, '%': 727, '/': 726, '*': 725, Nt('TemplateMiddleList'): 1137, Nt('TemplateSpans'): 1137, Nt('MultiplicativeOperator'): 141, ErrorToken: 1137},
+
+    # 245.
+
+    {']': 872, ',': 119},
+
+    # 246.
+
+    {')': 873, ',': 341},
+
+    # 247.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 874, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 248.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 342, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 249.
+
+    {'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, Nt('IdentifierName'): 875},
+
+    # 250.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 343, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 251.
+
+    {'(': 344, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '*': 346, Nt('BindingIdentifier'): 345, Nt('Identifier'): 664},
+
+    # 252.
+
+    {'=>': 1138},
+
+    # 253.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, ',': 720, '...': 152, ']': 878, Nt('AssignmentExpression', (('In', True),)): 876, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('Elision'): 347, Nt('SpreadElement'): 877},
+
+    # 254.
+
+    {'Name': 108, 'NameWithEscape': 108, 'let': 108, 'static': 108, 'implements': 108, 'interface': 108, 'package': 108, 'private': 108, 'protected': 108, 'public': 108, 'as': 108, 'async': 155, 'from': 108, 'get': 156, 'of': 108, 'set': 157, 'target': 108, 'BooleanLiteral': 715, 'NullLiteral': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'StringLiteral': 716, 'NumericLiteral': 717, 'BigIntLiteral': 718, '[': 113, '*': 159, '...': 160, '}': 880, Nt('PropertyDefinition'): 879, Nt('IdentifierReference'): 154, Nt('Identifier'): 747, Nt('CoverInitializedName'): 748, Nt('PropertyName'): 158, Nt('LiteralPropertyName'): 713, Nt('IdentifierName'): 714, Nt('ComputedPropertyName'): 713, Nt('MethodDefinition'): 749, Nt('GeneratorMethod'): 750, Nt('AsyncMethod'): 750, Nt('AsyncGeneratorMethod'): 750},
+
+    # 255.
+
+    {'(': 350},
+
+    # 256.
+
+    {'(': 351},
+
+    # 257.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 881, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 258.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 882, Nt('UniqueFormalParameters'): 352},
+
+    # 259.
+
+    {'(': 353},
+
+    # 260.
+
+    {')': 354},
+
+    # 261.
+
+    {')': 1139, ',': 355},
+
+    # 262.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 356},
+
+    # 263.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 357},
+
+    # 264.
+
+    {'(': 358},
+
+    # 265.
+
+    {'}': 883},
+
+    # 266.
+
+    {'}': 1140, ';': 830, 'PrivateIdentifier': 829, '*': 159, '[': 113, 'BigIntLiteral': 718, 'NumericLiteral': 717, 'StringLiteral': 716, 'target': 715, 'set': 271, 'of': 715, 'get': 270, 'from': 715, 'async': 269, 'as': 715, 'public': 715, 'protected': 715, 'private': 715, 'package': 715, 'interface': 715, 'implements': 715, 'static': 268, 'let': 715, 'yield': 715, 'with': 715, 'while': 715, 'void': 715, 'var': 715, 'typeof': 715, 'try': 715, 'throw': 715, 'this': 715, 'switch': 715, 'super': 715, 'return': 715, 'new': 715, 'instanceof': 715, 'in': 715, 'import': 715, 'if': 715, 'function': 715, 'for': 715, 'finally': 715, 'extends': 715, 'export': 715, 'enum': 715, 'else': 715, 'do': 715, 'delete': 715, 'default': 715, 'debugger': 715, 'continue': 715, 'const': 715, 'class': 715, 'catch': 715, 'case': 715, 'break': 715, 'await': 715, 'NameWithEscape': 715, 'NullLiteral': 715, 'BooleanLiteral': 715, 'Name': 715, Nt('ClassElementName'): 273, Nt('FieldDefinition'): 272, Nt('AsyncGeneratorMethod'): 750, Nt('AsyncMethod'): 750, Nt('GeneratorMethod'): 750, Nt('ComputedPropertyName'): 713, Nt('IdentifierName'): 714, Nt('LiteralPropertyName'): 713, Nt('PropertyName'): 267, Nt('MethodDefinition'): 828, Nt('ClassElement'): 884},
+
+    # 267.
+
+    {';': 1141, '=': 1141, '(': 258, Nt('Initializer', (('In', True),)): 1141, ErrorToken: 1141},
+
+    # 268.
+
+    {'(': 1104, '=': 1104, ';': 1104, 'PrivateIdentifier': 829, '*': 159, '[': 113, 'BigIntLiteral': 718, 'NumericLiteral': 717, 'StringLiteral': 716, 'target': 715, 'set': 271, 'of': 715, 'get': 270, 'from': 715, 'async': 269, 'as': 715, 'public': 715, 'protected': 715, 'private': 715, 'package': 715, 'interface': 715, 'implements': 715, 'static': 715, 'let': 715, 'yield': 715, 'with': 715, 'while': 715, 'void': 715, 'var': 715, 'typeof': 715, 'try': 715, 'throw': 715, 'this': 715, 'switch': 715, 'super': 715, 'return': 715, 'new': 715, 'instanceof': 715, 'in': 715, 'import': 715, 'if': 715, 'function': 715, 'for': 715, 'finally': 715, 'extends': 715, 'export': 715, 'enum': 715, 'else': 715, 'do': 715, 'delete': 715, 'default': 715, 'debugger': 715, 'continue': 715, 'const': 715, 'class': 715, 'catch': 715, 'case': 715, 'break': 715, 'await': 715, 'NameWithEscape': 715, 'NullLiteral': 715, 'BooleanLiteral': 715, 'Name': 715, Nt('Initializer', (('In', True),)): 1104, Nt('ClassElementName'): 273, Nt('FieldDefinition'): 359, Nt('AsyncGeneratorMethod'): 750, Nt('AsyncMethod'): 750, Nt('GeneratorMethod'): 750, Nt('ComputedPropertyName'): 713, Nt('IdentifierName'): 714, Nt('LiteralPropertyName'): 713, Nt('PropertyName'): 267, Nt('MethodDefinition'): 885, ErrorToken: 1104},
+
+    # 269.
+
+    {'*': 1108, '[': 1109, 'BigIntLiteral': 1110, 'NumericLiteral': 1111, 'StringLiteral': 1112, 'target': 1113, 'set': 1113, 'of': 1113, 'get': 1113, 'from': 1113, 'async': 1113, 'as': 1113, 'public': 1113, 'protected': 1113, 'private': 1113, 'package': 1113, 'interface': 1113, 'implements': 1113, 'static': 1113, 'let': 1113, 'yield': 1113, 'with': 1113, 'while': 1113, 'void': 1113, 'var': 1113, 'typeof': 1113, 'try': 1113, 'throw': 1113, 'this': 1113, 'switch': 1113, 'super': 1113, 'return': 1113, 'new': 1113, 'instanceof': 1113, 'in': 1113, 'import': 1113, 'if': 1113, 'function': 1113, 'for': 1113, 'finally': 1113, 'extends': 1113, 'export': 1113, 'enum': 1113, 'else': 1113, 'do': 1113, 'delete': 1113, 'default': 1113, 'debugger': 1113, 'continue': 1113, 'const': 1113, 'class': 1113, 'catch': 1113, 'case': 1113, 'break': 1113, 'await': 1113, 'NameWithEscape': 1113, 'NullLiteral': 1113, 'BooleanLiteral': 1113, 'Name': 1113, '(': 1104, '=': 1104, ';': 1104, Nt('ComputedPropertyName'): 713, Nt('IdentifierName'): 714, Nt('LiteralPropertyName'): 713, Nt('PropertyName'): 348, Nt('Initializer', (('In', True),)): 1104, ErrorToken: 1104},
+
+    # 270.
+
+    {'(': 1104, '=': 1104, ';': 1104, '[': 113, 'BigIntLiteral': 718, 'NumericLiteral': 717, 'StringLiteral': 716, 'target': 715, 'set': 715, 'of': 715, 'get': 715, 'from': 715, 'async': 715, 'as': 715, 'public': 715, 'protected': 715, 'private': 715, 'package': 715, 'interface': 715, 'implements': 715, 'static': 715, 'let': 715, 'yield': 715, 'with': 715, 'while': 715, 'void': 715, 'var': 715, 'typeof': 715, 'try': 715, 'throw': 715, 'this': 715, 'switch': 715, 'super': 715, 'return': 715, 'new': 715, 'instanceof': 715, 'in': 715, 'import': 715, 'if': 715, 'function': 715, 'for': 715, 'finally': 715, 'extends': 715, 'export': 715, 'enum': 715, 'else': 715, 'do': 715, 'delete': 715, 'default': 715, 'debugger': 715, 'continue': 715, 'const': 715, 'class': 715, 'catch': 715, 'case': 715, 'break': 715, 'await': 715, 'NameWithEscape': 715, 'NullLiteral': 715, 'BooleanLiteral': 715, 'Name': 715, Nt('Initializer', (('In', True),)): 1104, Nt('ComputedPropertyName'): 713, Nt('IdentifierName'): 714, Nt('LiteralPropertyName'): 713, Nt('PropertyName'): 255, ErrorToken: 1104},
+
+    # 271.
+
+    {'(': 1104, '=': 1104, ';': 1104, '[': 113, 'BigIntLiteral': 718, 'NumericLiteral': 717, 'StringLiteral': 716, 'target': 715, 'set': 715, 'of': 715, 'get': 715, 'from': 715, 'async': 715, 'as': 715, 'public': 715, 'protected': 715, 'private': 715, 'package': 715, 'interface': 715, 'implements': 715, 'static': 715, 'let': 715, 'yield': 715, 'with': 715, 'while': 715, 'void': 715, 'var': 715, 'typeof': 715, 'try': 715, 'throw': 715, 'this': 715, 'switch': 715, 'super': 715, 'return': 715, 'new': 715, 'instanceof': 715, 'in': 715, 'import': 715, 'if': 715, 'function': 715, 'for': 715, 'finally': 715, 'extends': 715, 'export': 715, 'enum': 715, 'else': 715, 'do': 715, 'delete': 715, 'default': 715, 'debugger': 715, 'continue': 715, 'const': 715, 'class': 715, 'catch': 715, 'case': 715, 'break': 715, 'await': 715, 'NameWithEscape': 715, 'NullLiteral': 715, 'BooleanLiteral': 715, 'Name': 715, Nt('Initializer', (('In', True),)): 1104, Nt('ComputedPropertyName'): 713, Nt('IdentifierName'): 714, Nt('LiteralPropertyName'): 713, Nt('PropertyName'): 256, ErrorToken: 1104},
+
+    # 272.
+
+    {';': 886, ErrorToken: 886},
+
+    # 273.
+
+    {';': 1142, '=': 103, Nt('Initializer', (('In', True),)): 887, ErrorToken: 1142},
+
+    # 274.
+
+    {'}': 888, 'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 268, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 269, 'from': 715, 'get': 270, 'of': 715, 'set': 271, 'target': 715, 'StringLiteral': 716, 'NumericLiteral': 717, 'BigIntLiteral': 718, '[': 113, '*': 159, 'PrivateIdentifier': 829, ';': 830, Nt('ClassBody'): 360, Nt('ClassElementList'): 266, Nt('ClassElement'): 827, Nt('MethodDefinition'): 828, Nt('PropertyName'): 267, Nt('LiteralPropertyName'): 713, Nt('IdentifierName'): 714, Nt('ComputedPropertyName'): 713, Nt('GeneratorMethod'): 750, Nt('AsyncMethod'): 750, Nt('AsyncGeneratorMethod'): 750, Nt('FieldDefinition'): 272, Nt('ClassElementName'): 273},
+
+    # 275.
+
+    {'TemplateTail': 889, 'TemplateMiddle': 361},
+
+    # 276.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 362, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 277.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, ')': 890, '...': 363, Nt('AssignmentExpression', (('In', True),)): 798, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 278.
+
+    {')': 891},
+
+    # 279.
+
+    {')': 892},
+
+    # 280.
+
+    {']': 893, ',': 119},
+
+    # 281.
+
+    {']': 894, ',': 119},
+
+    # 282.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 50, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '{': 364, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 934, Nt('AsyncConciseBody', (('In', True),)): 895},
+
+    # 283.
+
+    {')': 896},
+
+    # 284.
+
+    {',': 1143, ';': 1143, ')': 1143, ':': 1143, 'TemplateMiddle': 1143, 'TemplateTail': 1143, ']': 1143, '}': 1143, '?': 1143, '??': 1143, '|': 123, Nt('TemplateMiddleList'): 1143, Nt('TemplateSpans'): 1143, ErrorToken: 1143},
+
+    # 285.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 897, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 286.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 50, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '{': 365, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 937, Nt('ConciseBody', (('In', True),)): 898},
+
+    # 287.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'function': 196, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('FunctionDeclaration', (('Default', False),)): 367, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 366},
+
+    # 288.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 368, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 289.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 899},
+
+    # 290.
+
+    {';': 369, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 370, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 291.
+
+    {';': 371, ',': 372},
+
+    # 292.
+
+    {',': 1144, ';': 1144, 'in': 1144, '?': 373},
+
+    # 293.
+
+    {'?': 1145, 'in': 1145, ';': 1145, ',': 1145, '||': 374},
+
+    # 294.
+
+    {'||': 1146, ',': 1146, ';': 1146, 'in': 1146, '?': 1146, '&&': 375},
+
+    # 295.
+
+    {'??': 1147, '&&': 1148, '?': 1148, 'in': 1148, ';': 1148, ',': 1148, '||': 1148, '|': 376},
+
+    # 296.
+
+    {'|': 1149, '||': 1149, ',': 1149, ';': 1149, 'in': 1149, '?': 1149, '&&': 1149, '??': 1149, '^': 377},
+
+    # 297.
+
+    {'^': 1150, '??': 1150, '&&': 1150, '?': 1150, 'in': 1150, ';': 1150, ',': 1150, '||': 1150, '|': 1150, '&': 378},
+
+    # 298.
+
+    {'&': 1151, '|': 1151, '||': 1151, ',': 1151, ';': 1151, 'in': 1151, '?': 1151, '&&': 1151, '??': 1151, '^': 1151, '!==': 382, '===': 381, '!=': 380, '==': 379},
+
+    # 299.
+
+    {'==': 1152, '!=': 1152, '===': 1152, '!==': 1152, '^': 1152, '??': 1152, '&&': 1152, '?': 1152, 'in': 1152, ';': 1152, ',': 1152, '||': 1152, '|': 1152, '&': 1152, 'instanceof': 387, '>=': 386, '<=': 385, '>': 384, '<': 383},
+
+    # 300.
+
+    {'<': 1153, '>': 1153, '<=': 1153, '>=': 1153, 'instanceof': 1153, '&': 1153, '|': 1153, '||': 1153, ',': 1153, ';': 1153, 'in': 1153, '?': 1153, '&&': 1153, '??': 1153, '^': 1153, '!==': 1153, '===': 1153, '!=': 1153, '==': 1153, '>>>': 138, '>>': 137, '<<': 136},
+
+    # 301.
+
+    {'await': 1088, 'yield': 1089, 'target': 1035, 'set': 1035, 'of': 640, 'get': 1035, 'from': 1035, 'async': 1035, 'as': 1035, 'public': 1035, 'protected': 1035, 'private': 1035, 'package': 1035, 'interface': 1035, 'implements': 1035, 'static': 1035, 'let': 1035, 'NameWithEscape': 1035, 'Name': 1035, 'function': 1090, '=': 1065, '*=': 1065, '/=': 1065, '%=': 1065, '+=': 1065, '-=': 1065, '<<=': 1065, '>>=': 1065, '>>>=': 1065, '&=': 1065, '^=': 1065, '|=': 1065, '**=': 1065, '*': 1065, '/': 1065, '%': 1065, '<<': 1065, '>>': 1065, '>>>': 1065, '==': 1065, '!=': 1065, '===': 1065, '!==': 1065, '^': 1065, '??': 1065, '&&': 1065, '?': 1065, '}': 1065, ']': 1065, 'TemplateTail': 1065, 'TemplateMiddle': 1065, ':': 1065, ')': 1065, ';': 1065, ',': 1065, '||': 1065, '|': 1065, '&': 1065, 'in': 1065, 'instanceof': 1065, '>=': 1065, '<=': 1065, '>': 1065, '<': 1065, '-': 1065, '+': 1065, '**': 1065, '++': 1065, '--': 1065, '{': 1065, '?.': 1065, '(': 1065, 'TemplateHead': 1065, 'NoSubstitutionTemplate': 1065, '.': 1065, '[': 1065, '=>': 1065, Nt('Identifier'): 664, Nt('BindingIdentifier'): 813, Nt('AsyncArrowBindingIdentifier'): 467, Nt('AssignmentOperator'): 1065, Nt('MultiplicativeOperator'): 1065, Nt('TemplateSpans'): 1065, Nt('TemplateMiddleList'): 1065, Nt('OptionalChain'): 1065, Nt('Arguments'): 1065, Nt('SubstitutionTemplate'): 1065, Nt('TemplateLiteral'): 1065, ErrorToken: 1065},
+
+    # 302.
+
+    {'=>': 1154, '(': 1095, '[': 1095, '.': 1095, 'NoSubstitutionTemplate': 1095, 'TemplateHead': 1095, '?.': 1095, '{': 1095, 'of': 1095, '--': 1095, '++': 1095, '**': 1095, '+': 1095, '-': 1095, '<': 1095, '>': 1095, '<=': 1095, '>=': 1095, 'instanceof': 1095, 'in': 1095, '&': 1095, '|': 1095, '||': 1095, ',': 1095, ';': 1095, ')': 1095, ':': 1095, 'TemplateMiddle': 1095, 'TemplateTail': 1095, ']': 1095, '}': 1095, '?': 1095, '&&': 1095, '??': 1095, '^': 1095, '!==': 1095, '===': 1095, '!=': 1095, '==': 1095, '>>>': 1095, '>>': 1095, '<<': 1095, '%': 1095, '/': 1095, '*': 1095, '**=': 1095, '|=': 1095, '^=': 1095, '&=': 1095, '>>>=': 1095, '>>=': 1095, '<<=': 1095, '-=': 1095, '+=': 1095, '%=': 1095, '/=': 1095, '*=': 1095, '=': 1095, Nt('Arguments'): 1095, Nt('TemplateLiteral'): 1095, Nt('SubstitutionTemplate'): 1095, Nt('OptionalChain'): 1095, Nt('TemplateMiddleList'): 1095, Nt('TemplateSpans'): 1095, Nt('MultiplicativeOperator'): 1095, Nt('AssignmentOperator'): 1095, ErrorToken: 1095},
+
+    # 303.
+
+    {'??': 1147, '?': 1145, 'in': 1145, ';': 1145, ',': 1145},
+
+    # 304.
+
+    {'??': 390},
+
+    # 305.
+
+    {'=>': 1097, '*': 1155, 'yield': 1156, 'await': 1037, '!': 1038, '~': 1039, '-': 1040, '+': 1041, 'typeof': 1042, 'void': 1043, 'delete': 1044, '--': 1045, '++': 1045, 'import': 1046, 'new': 1047, 'super': 1048, '(': 1049, 'TemplateHead': 1050, 'NoSubstitutionTemplate': 1051, 'RegularExpressionLiteral': 1052, 'class': 1053, 'function': 1054, '{': 1055, '[': 1056, 'StringLiteral': 1057, 'BigIntLiteral': 1058, 'NumericLiteral': 1059, 'BooleanLiteral': 1060, 'NullLiteral': 1061, 'target': 1035, 'set': 1035, 'of': 1035, 'get': 1035, 'from': 1035, 'async': 1157, 'as': 1035, 'public': 1035, 'protected': 1035, 'private': 1035, 'package': 1035, 'interface': 1035, 'implements': 1035, 'static': 1035, 'let': 1035, 'NameWithEscape': 1035, 'Name': 1035, 'this': 1063, ',': 1158, ';': 1158, 'in': 1158, Nt('AsyncArrowFunction', (('In', False),)): 843, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 306, Nt('ArrowFunction', (('In', False),)): 843, Nt('YieldExpression', (('In', False),)): 843, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('CoalesceExpression', (('In', False),)): 303, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 449, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 300, Nt('RelationalExpression', (('In', False),)): 299, Nt('EqualityExpression', (('In', False),)): 298, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('LogicalORExpression', (('In', False),)): 293, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('ConditionalExpression', (('In', False),)): 843, Nt('AssignmentExpression', (('In', False),)): 941},
+
+    # 306.
+
+    {'=>': 1159},
+
+    # 307.
+
+    {';': 391, ',': 392},
+
+    # 308.
+
+    {'of': 1160, 'in': 1160, ',': 1161, ';': 1161, '=': 394, Nt('Initializer', (('In', False),)): 393},
+
+    # 309.
+
+    {'of': 1162, 'in': 1162, '=': 394, Nt('Initializer', (('In', False),)): 900},
+
+    # 310.
+
+    {'in': 395, 'of': 396},
+
+    # 311.
+
+    {')': 397, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 398, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 312.
+
+    {';': 399, ',': 119},
+
+    # 313.
+
+    {';': 901, ',': 400},
+
+    # 314.
+
+    {'of': 1160, 'in': 1160, ',': 1163, ';': 1163, '=': 394, Nt('Initializer', (('In', False),)): 902},
+
+    # 315.
+
+    {'of': 1162, 'in': 1162, '=': 394, Nt('Initializer', (('In', False),)): 903},
+
+    # 316.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 401, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 317.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 402, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 318.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('ForBinding'): 405, Nt('BindingIdentifier'): 904, Nt('Identifier'): 664, Nt('BindingPattern'): 905, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 319.
+
+    {'of': 406},
+
+    # 320.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('ForBinding'): 846, Nt('BindingIdentifier'): 904, Nt('Identifier'): 664, Nt('BindingPattern'): 905, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 321.
+
+    {'{': 407, Nt('CaseBlock'): 906},
+
+    # 322.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 907},
+
+    # 323.
+
+    {'(': 408},
+
+    # 324.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('BindingIdentifier'): 409, Nt('Identifier'): 664},
+
+    # 325.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('CatchParameter'): 410, Nt('BindingIdentifier'): 908, Nt('Identifier'): 664, Nt('BindingPattern'): 909, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 326.
+
+    {')': 411},
+
+    # 327.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 412},
+
+    # 328.
+
+    {'Name': 108, 'NameWithEscape': 108, 'let': 108, 'static': 108, 'implements': 108, 'interface': 108, 'package': 108, 'private': 108, 'protected': 108, 'public': 108, 'as': 108, 'async': 109, 'from': 108, 'get': 109, 'of': 108, 'set': 109, 'target': 108, 'yield': 110, 'await': 111, 'BooleanLiteral': 715, 'NullLiteral': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, '}': 911, Nt('ImportSpecifier'): 910, Nt('ImportedBinding'): 776, Nt('BindingIdentifier'): 698, Nt('Identifier'): 664, Nt('IdentifierName'): 210},
+
+    # 329.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('ImportedBinding'): 912, Nt('BindingIdentifier'): 698, Nt('Identifier'): 664},
+
+    # 330.
+
+    {'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, '}': 914, Nt('ExportSpecifier'): 913, Nt('IdentifierName'): 214},
+
+    # 331.
+
+    {'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, Nt('IdentifierName'): 915},
+
+    # 332.
+
+    {'(': 413},
+
+    # 333.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 414},
+
+    # 334.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '(': 416, Nt('BindingIdentifier'): 415, Nt('Identifier'): 664},
+
+    # 335.
+
+    {'{': 164, 'extends': 166, Nt('ClassTail'): 916, Nt('ClassHeritage'): 165},
+
+    # 336.
+
+    {';': 917, ErrorToken: 917},
+
+    # 337.
+
+    {'}': 918},
+
+    # 338.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, ',': 791, ']': 919, '...': 116, Nt('BindingElement'): 792, Nt('SingleNameBinding'): 723, Nt('BindingIdentifier'): 107, Nt('Identifier'): 664, Nt('BindingPattern'): 118, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667, Nt('BindingRestElement'): 418},
+
+    # 339.
+
+    {']': 920},
+
+    # 340.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 921, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 341.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, '...': 419, ')': 923, Nt('AssignmentExpression', (('In', True),)): 922, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 342.
+
+    {']': 924, ',': 119},
+
+    # 343.
+
+    {']': 925, ',': 119},
+
+    # 344.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 420},
+
+    # 345.
+
+    {'(': 421},
+
+    # 346.
+
+    {'(': 422, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, Nt('BindingIdentifier'): 423, Nt('Identifier'): 664},
+
+    # 347.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, ',': 791, '...': 152, ']': 928, Nt('AssignmentExpression', (('In', True),)): 926, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('SpreadElement'): 927},
+
+    # 348.
+
+    {'(': 425},
+
+    # 349.
+
+    {'Name': 715, 'BooleanLiteral': 715, 'NullLiteral': 715, 'NameWithEscape': 715, 'await': 715, 'break': 715, 'case': 715, 'catch': 715, 'class': 715, 'const': 715, 'continue': 715, 'debugger': 715, 'default': 715, 'delete': 715, 'do': 715, 'else': 715, 'enum': 715, 'export': 715, 'extends': 715, 'finally': 715, 'for': 715, 'function': 715, 'if': 715, 'import': 715, 'in': 715, 'instanceof': 715, 'new': 715, 'return': 715, 'super': 715, 'switch': 715, 'this': 715, 'throw': 715, 'try': 715, 'typeof': 715, 'var': 715, 'void': 715, 'while': 715, 'with': 715, 'yield': 715, 'let': 715, 'static': 715, 'implements': 715, 'interface': 715, 'package': 715, 'private': 715, 'protected': 715, 'public': 715, 'as': 715, 'async': 715, 'from': 715, 'get': 715, 'of': 715, 'set': 715, 'target': 715, 'StringLiteral': 716, 'NumericLiteral': 717, 'BigIntLiteral': 718, '[': 113, Nt('PropertyName'): 426, Nt('LiteralPropertyName'): 713, Nt('IdentifierName'): 714, Nt('ComputedPropertyName'): 713},
+
+    # 350.
+
+    {')': 427},
+
+    # 351.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('PropertySetParameterList'): 428, Nt('FormalParameter'): 929, Nt('BindingElement'): 825, Nt('SingleNameBinding'): 723, Nt('BindingIdentifier'): 107, Nt('Identifier'): 664, Nt('BindingPattern'): 118, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 352.
+
+    {')': 429},
+
+    # 353.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 882, Nt('UniqueFormalParameters'): 430},
+
+    # 354.
+
+    {'{': 431},
+
+    # 355.
+
+    {')': 1164, '...': 116, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 931, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 930},
+
+    # 356.
+
+    {')': 432},
+
+    # 357.
+
+    {')': 433},
+
+    # 358.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 434},
+
+    # 359.
+
+    {';': 932, ErrorToken: 932},
+
+    # 360.
+
+    {'}': 933},
+
+    # 361.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 435, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 362.
+
+    {'TemplateMiddle': 1165, 'TemplateTail': 1165, ',': 119},
+
+    # 363.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('BindingIdentifier'): 436, Nt('Identifier'): 664, Nt('BindingPattern'): 437, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 364.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 935, Nt('AsyncFunctionBody'): 438},
+
+    # 365.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 440},
+
+    # 366.
+
+    {'yield': 1167, 'await': 1167, '!': 1167, '~': 1167, '-': 1167, '+': 1167, 'typeof': 1167, 'void': 1167, 'delete': 1167, '--': 1167, '++': 1167, 'import': 1167, 'new': 1167, 'super': 1167, '(': 1167, 'TemplateHead': 1167, 'NoSubstitutionTemplate': 1167, 'RegularExpressionLiteral': 1167, 'class': 1167, 'function': 1167, '{': 1167, '[': 1167, 'StringLiteral': 1167, 'BigIntLiteral': 1167, 'NumericLiteral': 1167, 'BooleanLiteral': 1167, 'NullLiteral': 1167, 'target': 1167, 'set': 1167, 'of': 1167, 'get': 1167, 'from': 1167, 'async': 1167, 'as': 1167, 'public': 1167, 'protected': 1167, 'private': 1167, 'package': 1167, 'interface': 1167, 'implements': 1167, 'static': 1167, 'let': 1167, 'NameWithEscape': 1167, 'Name': 1167, 'this': 1167, '}': 1167, 'const': 1167, 'debugger': 1167, 'try': 1167, 'throw': 1167, 'with': 1167, 'return': 1167, 'break': 1167, 'continue': 1167, 'switch': 1167, 'for': 1167, 'while': 1167, 'do': 1167, 'if': 1167, ';': 1167, 'var': 1167, 'export': 1167, End(): 1167, 'case': 1167, 'default': 1167, 'else': 441, Nt('AsyncArrowFunction', (('In', True),)): 1167, Nt('BindingIdentifier'): 1167, Nt('ArrowParameters'): 1167, Nt('ArrowFunction', (('In', True),)): 1167, Nt('YieldExpression', (('In', True),)): 1167, Nt('CoalesceExpressionHead', (('In', True),)): 1167, Nt('CoalesceExpression', (('In', True),)): 1167, Nt('AwaitExpression'): 1167, Nt('OptionalExpression'): 1167, Nt('ImportCall'): 1167, Nt('SuperCall'): 1167, Nt('CoverCallExpressionAndAsyncArrowHead'): 1167, Nt('CallExpression'): 1167, Nt('NewTarget'): 1167, Nt('MetaProperty'): 1167, Nt('SuperProperty'): 1167, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 1167, Nt('SubstitutionTemplate'): 1167, Nt('TemplateLiteral'): 1167, Nt('AsyncGeneratorExpression'): 1167, Nt('AsyncFunctionExpression'): 1167, Nt('GeneratorExpression'): 1167, Nt('ClassExpression'): 1167, Nt('FunctionExpression'): 1167, Nt('ObjectLiteral'): 1167, Nt('ArrayLiteral'): 1167, Nt('Literal'): 1167, Nt('Identifier'): 1167, Nt('IdentifierReference'): 1167, Nt('PrimaryExpression'): 1167, Nt('MemberExpression'): 1167, Nt('NewExpression'): 1167, Nt('LeftHandSideExpression'): 1167, Nt('UpdateExpression'): 1167, Nt('UnaryExpression'): 1167, Nt('ExponentiationExpression'): 1167, Nt('MultiplicativeExpression'): 1167, Nt('AdditiveExpression'): 1167, Nt('ShiftExpression'): 1167, Nt('RelationalExpression', (('In', True),)): 1167, Nt('EqualityExpression', (('In', True),)): 1167, Nt('BitwiseANDExpression', (('In', True),)): 1167, Nt('BitwiseXORExpression', (('In', True),)): 1167, Nt('BitwiseORExpression', (('In', True),)): 1167, Nt('LogicalANDExpression', (('In', True),)): 1167, Nt('LogicalORExpression', (('In', True),)): 1167, Nt('ShortCircuitExpression', (('In', True),)): 1167, Nt('ConditionalExpression', (('In', True),)): 1167, Nt('AssignmentExpression', (('In', True),)): 1167, Nt('Expression', (('In', True),)): 1167, Nt('LetOrConst'): 1167, Nt('LexicalDeclaration', (('In', True),)): 1167, Nt('ClassDeclaration', (('Default', False),)): 1167, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 1167, Nt('AsyncFunctionDeclaration', (('Default', False),)): 1167, Nt('GeneratorDeclaration', (('Default', False),)): 1167, Nt('FunctionDeclaration', (('Default', False),)): 1167, Nt('HoistableDeclaration', (('Default', False),)): 1167, Nt('Declaration'): 1167, Nt('DebuggerStatement'): 1167, Nt('TryStatement'): 1167, Nt('ThrowStatement'): 1167, Nt('LabelIdentifier'): 1167, Nt('LabelledStatement'): 1167, Nt('WithStatement'): 1167, Nt('ReturnStatement'): 1167, Nt('BreakStatement'): 1167, Nt('ContinueStatement'): 1167, Nt('SwitchStatement'): 1167, Nt('IterationStatement'): 1167, Nt('BreakableStatement'): 1167, Nt('IfStatement'): 1167, Nt('ExpressionStatement'): 1167, Nt('EmptyStatement'): 1167, Nt('VariableStatement'): 1167, Nt('Block'): 1167, Nt('BlockStatement'): 1167, Nt('Statement'): 1167, Nt('StatementListItem'): 1167, Nt('ModuleItem'): 1167, Nt('ImportDeclaration'): 1167, Nt('ExportDeclaration'): 1167, Nt('CaseClause'): 1167, Nt('DefaultClause'): 1167, Nt('CaseClauses'): 1167},
+
+    # 367.
+
+    {'yield': 1168, 'await': 1168, '!': 1168, '~': 1168, '-': 1168, '+': 1168, 'typeof': 1168, 'void': 1168, 'delete': 1168, '--': 1168, '++': 1168, 'import': 1168, 'new': 1168, 'super': 1168, '(': 1168, 'TemplateHead': 1168, 'NoSubstitutionTemplate': 1168, 'RegularExpressionLiteral': 1168, 'class': 1168, 'function': 1168, '{': 1168, '[': 1168, 'StringLiteral': 1168, 'BigIntLiteral': 1168, 'NumericLiteral': 1168, 'BooleanLiteral': 1168, 'NullLiteral': 1168, 'target': 1168, 'set': 1168, 'of': 1168, 'get': 1168, 'from': 1168, 'async': 1168, 'as': 1168, 'public': 1168, 'protected': 1168, 'private': 1168, 'package': 1168, 'interface': 1168, 'implements': 1168, 'static': 1168, 'let': 1168, 'NameWithEscape': 1168, 'Name': 1168, 'this': 1168, '}': 1168, 'const': 1168, 'debugger': 1168, 'try': 1168, 'throw': 1168, 'with': 1168, 'return': 1168, 'break': 1168, 'continue': 1168, 'switch': 1168, 'for': 1168, 'while': 1168, 'do': 1168, 'if': 1168, ';': 1168, 'var': 1168, 'default': 1168, 'case': 1168, End(): 1168, 'export': 1168, 'else': 442, Nt('AsyncArrowFunction', (('In', True),)): 1168, Nt('BindingIdentifier'): 1168, Nt('ArrowParameters'): 1168, Nt('ArrowFunction', (('In', True),)): 1168, Nt('YieldExpression', (('In', True),)): 1168, Nt('CoalesceExpressionHead', (('In', True),)): 1168, Nt('CoalesceExpression', (('In', True),)): 1168, Nt('AwaitExpression'): 1168, Nt('OptionalExpression'): 1168, Nt('ImportCall'): 1168, Nt('SuperCall'): 1168, Nt('CoverCallExpressionAndAsyncArrowHead'): 1168, Nt('CallExpression'): 1168, Nt('NewTarget'): 1168, Nt('MetaProperty'): 1168, Nt('SuperProperty'): 1168, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 1168, Nt('SubstitutionTemplate'): 1168, Nt('TemplateLiteral'): 1168, Nt('AsyncGeneratorExpression'): 1168, Nt('AsyncFunctionExpression'): 1168, Nt('GeneratorExpression'): 1168, Nt('ClassExpression'): 1168, Nt('FunctionExpression'): 1168, Nt('ObjectLiteral'): 1168, Nt('ArrayLiteral'): 1168, Nt('Literal'): 1168, Nt('Identifier'): 1168, Nt('IdentifierReference'): 1168, Nt('PrimaryExpression'): 1168, Nt('MemberExpression'): 1168, Nt('NewExpression'): 1168, Nt('LeftHandSideExpression'): 1168, Nt('UpdateExpression'): 1168, Nt('UnaryExpression'): 1168, Nt('ExponentiationExpression'): 1168, Nt('MultiplicativeExpression'): 1168, Nt('AdditiveExpression'): 1168, Nt('ShiftExpression'): 1168, Nt('RelationalExpression', (('In', True),)): 1168, Nt('EqualityExpression', (('In', True),)): 1168, Nt('BitwiseANDExpression', (('In', True),)): 1168, Nt('BitwiseXORExpression', (('In', True),)): 1168, Nt('BitwiseORExpression', (('In', True),)): 1168, Nt('LogicalANDExpression', (('In', True),)): 1168, Nt('LogicalORExpression', (('In', True),)): 1168, Nt('ShortCircuitExpression', (('In', True),)): 1168, Nt('ConditionalExpression', (('In', True),)): 1168, Nt('AssignmentExpression', (('In', True),)): 1168, Nt('Expression', (('In', True),)): 1168, Nt('LetOrConst'): 1168, Nt('LexicalDeclaration', (('In', True),)): 1168, Nt('ClassDeclaration', (('Default', False),)): 1168, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 1168, Nt('AsyncFunctionDeclaration', (('Default', False),)): 1168, Nt('GeneratorDeclaration', (('Default', False),)): 1168, Nt('FunctionDeclaration', (('Default', False),)): 1168, Nt('HoistableDeclaration', (('Default', False),)): 1168, Nt('Declaration'): 1168, Nt('DebuggerStatement'): 1168, Nt('TryStatement'): 1168, Nt('ThrowStatement'): 1168, Nt('LabelIdentifier'): 1168, Nt('LabelledStatement'): 1168, Nt('WithStatement'): 1168, Nt('ReturnStatement'): 1168, Nt('BreakStatement'): 1168, Nt('ContinueStatement'): 1168, Nt('SwitchStatement'): 1168, Nt('IterationStatement'): 1168, Nt('BreakableStatement'): 1168, Nt('IfStatement'): 1168, Nt('ExpressionStatement'): 1168, Nt('EmptyStatement'): 1168, Nt('VariableStatement'): 1168, Nt('Block'): 1168, Nt('BlockStatement'): 1168, Nt('Statement'): 1168, Nt('StatementListItem'): 1168, Nt('CaseClauses'): 1168, Nt('DefaultClause'): 1168, Nt('CaseClause'): 1168, Nt('ExportDeclaration'): 1168, Nt('ImportDeclaration'): 1168, Nt('ModuleItem'): 1168},
+
+    # 368.
+
+    {')': 443, ',': 119},
+
+    # 369.
+
+    {')': 444, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 445, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 370.
+
+    {';': 446, ',': 119},
+
+    # 371.
+
+    {';': 447, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 448, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 372.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 301, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 305, Nt('AssignmentExpression', (('In', False),)): 938, Nt('ConditionalExpression', (('In', False),)): 843, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('LogicalORExpression', (('In', False),)): 293, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 449, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', False),)): 303, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('YieldExpression', (('In', False),)): 843, Nt('ArrowFunction', (('In', False),)): 843, Nt('ArrowParameters'): 306, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', False),)): 843},
+
+    # 373.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 450, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 374.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('LogicalANDExpression', (('In', False),)): 451, Nt('BitwiseORExpression', (('In', False),)): 452, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 375.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('BitwiseORExpression', (('In', False),)): 453, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 376.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('BitwiseXORExpression', (('In', False),)): 454, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 377.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('BitwiseANDExpression', (('In', False),)): 455, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 378.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('EqualityExpression', (('In', False),)): 456, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 379.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('RelationalExpression', (('In', False),)): 457, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 380.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('RelationalExpression', (('In', False),)): 458, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 381.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('RelationalExpression', (('In', False),)): 459, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 382.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('RelationalExpression', (('In', False),)): 460, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 383.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 461, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 384.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 462, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 385.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 463, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 386.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 464, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 387.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('ShiftExpression'): 465, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 388.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 301, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 305, Nt('AssignmentExpression', (('In', False),)): 939, Nt('ConditionalExpression', (('In', False),)): 843, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('LogicalORExpression', (('In', False),)): 293, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 449, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', False),)): 303, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('YieldExpression', (('In', False),)): 843, Nt('ArrowFunction', (('In', False),)): 843, Nt('ArrowParameters'): 306, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', False),)): 843},
+
+    # 389.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 301, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 305, Nt('AssignmentExpression', (('In', False),)): 940, Nt('ConditionalExpression', (('In', False),)): 843, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('LogicalORExpression', (('In', False),)): 293, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 449, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', False),)): 303, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('YieldExpression', (('In', False),)): 843, Nt('ArrowFunction', (('In', False),)): 843, Nt('ArrowParameters'): 306, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', False),)): 843},
+
+    # 390.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 175, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 181, Nt('BitwiseORExpression', (('In', False),)): 469, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 180, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 747, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 754, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 687, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688},
+
+    # 391.
+
+    {';': 472, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 473, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 392.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('VariableDeclaration', (('In', False),)): 942, Nt('BindingIdentifier'): 474, Nt('Identifier'): 664, Nt('BindingPattern'): 475, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 393.
+
+    {',': 1169, ';': 1169, 'in': 476},
+
+    # 394.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 301, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 305, Nt('AssignmentExpression', (('In', False),)): 943, Nt('ConditionalExpression', (('In', False),)): 843, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('LogicalORExpression', (('In', False),)): 293, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 449, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', False),)): 303, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('YieldExpression', (('In', False),)): 843, Nt('ArrowFunction', (('In', False),)): 843, Nt('ArrowParameters'): 306, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', False),)): 843},
+
+    # 395.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 477, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 396.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 478, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 397.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 944},
+
+    # 398.
+
+    {')': 479, ',': 119},
+
+    # 399.
+
+    {')': 480, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 481, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 400.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '{': 32, '[': 33, Nt('LexicalBinding', (('In', False),)): 945, Nt('BindingIdentifier'): 482, Nt('Identifier'): 664, Nt('BindingPattern'): 483, Nt('ObjectBindingPattern'): 667, Nt('ArrayBindingPattern'): 667},
+
+    # 401.
+
+    {')': 484, ',': 119},
+
+    # 402.
+
+    {')': 485},
+
+    # 403.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 486, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 404.
+
+    {'of': 487},
+
+    # 405.
+
+    {'of': 488},
+
+    # 406.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 489, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 407.
+
+    {'}': 946, 'case': 491, 'default': 493, Nt('CaseClauses'): 490, Nt('CaseClause'): 947, Nt('DefaultClause'): 492},
+
+    # 408.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 494},
+
+    # 409.
+
+    {'(': 495},
+
+    # 410.
+
+    {')': 496},
+
+    # 411.
+
+    {'{': 497},
+
+    # 412.
+
+    {')': 498},
+
+    # 413.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 499},
+
+    # 414.
+
+    {')': 500},
+
+    # 415.
+
+    {'(': 501},
+
+    # 416.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 502},
+
+    # 417.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '(': 504, '*': 505, Nt('BindingIdentifier'): 503, Nt('Identifier'): 664},
+
+    # 418.
+
+    {']': 948},
+
+    # 419.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 949, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 420.
+
+    {')': 506},
+
+    # 421.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 507},
+
+    # 422.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 508},
+
+    # 423.
+
+    {'(': 509},
+
+    # 424.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 50, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '{': 364, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 934, Nt('AsyncConciseBody', (('In', True),)): 950},
+
+    # 425.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 882, Nt('UniqueFormalParameters'): 510},
+
+    # 426.
+
+    {'(': 511},
+
+    # 427.
+
+    {'{': 512},
+
+    # 428.
+
+    {')': 513},
+
+    # 429.
+
+    {'{': 514},
+
+    # 430.
+
+    {')': 515},
+
+    # 431.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 516},
+
+    # 432.
+
+    {'{': 517},
+
+    # 433.
+
+    {'{': 518},
+
+    # 434.
+
+    {')': 519},
+
+    # 435.
+
+    {'TemplateMiddle': 1170, 'TemplateTail': 1170, ',': 119},
+
+    # 436.
+
+    {')': 951},
+
+    # 437.
+
+    {')': 952},
+
+    # 438.
+
+    {'}': 953},
+
+    # 439.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1171, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 661},
+
+    # 440.
+
+    {'}': 954},
+
+    # 441.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'function': 196, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('FunctionDeclaration', (('Default', False),)): 956, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 955},
+
+    # 442.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'function': 196, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('FunctionDeclaration', (('Default', False),)): 958, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 957},
+
+    # 443.
+
+    {';': 959, ErrorToken: 959},
+
+    # 444.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 960},
+
+    # 445.
+
+    {')': 520, ',': 119},
+
+    # 446.
+
+    {')': 521, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 522, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 447.
+
+    {')': 523, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 524, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 448.
+
+    {';': 525, ',': 119},
+
+    # 449.
+
+    {'--': 1082, '++': 1083, '**': 1084, '+': 1084, '-': 1084, '<': 1084, '>': 1084, '<=': 1084, '>=': 1084, 'instanceof': 1084, 'in': 1084, '&': 1084, '|': 1084, '||': 1084, ',': 1084, ';': 1084, ')': 1084, ':': 1084, 'TemplateMiddle': 1084, 'TemplateTail': 1084, ']': 1084, '}': 1084, '?': 1084, '&&': 1084, '??': 1084, '^': 1084, '!==': 1084, '===': 1084, '!=': 1084, '==': 1084, '>>>': 1084, '>>': 1084, '<<': 1084, '%': 1084, '/': 1084, '*': 1084, '**=': 739, '|=': 738, '^=': 737, '&=': 736, '>>>=': 735, '>>=': 734, '<<=': 733, '-=': 732, '+=': 731, '%=': 730, '/=': 729, '*=': 728, '=': 388, Nt('TemplateMiddleList'): 1084, Nt('TemplateSpans'): 1084, Nt('MultiplicativeOperator'): 1084, Nt('AssignmentOperator'): 389, ErrorToken: 1084},
+
+    # 450.
+
+    {':': 526},
+
+    # 451.
+
+    {'||': 1172, ',': 1172, ';': 1172, 'in': 1172, '?': 1172, '&&': 375},
+
+    # 452.
+
+    {'&&': 1148, '?': 1148, 'in': 1148, ';': 1148, ',': 1148, '||': 1148, '|': 376},
+
+    # 453.
+
+    {'&&': 1173, '?': 1173, 'in': 1173, ';': 1173, ',': 1173, '||': 1173, '|': 376},
+
+    # 454.
+
+    {'|': 1174, '||': 1174, ',': 1174, ';': 1174, 'in': 1174, '?': 1174, '&&': 1174, '??': 1174, '^': 377},
+
+    # 455.
+
+    {'^': 1175, '??': 1175, '&&': 1175, '?': 1175, 'in': 1175, ';': 1175, ',': 1175, '||': 1175, '|': 1175, '&': 378},
+
+    # 456.
+
+    {'&': 1176, '|': 1176, '||': 1176, ',': 1176, ';': 1176, 'in': 1176, '?': 1176, '&&': 1176, '??': 1176, '^': 1176, '!==': 382, '===': 381, '!=': 380, '==': 379},
+
+    # 457.
+
+    {'==': 1177, '!=': 1177, '===': 1177, '!==': 1177, '^': 1177, '??': 1177, '&&': 1177, '?': 1177, 'in': 1177, ';': 1177, ',': 1177, '||': 1177, '|': 1177, '&': 1177, 'instanceof': 387, '>=': 386, '<=': 385, '>': 384, '<': 383},
+
+    # 458.
+
+    {'==': 1178, '!=': 1178, '===': 1178, '!==': 1178, '^': 1178, '??': 1178, '&&': 1178, '?': 1178, 'in': 1178, ';': 1178, ',': 1178, '||': 1178, '|': 1178, '&': 1178, 'instanceof': 387, '>=': 386, '<=': 385, '>': 384, '<': 383},
+
+    # 459.
+
+    {'==': 1179, '!=': 1179, '===': 1179, '!==': 1179, '^': 1179, '??': 1179, '&&': 1179, '?': 1179, 'in': 1179, ';': 1179, ',': 1179, '||': 1179, '|': 1179, '&': 1179, 'instanceof': 387, '>=': 386, '<=': 385, '>': 384, '<': 383},
+
+    # 460.
+
+    {'==': 1180, '!=': 1180, '===': 1180, '!==': 1180, '^': 1180, '??': 1180, '&&': 1180, '?': 1180, 'in': 1180, ';': 1180, ',': 1180, '||': 1180, '|': 1180, '&': 1180, 'instanceof': 387, '>=': 386, '<=': 385, '>': 384, '<': 383},
+
+    # 461.
+
+    {'<': 1181, '>': 1181, '<=': 1181, '>=': 1181, 'instanceof': 1181, '&': 1181, '|': 1181, '||': 1181, ',': 1181, ';': 1181, 'in': 1181, '?': 1181, '&&': 1181, '??': 1181, '^': 1181, '!==': 1181, '===': 1181, '!=': 1181, '==': 1181, '>>>': 138, '>>': 137, '<<': 136},
+
+    # 462.
+
+    {'<': 1182, '>': 1182, '<=': 1182, '>=': 1182, 'instanceof': 1182, '&': 1182, '|': 1182, '||': 1182, ',': 1182, ';': 1182, 'in': 1182, '?': 1182, '&&': 1182, '??': 1182, '^': 1182, '!==': 1182, '===': 1182, '!=': 1182, '==': 1182, '>>>': 138, '>>': 137, '<<': 136},
+
+    # 463.
+
+    {'<': 1183, '>': 1183, '<=': 1183, '>=': 1183, 'instanceof': 1183, '&': 1183, '|': 1183, '||': 1183, ',': 1183, ';': 1183, 'in': 1183, '?': 1183, '&&': 1183, '??': 1183, '^': 1183, '!==': 1183, '===': 1183, '!=': 1183, '==': 1183, '>>>': 138, '>>': 137, '<<': 136},
+
+    # 464.
+
+    {'<': 1184, '>': 1184, '<=': 1184, '>=': 1184, 'instanceof': 1184, '&': 1184, '|': 1184, '||': 1184, ',': 1184, ';': 1184, 'in': 1184, '?': 1184, '&&': 1184, '??': 1184, '^': 1184, '!==': 1184, '===': 1184, '!=': 1184, '==': 1184, '>>>': 138, '>>': 137, '<<': 136},
+
+    # 465.
+
+    {'<': 1185, '>': 1185, '<=': 1185, '>=': 1185, 'instanceof': 1185, '&': 1185, '|': 1185, '||': 1185, ',': 1185, ';': 1185, 'in': 1185, '?': 1185, '&&': 1185, '??': 1185, '^': 1185, '!==': 1185, '===': 1185, '!=': 1185, '==': 1185, '>>>': 138, '>>': 137, '<<': 136},
+
+    # 466.
+
+    {')': 527, ',': 119},
+
+    # 467.
+
+    {'=>': 1186},
+
+    # 468.
+
+    {'yield': 305, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 301, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '{': 528, Nt('AsyncArrowFunction', (('In', False),)): 843, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 306, Nt('ArrowFunction', (('In', False),)): 843, Nt('YieldExpression', (('In', False),)): 843, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('CoalesceExpression', (('In', False),)): 303, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 449, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 300, Nt('RelationalExpression', (('In', False),)): 299, Nt('EqualityExpression', (('In', False),)): 298, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('LogicalORExpression', (('In', False),)): 293, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('ConditionalExpression', (('In', False),)): 843, Nt('AssignmentExpression', (('In', False),)): 980, Nt('AsyncConciseBody', (('In', False),)): 961},
+
+    # 469.
+
+    {',': 1187, ';': 1187, 'in': 1187, '?': 1187, '??': 1187, '|': 376},
+
+    # 470.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 301, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 305, Nt('AssignmentExpression', (('In', False),)): 962, Nt('ConditionalExpression', (('In', False),)): 843, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('LogicalORExpression', (('In', False),)): 293, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 449, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', False),)): 303, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('YieldExpression', (('In', False),)): 843, Nt('ArrowFunction', (('In', False),)): 843, Nt('ArrowParameters'): 306, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', False),)): 843},
+
+    # 471.
+
+    {'yield': 305, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 301, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '{': 529, Nt('AsyncArrowFunction', (('In', False),)): 843, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 306, Nt('ArrowFunction', (('In', False),)): 843, Nt('YieldExpression', (('In', False),)): 843, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('CoalesceExpression', (('In', False),)): 303, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 449, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 300, Nt('RelationalExpression', (('In', False),)): 299, Nt('EqualityExpression', (('In', False),)): 298, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('LogicalORExpression', (('In', False),)): 293, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('ConditionalExpression', (('In', False),)): 843, Nt('AssignmentExpression', (('In', False),)): 981, Nt('ConciseBody', (('In', False),)): 963},
+
+    # 472.
+
+    {')': 530, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 531, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 473.
+
+    {';': 532, ',': 119},
+
+    # 474.
+
+    {',': 1161, ';': 1161, '=': 394, Nt('Initializer', (('In', False),)): 964},
+
+    # 475.
+
+    {'=': 394, Nt('Initializer', (('In', False),)): 900},
+
+    # 476.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 533, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 477.
+
+    {')': 534, ',': 119},
+
+    # 478.
+
+    {')': 535},
+
+    # 479.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 965},
+
+    # 480.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 966},
+
+    # 481.
+
+    {')': 536, ',': 119},
+
+    # 482.
+
+    {',': 1163, ';': 1163, '=': 394, Nt('Initializer', (('In', False),)): 902},
+
+    # 483.
+
+    {'=': 394, Nt('Initializer', (('In', False),)): 903},
+
+    # 484.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 967},
+
+    # 485.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 968},
+
+    # 486.
+
+    {')': 537},
+
+    # 487.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 538, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 488.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('AssignmentExpression', (('In', True),)): 539, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 489.
+
+    {')': 540},
+
+    # 490.
+
+    {'}': 969, 'case': 491, 'default': 493, Nt('CaseClause'): 970, Nt('DefaultClause'): 541},
+
+    # 491.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 542, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 492.
+
+    {'}': 971, 'case': 491, Nt('CaseClauses'): 543, Nt('CaseClause'): 947},
+
+    # 493.
+
+    {':': 544},
+
+    # 494.
+
+    {')': 545},
+
+    # 495.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 546},
+
+    # 496.
+
+    {'{': 547, Nt('CatchBlock'): 972},
+
+    # 497.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 548},
+
+    # 498.
+
+    {'{': 549},
+
+    # 499.
+
+    {')': 550},
+
+    # 500.
+
+    {'{': 551},
+
+    # 501.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 552},
+
+    # 502.
+
+    {')': 553},
+
+    # 503.
+
+    {'(': 554},
+
+    # 504.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 555},
+
+    # 505.
+
+    {'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '(': 557, Nt('BindingIdentifier'): 556, Nt('Identifier'): 664},
+
+    # 506.
+
+    {'{': 558},
+
+    # 507.
+
+    {')': 559},
+
+    # 508.
+
+    {')': 560},
+
+    # 509.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 561},
+
+    # 510.
+
+    {')': 562},
+
+    # 511.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 882, Nt('UniqueFormalParameters'): 563},
+
+    # 512.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 564},
+
+    # 513.
+
+    {'{': 565},
+
+    # 514.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 566},
+
+    # 515.
+
+    {'{': 567},
+
+    # 516.
+
+    {'}': 973},
+
+    # 517.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 568},
+
+    # 518.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 974, Nt('GeneratorBody'): 569},
+
+    # 519.
+
+    {'{': 570},
+
+    # 520.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 975},
+
+    # 521.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 976},
+
+    # 522.
+
+    {')': 571, ',': 119},
+
+    # 523.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 977},
+
+    # 524.
+
+    {')': 572, ',': 119},
+
+    # 525.
+
+    {')': 573, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 574, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 526.
+
+    {'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 301, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 305, Nt('AssignmentExpression', (('In', False),)): 978, Nt('ConditionalExpression', (('In', False),)): 843, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('LogicalORExpression', (('In', False),)): 293, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('EqualityExpression', (('In', False),)): 298, Nt('RelationalExpression', (('In', False),)): 299, Nt('ShiftExpression'): 300, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 449, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', False),)): 303, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('YieldExpression', (('In', False),)): 843, Nt('ArrowFunction', (('In', False),)): 843, Nt('ArrowParameters'): 306, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', False),)): 843},
+
+    # 527.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 979},
+
+    # 528.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 935, Nt('AsyncFunctionBody'): 576},
+
+    # 529.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 577},
+
+    # 530.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 982},
+
+    # 531.
+
+    {')': 578, ',': 119},
+
+    # 532.
+
+    {')': 579, 'this': 674, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 50, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'NullLiteral': 677, 'BooleanLiteral': 678, 'NumericLiteral': 679, 'BigIntLiteral': 680, 'StringLiteral': 681, '[': 51, '{': 52, 'function': 53, 'class': 54, 'RegularExpressionLiteral': 682, 'NoSubstitutionTemplate': 684, 'TemplateHead': 55, '(': 57, 'super': 58, 'new': 59, 'import': 62, '++': 64, '--': 64, 'delete': 65, 'void': 66, 'typeof': 67, '+': 68, '-': 69, '~': 70, '!': 71, 'await': 72, 'yield': 75, Nt('Expression', (('In', True),)): 580, Nt('AssignmentExpression', (('In', True),)): 668, Nt('ConditionalExpression', (('In', True),)): 669, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('LogicalORExpression', (('In', True),)): 36, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('EqualityExpression', (('In', True),)): 41, Nt('RelationalExpression', (('In', True),)): 42, Nt('ShiftExpression'): 43, Nt('AdditiveExpression'): 44, Nt('MultiplicativeExpression'): 45, Nt('ExponentiationExpression'): 670, Nt('UnaryExpression'): 671, Nt('UpdateExpression'): 46, Nt('LeftHandSideExpression'): 47, Nt('NewExpression'): 672, Nt('MemberExpression'): 48, Nt('PrimaryExpression'): 673, Nt('IdentifierReference'): 675, Nt('Identifier'): 49, Nt('Literal'): 676, Nt('ArrayLiteral'): 676, Nt('ObjectLiteral'): 676, Nt('FunctionExpression'): 676, Nt('ClassExpression'): 676, Nt('GeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('AsyncGeneratorExpression'): 676, Nt('TemplateLiteral'): 683, Nt('SubstitutionTemplate'): 685, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SuperProperty'): 673, Nt('MetaProperty'): 673, Nt('NewTarget'): 686, Nt('CallExpression'): 60, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('SuperCall'): 687, Nt('ImportCall'): 687, Nt('OptionalExpression'): 63, Nt('AwaitExpression'): 688, Nt('CoalesceExpression', (('In', True),)): 73, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('YieldExpression', (('In', True),)): 669, Nt('ArrowFunction', (('In', True),)): 669, Nt('ArrowParameters'): 76, Nt('BindingIdentifier'): 689, Nt('AsyncArrowFunction', (('In', True),)): 669},
+
+    # 533.
+
+    {')': 581, ',': 119},
+
+    # 534.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 983},
+
+    # 535.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 984},
+
+    # 536.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 985},
+
+    # 537.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 986},
+
+    # 538.
+
+    {')': 582},
+
+    # 539.
+
+    {')': 583},
+
+    # 540.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 987},
+
+    # 541.
+
+    {'}': 988, 'case': 491, Nt('CaseClauses'): 584, Nt('CaseClause'): 947},
+
+    # 542.
+
+    {':': 585, ',': 119},
+
+    # 543.
+
+    {'}': 989, 'case': 491, Nt('CaseClause'): 970},
+
+    # 544.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'case': 1188, '}': 1188, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('CaseClause'): 1188, Nt('CaseClauses'): 1188, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 586},
+
+    # 545.
+
+    {'{': 587},
+
+    # 546.
+
+    {')': 588},
+
+    # 547.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, '}': 990, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 589},
+
+    # 548.
+
+    {'}': 991},
+
+    # 549.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 974, Nt('GeneratorBody'): 590},
+
+    # 550.
+
+    {'{': 591},
+
+    # 551.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 592},
+
+    # 552.
+
+    {')': 593},
+
+    # 553.
+
+    {'{': 594},
+
+    # 554.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 595},
+
+    # 555.
+
+    {')': 596},
+
+    # 556.
+
+    {'(': 597},
+
+    # 557.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 598},
+
+    # 558.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 935, Nt('AsyncFunctionBody'): 599},
+
+    # 559.
+
+    {'{': 600},
+
+    # 560.
+
+    {'{': 601},
+
+    # 561.
+
+    {')': 602},
+
+    # 562.
+
+    {'{': 603},
+
+    # 563.
+
+    {')': 604},
+
+    # 564.
+
+    {'}': 992},
+
+    # 565.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 605},
+
+    # 566.
+
+    {'}': 993},
+
+    # 567.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 974, Nt('GeneratorBody'): 606},
+
+    # 568.
+
+    {'}': 994},
+
+    # 569.
+
+    {'}': 995},
+
+    # 570.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 974, Nt('GeneratorBody'): 607},
+
+    # 571.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 996},
+
+    # 572.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 997},
+
+    # 573.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 998},
+
+    # 574.
+
+    {')': 608, ',': 119},
+
+    # 575.
+
+    {'yield': 305, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 301, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '{': 528, Nt('AsyncArrowFunction', (('In', False),)): 843, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 306, Nt('ArrowFunction', (('In', False),)): 843, Nt('YieldExpression', (('In', False),)): 843, Nt('CoalesceExpressionHead', (('In', False),)): 304, Nt('CoalesceExpression', (('In', False),)): 303, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 302, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 449, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 300, Nt('RelationalExpression', (('In', False),)): 299, Nt('EqualityExpression', (('In', False),)): 298, Nt('BitwiseANDExpression', (('In', False),)): 297, Nt('BitwiseXORExpression', (('In', False),)): 296, Nt('BitwiseORExpression', (('In', False),)): 295, Nt('LogicalANDExpression', (('In', False),)): 294, Nt('LogicalORExpression', (('In', False),)): 293, Nt('ShortCircuitExpression', (('In', False),)): 292, Nt('ConditionalExpression', (('In', False),)): 843, Nt('AssignmentExpression', (('In', False),)): 980, Nt('AsyncConciseBody', (('In', False),)): 999},
+
+    # 576.
+
+    {'}': 1000},
+
+    # 577.
+
+    {'}': 1001},
+
+    # 578.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 1002},
+
+    # 579.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 1003},
+
+    # 580.
+
+    {')': 609, ',': 119},
+
+    # 581.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 1004},
+
+    # 582.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 1005},
+
+    # 583.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 1006},
+
+    # 584.
+
+    {'}': 1007, 'case': 491, Nt('CaseClause'): 970},
+
+    # 585.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'case': 1189, '}': 1189, 'default': 1189, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('CaseClause'): 1189, Nt('DefaultClause'): 1189, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 610},
+
+    # 586.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'case': 1190, '}': 1190, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('CaseClause'): 1190, Nt('CaseClauses'): 1190, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 661},
+
+    # 587.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 935, Nt('AsyncFunctionBody'): 611},
+
+    # 588.
+
+    {'{': 612},
+
+    # 589.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, '}': 1008, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 661},
+
+    # 590.
+
+    {'}': 1009},
+
+    # 591.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 613},
+
+    # 592.
+
+    {'}': 1010},
+
+    # 593.
+
+    {'{': 614},
+
+    # 594.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 974, Nt('GeneratorBody'): 615},
+
+    # 595.
+
+    {')': 616},
+
+    # 596.
+
+    {'{': 617},
+
+    # 597.
+
+    {')': 1114, '[': 33, '{': 32, 'await': 666, 'yield': 665, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, '...': 116, Nt('ArrayBindingPattern'): 667, Nt('ObjectBindingPattern'): 667, Nt('BindingPattern'): 118, Nt('Identifier'): 664, Nt('BindingIdentifier'): 107, Nt('SingleNameBinding'): 723, Nt('BindingElement'): 825, Nt('FormalParameter'): 824, Nt('FormalParameterList'): 261, Nt('BindingRestElement'): 823, Nt('FunctionRestParameter'): 822, Nt('FormalParameters'): 618},
+
+    # 598.
+
+    {')': 619},
+
+    # 599.
+
+    {'}': 1011},
+
+    # 600.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 935, Nt('AsyncFunctionBody'): 620},
+
+    # 601.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 1012, Nt('AsyncGeneratorBody'): 621},
+
+    # 602.
+
+    {'{': 622},
+
+    # 603.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 935, Nt('AsyncFunctionBody'): 623},
+
+    # 604.
+
+    {'{': 624},
+
+    # 605.
+
+    {'}': 1013},
+
+    # 606.
+
+    {'}': 1014},
+
+    # 607.
+
+    {'}': 1015},
+
+    # 608.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 1016},
+
+    # 609.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 653, 'let': 653, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 1017},
+
+    # 610.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, 'case': 1191, '}': 1191, 'default': 1191, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('CaseClause'): 1191, Nt('DefaultClause'): 1191, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 661},
+
+    # 611.
+
+    {'}': 1018},
+
+    # 612.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 1012, Nt('AsyncGeneratorBody'): 625},
+
+    # 613.
+
+    {'}': 1019},
+
+    # 614.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 974, Nt('GeneratorBody'): 626},
+
+    # 615.
+
+    {'}': 1020},
+
+    # 616.
+
+    {'{': 627},
+
+    # 617.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 935, Nt('AsyncFunctionBody'): 628},
+
+    # 618.
+
+    {')': 629},
+
+    # 619.
+
+    {'{': 630},
+
+    # 620.
+
+    {'}': 1021},
+
+    # 621.
+
+    {'}': 1022},
+
+    # 622.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 1012, Nt('AsyncGeneratorBody'): 631},
+
+    # 623.
+
+    {'}': 1023},
+
+    # 624.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 1012, Nt('AsyncGeneratorBody'): 632},
+
+    # 625.
+
+    {'}': 1024},
+
+    # 626.
+
+    {'}': 1025},
+
+    # 627.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 935, Nt('AsyncFunctionBody'): 633},
+
+    # 628.
+
+    {'}': 1026},
+
+    # 629.
+
+    {'{': 634},
+
+    # 630.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 1012, Nt('AsyncGeneratorBody'): 635},
+
+    # 631.
+
+    {'}': 1027},
+
+    # 632.
+
+    {'}': 1028},
+
+    # 633.
+
+    {'}': 1029},
+
+    # 634.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, '}': 1166, 'const': 656, 'class': 22, 'function': 21, 'debugger': 20, 'try': 19, 'throw': 18, 'async': 17, 'let': 16, 'with': 14, 'return': 13, 'break': 12, 'continue': 11, 'switch': 10, 'for': 9, 'while': 8, 'do': 7, 'if': 6, ';': 650, 'var': 5, '{': 4, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 637, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 34, Nt('LetOrConst'): 23, Nt('LexicalDeclaration', (('In', True),)): 654, Nt('ClassDeclaration', (('Default', False),)): 654, Nt('AsyncGeneratorDeclaration', (('Default', False),)): 655, Nt('AsyncFunctionDeclaration', (('Default', False),)): 655, Nt('GeneratorDeclaration', (('Default', False),)): 655, Nt('FunctionDeclaration', (('Default', False),)): 655, Nt('HoistableDeclaration', (('Default', False),)): 654, Nt('Declaration'): 647, Nt('DebuggerStatement'): 648, Nt('TryStatement'): 648, Nt('ThrowStatement'): 648, Nt('LabelIdentifier'): 15, Nt('LabelledStatement'): 648, Nt('WithStatement'): 648, Nt('ReturnStatement'): 648, Nt('BreakStatement'): 648, Nt('ContinueStatement'): 648, Nt('SwitchStatement'): 651, Nt('IterationStatement'): 651, Nt('BreakableStatement'): 648, Nt('IfStatement'): 648, Nt('ExpressionStatement'): 648, Nt('EmptyStatement'): 648, Nt('VariableStatement'): 648, Nt('Block'): 649, Nt('BlockStatement'): 648, Nt('Statement'): 647, Nt('StatementListItem'): 646, Nt('StatementList'): 439, Nt('FunctionStatementList'): 936, Nt('FunctionBody'): 1012, Nt('AsyncGeneratorBody'): 636},
+
+    # 635.
+
+    {'}': 1030},
+
+    # 636.
+
+    {'}': 1031},
+
+    # 637.
+
+    {':': 642, '=>': 1086, '[': 1087, '.': 1087, 'NoSubstitutionTemplate': 1087, 'TemplateHead': 1087, '(': 1087, '?.': 1087, '{': 1087, 'of': 1087, '--': 1087, '++': 1087, '**': 1087, '+': 1087, '-': 1087, '<': 1087, '>': 1087, '<=': 1087, '>=': 1087, 'instanceof': 1087, 'in': 1087, '&': 1087, '|': 1087, '||': 1087, ',': 1087, ';': 1087, ')': 1087, 'TemplateMiddle': 1087, 'TemplateTail': 1087, ']': 1087, '}': 1087, '?': 1087, '&&': 1087, '??': 1087, '^': 1087, '!==': 1087, '===': 1087, '!=': 1087, '==': 1087, '>>>': 1087, '>>': 1087, '<<': 1087, '%': 1087, '/': 1087, '*': 1087, '**=': 1087, '|=': 1087, '^=': 1087, '&=': 1087, '>>>=': 1087, '>>=': 1087, '<<=': 1087, '-=': 1087, '+=': 1087, '%=': 1087, '/=': 1087, '*=': 1087, '=': 1087, Nt('TemplateLiteral'): 1087, Nt('SubstitutionTemplate'): 1087, Nt('Arguments'): 1087, Nt('OptionalChain'): 1087, Nt('TemplateMiddleList'): 1087, Nt('TemplateSpans'): 1087, Nt('MultiplicativeOperator'): 1087, Nt('AssignmentOperator'): 1087, ErrorToken: 1087},
+
+    # 638.
+
+    {'(': 179, 'Name': 653, 'NameWithEscape': 653, 'let': 653, 'static': 653, 'implements': 653, 'interface': 653, 'package': 653, 'private': 653, 'protected': 653, 'public': 653, 'as': 653, 'async': 653, 'from': 653, 'get': 653, 'of': 653, 'set': 653, 'target': 653, 'yield': 665, 'await': 666, '*': 94, '{': 95, 'StringLiteral': 701, Nt('ImportClause'): 92, Nt('ImportedDefaultBinding'): 93, Nt('ImportedBinding'): 697, Nt('BindingIdentifier'): 698, Nt('Identifier'): 664, Nt('NameSpaceImport'): 699, Nt('NamedImports'): 700, Nt('ModuleSpecifier'): 96},
+
+    # 639.
+
+    {'[': 1192, '{': 1192, 'await': 1192, 'yield': 1192, 'target': 1192, 'set': 1192, 'of': 1192, 'get': 1192, 'from': 1192, 'async': 1192, 'as': 1192, 'public': 1192, 'protected': 1192, 'private': 1192, 'package': 1192, 'interface': 1192, 'implements': 1192, 'static': 1192, 'let': 1192, 'NameWithEscape': 1192, 'Name': 1192, '...': 1192, ',': 1192, ']': 1192, Nt('ArrayBindingPattern'): 1192, Nt('ObjectBindingPattern'): 1192, Nt('BindingPattern'): 1192, Nt('Identifier'): 1192, Nt('BindingIdentifier'): 1192, Nt('SingleNameBinding'): 1192, Nt('BindingElement'): 1192, Nt('BindingElisionElement'): 1192, Nt('BindingElementList'): 1192, Nt('BindingRestElement'): 1192, Nt('Elision'): 1192},
+
+    # 640.
+
+    {'=>': 1193},
+
+    # 641.
+
+    {'--': 1082, '++': 1083, '**': 1084, '+': 1084, '-': 1084, '<': 1084, '>': 1084, '<=': 1084, '>=': 1084, 'instanceof': 1084, 'in': 643, '&': 1084, '|': 1084, '||': 1084, ',': 1084, ';': 1084, ')': 1084, ':': 1084, 'TemplateMiddle': 1084, 'TemplateTail': 1084, ']': 1084, '}': 1084, '?': 1084, '&&': 1084, '??': 1084, '^': 1084, '!==': 1084, '===': 1084, '!=': 1084, '==': 1084, '>>>': 1084, '>>': 1084, '<<': 1084, '%': 1084, '/': 1084, '*': 1084, '**=': 739, '|=': 738, '^=': 737, '&=': 736, '>>>=': 735, '>>=': 734, '<<=': 733, '-=': 732, '+=': 731, '%=': 730, '/=': 729, '*=': 728, '=': 388, 'of': 403, Nt('TemplateMiddleList'): 1084, Nt('TemplateSpans'): 1084, Nt('MultiplicativeOperator'): 1084, Nt('AssignmentOperator'): 389, ErrorToken: 1084},
+
+    # 642.
+
+    {'{': 1194, 'var': 1194, ';': 1194, 'if': 1194, 'do': 1194, 'while': 1194, 'for': 1194, 'switch': 1194, 'continue': 1194, 'break': 1194, 'return': 1194, 'with': 1194, 'let': 1194, 'async': 1194, 'throw': 1194, 'try': 1194, 'debugger': 1194, 'function': 1194, 'this': 1194, 'Name': 1194, 'NameWithEscape': 1194, 'static': 1194, 'implements': 1194, 'interface': 1194, 'package': 1194, 'private': 1194, 'protected': 1194, 'public': 1194, 'as': 1194, 'from': 1194, 'get': 1194, 'of': 1194, 'set': 1194, 'target': 1194, 'NullLiteral': 1194, 'BooleanLiteral': 1194, 'NumericLiteral': 1194, 'BigIntLiteral': 1194, 'StringLiteral': 1194, '[': 1194, 'RegularExpressionLiteral': 1194, 'NoSubstitutionTemplate': 1194, 'TemplateHead': 1194, '(': 1194, 'super': 1194, 'new': 1194, 'import': 1194, '++': 1194, '--': 1194, 'delete': 1194, 'void': 1194, 'typeof': 1194, '+': 1194, '-': 1194, '~': 1194, '!': 1194, 'await': 1194, 'yield': 1194, Nt('LabelledItem'): 1194, Nt('Statement'): 1194, Nt('BlockStatement'): 1194, Nt('Block'): 1194, Nt('VariableStatement'): 1194, Nt('EmptyStatement'): 1194, Nt('ExpressionStatement'): 1194, Nt('IfStatement'): 1194, Nt('BreakableStatement'): 1194, Nt('IterationStatement'): 1194, Nt('SwitchStatement'): 1194, Nt('ContinueStatement'): 1194, Nt('BreakStatement'): 1194, Nt('ReturnStatement'): 1194, Nt('WithStatement'): 1194, Nt('LabelledStatement'): 1194, Nt('LabelIdentifier'): 1194, Nt('ThrowStatement'): 1194, Nt('TryStatement'): 1194, Nt('DebuggerStatement'): 1194, Nt('FunctionDeclaration', (('Default', False),)): 1194, Nt('Expression', (('In', True),)): 1194, Nt('AssignmentExpression', (('In', True),)): 1194, Nt('ConditionalExpression', (('In', True),)): 1194, Nt('ShortCircuitExpression', (('In', True),)): 1194, Nt('LogicalORExpression', (('In', True),)): 1194, Nt('LogicalANDExpression', (('In', True),)): 1194, Nt('BitwiseORExpression', (('In', True),)): 1194, Nt('BitwiseXORExpression', (('In', True),)): 1194, Nt('BitwiseANDExpression', (('In', True),)): 1194, Nt('EqualityExpression', (('In', True),)): 1194, Nt('RelationalExpression', (('In', True),)): 1194, Nt('ShiftExpression'): 1194, Nt('AdditiveExpression'): 1194, Nt('MultiplicativeExpression'): 1194, Nt('ExponentiationExpression'): 1194, Nt('UnaryExpression'): 1194, Nt('UpdateExpression'): 1194, Nt('LeftHandSideExpression'): 1194, Nt('NewExpression'): 1194, Nt('MemberExpression'): 1194, Nt('PrimaryExpression'): 1194, Nt('IdentifierReference'): 1194, Nt('Identifier'): 1194, Nt('Literal'): 1194, Nt('ArrayLiteral'): 1194, Nt('ObjectLiteral'): 1194, Nt('FunctionExpression'): 1194, Nt('ClassExpression'): 1194, Nt('GeneratorExpression'): 1194, Nt('AsyncFunctionExpression'): 1194, Nt('AsyncGeneratorExpression'): 1194, Nt('TemplateLiteral'): 1194, Nt('SubstitutionTemplate'): 1194, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 1194, Nt('SuperProperty'): 1194, Nt('MetaProperty'): 1194, Nt('NewTarget'): 1194, Nt('CallExpression'): 1194, Nt('CoverCallExpressionAndAsyncArrowHead'): 1194, Nt('SuperCall'): 1194, Nt('ImportCall'): 1194, Nt('OptionalExpression'): 1194, Nt('AwaitExpression'): 1194, Nt('CoalesceExpression', (('In', True),)): 1194, Nt('CoalesceExpressionHead', (('In', True),)): 1194, Nt('YieldExpression', (('In', True),)): 1194, Nt('ArrowFunction', (('In', True),)): 1194, Nt('ArrowParameters'): 1194, Nt('BindingIdentifier'): 1194, Nt('AsyncArrowFunction', (('In', True),)): 1194},
+
+    # 643.
+
+    {'yield': 75, 'await': 72, '!': 71, '~': 70, '-': 69, '+': 68, 'typeof': 67, 'void': 66, 'delete': 65, '--': 64, '++': 64, 'import': 62, 'new': 59, 'super': 58, '(': 57, 'TemplateHead': 55, 'NoSubstitutionTemplate': 684, 'RegularExpressionLiteral': 682, 'class': 54, 'function': 53, '{': 52, '[': 51, 'StringLiteral': 681, 'BigIntLiteral': 680, 'NumericLiteral': 679, 'BooleanLiteral': 678, 'NullLiteral': 677, 'target': 653, 'set': 653, 'of': 653, 'get': 653, 'from': 653, 'async': 50, 'as': 653, 'public': 653, 'protected': 653, 'private': 653, 'package': 653, 'interface': 653, 'implements': 653, 'static': 653, 'let': 653, 'NameWithEscape': 653, 'Name': 653, 'this': 674, Nt('AsyncArrowFunction', (('In', True),)): 669, Nt('BindingIdentifier'): 689, Nt('ArrowParameters'): 76, Nt('ArrowFunction', (('In', True),)): 669, Nt('YieldExpression', (('In', True),)): 669, Nt('CoalesceExpressionHead', (('In', True),)): 74, Nt('CoalesceExpression', (('In', True),)): 73, Nt('AwaitExpression'): 688, Nt('OptionalExpression'): 63, Nt('ImportCall'): 687, Nt('SuperCall'): 687, Nt('CoverCallExpressionAndAsyncArrowHead'): 61, Nt('CallExpression'): 60, Nt('NewTarget'): 686, Nt('MetaProperty'): 673, Nt('SuperProperty'): 673, Nt('CoverParenthesizedExpressionAndArrowParameterList'): 56, Nt('SubstitutionTemplate'): 685, Nt('TemplateLiteral'): 683, Nt('AsyncGeneratorExpression'): 676, Nt('AsyncFunctionExpression'): 676, Nt('GeneratorExpression'): 676, Nt('ClassExpression'): 676, Nt('FunctionExpression'): 676, Nt('ObjectLiteral'): 676, Nt('ArrayLiteral'): 676, Nt('Literal'): 676, Nt('Identifier'): 49, Nt('IdentifierReference'): 675, Nt('PrimaryExpression'): 673, Nt('MemberExpression'): 48, Nt('NewExpression'): 672, Nt('LeftHandSideExpression'): 47, Nt('UpdateExpression'): 46, Nt('UnaryExpression'): 671, Nt('ExponentiationExpression'): 670, Nt('MultiplicativeExpression'): 45, Nt('AdditiveExpression'): 44, Nt('ShiftExpression'): 43, Nt('RelationalExpression', (('In', True),)): 42, Nt('EqualityExpression', (('In', True),)): 41, Nt('BitwiseANDExpression', (('In', True),)): 40, Nt('BitwiseXORExpression', (('In', True),)): 39, Nt('BitwiseORExpression', (('In', True),)): 38, Nt('LogicalANDExpression', (('In', True),)): 37, Nt('LogicalORExpression', (('In', True),)): 36, Nt('ShortCircuitExpression', (('In', True),)): 35, Nt('ConditionalExpression', (('In', True),)): 669, Nt('AssignmentExpression', (('In', True),)): 668, Nt('Expression', (('In', True),)): 466},
+
+    # 644.
+
+    state_644_actions,
+
+    # 645.
+
+    state_645_actions,
+
+    # 646.
+
+    state_646_actions,
+
+    # 647.
+
+    state_647_actions,
+
+    # 648.
+
+    state_648_actions,
+
+    # 649.
+
+    state_649_actions,
+
+    # 650.
+
+    state_650_actions,
+
+    # 651.
+
+    state_651_actions,
+
+    # 652.
+
+    state_652_actions,
+
+    # 653.
+
+    state_653_actions,
+
+    # 654.
+
+    state_654_actions,
+
+    # 655.
+
+    state_655_actions,
+
+    # 656.
+
+    state_656_actions,
+
+    # 657.
+
+    state_657_actions,
+
+    # 658.
+
+    state_658_actions,
+
+    # 659.
+
+    state_659_actions,
+
+    # 660.
+
+    state_660_actions,
+
+    # 661.
+
+    state_661_actions,
+
+    # 662.
+
+    state_662_actions,
+
+    # 663.
+
+    state_663_actions,
+
+    # 664.
+
+    state_664_actions,
+
+    # 665.
+
+    state_665_actions,
+
+    # 666.
+
+    state_666_actions,
+
+    # 667.
+
+    state_667_actions,
+
+    # 668.
+
+    state_668_actions,
+
+    # 669.
+
+    state_669_actions,
+
+    # 670.
+
+    state_670_actions,
+
+    # 671.
+
+    state_671_actions,
+
+    # 672.
+
+    state_672_actions,
+
+    # 673.
+
+    state_673_actions,
+
+    # 674.
+
+    state_674_actions,
+
+    # 675.
+
+    state_675_actions,
+
+    # 676.
+
+    state_676_actions,
+
+    # 677.
+
+    state_677_actions,
+
+    # 678.
+
+    state_678_actions,
+
+    # 679.
+
+    state_679_actions,
+
+    # 680.
+
+    state_680_actions,
+
+    # 681.
+
+    state_681_actions,
+
+    # 682.
+
+    state_682_actions,
+
+    # 683.
+
+    state_683_actions,
+
+    # 684.
+
+    state_684_actions,
+
+    # 685.
+
+    state_685_actions,
+
+    # 686.
+
+    state_686_actions,
+
+    # 687.
+
+    state_687_actions,
+
+    # 688.
+
+    state_688_actions,
+
+    # 689.
+
+    state_689_actions,
+
+    # 690.
+
+    state_690_actions,
+
+    # 691.
+
+    state_691_actions,
+
+    # 692.
+
+    state_692_actions,
+
+    # 693.
+
+    state_693_actions,
+
+    # 694.
+
+    state_694_actions,
+
+    # 695.
+
+    state_695_actions,
+
+    # 696.
+
+    state_696_actions,
+
+    # 697.
+
+    state_697_actions,
+
+    # 698.
+
+    state_698_actions,
+
+    # 699.
+
+    state_699_actions,
+
+    # 700.
+
+    state_700_actions,
+
+    # 701.
+
+    state_701_actions,
+
+    # 702.
+
+    state_702_actions,
+
+    # 703.
+
+    state_703_actions,
+
+    # 704.
+
+    state_704_actions,
+
+    # 705.
+
+    state_705_actions,
+
+    # 706.
+
+    state_706_actions,
+
+    # 707.
+
+    state_707_actions,
+
+    # 708.
+
+    state_708_actions,
+
+    # 709.
+
+    state_709_actions,
+
+    # 710.
+
+    state_710_actions,
+
+    # 711.
+
+    state_711_actions,
+
+    # 712.
+
+    state_712_actions,
+
+    # 713.
+
+    state_713_actions,
+
+    # 714.
+
+    state_714_actions,
+
+    # 715.
+
+    state_715_actions,
+
+    # 716.
+
+    state_716_actions,
+
+    # 717.
+
+    state_717_actions,
+
+    # 718.
+
+    state_718_actions,
+
+    # 719.
+
+    state_719_actions,
+
+    # 720.
+
+    state_720_actions,
+
+    # 721.
+
+    state_721_actions,
+
+    # 722.
+
+    state_722_actions,
+
+    # 723.
+
+    state_723_actions,
+
+    # 724.
+
+    state_724_actions,
+
+    # 725.
+
+    state_725_actions,
+
+    # 726.
+
+    state_726_actions,
+
+    # 727.
+
+    state_727_actions,
+
+    # 728.
+
+    state_728_actions,
+
+    # 729.
+
+    state_729_actions,
+
+    # 730.
+
+    state_730_actions,
+
+    # 731.
+
+    state_731_actions,
+
+    # 732.
+
+    state_732_actions,
+
+    # 733.
+
+    state_733_actions,
+
+    # 734.
+
+    state_734_actions,
+
+    # 735.
+
+    state_735_actions,
+
+    # 736.
+
+    state_736_actions,
+
+    # 737.
+
+    state_737_actions,
+
+    # 738.
+
+    state_738_actions,
+
+    # 739.
+
+    state_739_actions,
+
+    # 740.
+
+    state_740_actions,
+
+    # 741.
+
+    state_741_actions,
+
+    # 742.
+
+    state_742_actions,
+
+    # 743.
+
+    state_743_actions,
+
+    # 744.
+
+    state_744_actions,
+
+    # 745.
+
+    state_745_actions,
+
+    # 746.
+
+    state_746_actions,
+
+    # 747.
+
+    state_747_actions,
+
+    # 748.
+
+    state_748_actions,
+
+    # 749.
+
+    state_749_actions,
+
+    # 750.
+
+    state_750_actions,
+
+    # 751.
+
+    state_751_actions,
+
+    # 752.
+
+    state_752_actions,
+
+    # 753.
+
+    state_753_actions,
+
+    # 754.
+
+    state_754_actions,
+
+    # 755.
+
+    state_755_actions,
+
+    # 756.
+
+    state_756_actions,
+
+    # 757.
+
+    state_757_actions,
+
+    # 758.
+
+    state_758_actions,
+
+    # 759.
+
+    state_759_actions,
+
+    # 760.
+
+    state_760_actions,
+
+    # 761.
+
+    state_761_actions,
+
+    # 762.
+
+    state_762_actions,
+
+    # 763.
+
+    state_763_actions,
+
+    # 764.
+
+    state_764_actions,
+
+    # 765.
+
+    state_765_actions,
+
+    # 766.
+
+    state_766_actions,
+
+    # 767.
+
+    state_767_actions,
+
+    # 768.
+
+    state_768_actions,
+
+    # 769.
+
+    state_769_actions,
+
+    # 770.
+
+    state_770_actions,
+
+    # 771.
+
+    state_771_actions,
+
+    # 772.
+
+    state_772_actions,
+
+    # 773.
+
+    state_773_actions,
+
+    # 774.
+
+    state_774_actions,
+
+    # 775.
+
+    state_775_actions,
+
+    # 776.
+
+    state_776_actions,
+
+    # 777.
+
+    state_777_actions,
+
+    # 778.
+
+    state_778_actions,
+
+    # 779.
+
+    state_779_actions,
+
+    # 780.
+
+    state_780_actions,
+
+    # 781.
+
+    state_781_actions,
+
+    # 782.
+
+    state_782_actions,
+
+    # 783.
+
+    state_783_actions,
+
+    # 784.
+
+    state_784_actions,
+
+    # 785.
+
+    state_785_actions,
+
+    # 786.
+
+    state_786_actions,
+
+    # 787.
+
+    state_787_actions,
+
+    # 788.
+
+    state_788_actions,
+
+    # 789.
+
+    state_789_actions,
+
+    # 790.
+
+    state_790_actions,
+
+    # 791.
+
+    state_791_actions,
+
+    # 792.
+
+    state_792_actions,
+
+    # 793.
+
+    state_793_actions,
+
+    # 794.
+
+    state_794_actions,
+
+    # 795.
+
+    state_795_actions,
+
+    # 796.
+
+    state_796_actions,
+
+    # 797.
+
+    state_797_actions,
+
+    # 798.
+
+    state_798_actions,
+
+    # 799.
+
+    state_799_actions,
+
+    # 800.
+
+    state_800_actions,
+
+    # 801.
+
+    state_801_actions,
+
+    # 802.
+
+    state_802_actions,
+
+    # 803.
+
+    state_803_actions,
+
+    # 804.
+
+    state_804_actions,
+
+    # 805.
+
+    state_805_actions,
+
+    # 806.
+
+    state_806_actions,
+
+    # 807.
+
+    state_807_actions,
+
+    # 808.
+
+    state_808_actions,
+
+    # 809.
+
+    state_809_actions,
+
+    # 810.
+
+    state_810_actions,
+
+    # 811.
+
+    state_811_actions,
+
+    # 812.
+
+    state_812_actions,
+
+    # 813.
+
+    state_813_actions,
+
+    # 814.
+
+    state_814_actions,
+
+    # 815.
+
+    state_815_actions,
+
+    # 816.
+
+    state_816_actions,
+
+    # 817.
+
+    state_817_actions,
+
+    # 818.
+
+    state_818_actions,
+
+    # 819.
+
+    state_819_actions,
+
+    # 820.
+
+    state_820_actions,
+
+    # 821.
+
+    state_821_actions,
+
+    # 822.
+
+    state_822_actions,
+
+    # 823.
+
+    state_823_actions,
+
+    # 824.
+
+    state_824_actions,
+
+    # 825.
+
+    state_825_actions,
+
+    # 826.
+
+    state_826_actions,
+
+    # 827.
+
+    state_827_actions,
+
+    # 828.
+
+    state_828_actions,
+
+    # 829.
+
+    state_829_actions,
+
+    # 830.
+
+    state_830_actions,
+
+    # 831.
+
+    state_831_actions,
+
+    # 832.
+
+    state_832_actions,
+
+    # 833.
+
+    state_833_actions,
+
+    # 834.
+
+    state_834_actions,
+
+    # 835.
+
+    state_835_actions,
+
+    # 836.
+
+    state_836_actions,
+
+    # 837.
+
+    state_837_actions,
+
+    # 838.
+
+    state_838_actions,
+
+    # 839.
+
+    state_839_actions,
+
+    # 840.
+
+    state_840_actions,
+
+    # 841.
+
+    state_841_actions,
+
+    # 842.
+
+    state_842_actions,
+
+    # 843.
+
+    state_843_actions,
+
+    # 844.
+
+    state_844_actions,
+
+    # 845.
+
+    state_845_actions,
+
+    # 846.
+
+    state_846_actions,
+
+    # 847.
+
+    state_847_actions,
+
+    # 848.
+
+    state_848_actions,
+
+    # 849.
+
+    state_849_actions,
+
+    # 850.
+
+    state_850_actions,
+
+    # 851.
+
+    state_851_actions,
+
+    # 852.
+
+    state_852_actions,
+
+    # 853.
+
+    state_853_actions,
+
+    # 854.
+
+    state_854_actions,
+
+    # 855.
+
+    state_855_actions,
+
+    # 856.
+
+    state_856_actions,
+
+    # 857.
+
+    state_857_actions,
+
+    # 858.
+
+    state_858_actions,
+
+    # 859.
+
+    state_859_actions,
+
+    # 860.
+
+    state_860_actions,
+
+    # 861.
+
+    state_861_actions,
+
+    # 862.
+
+    state_862_actions,
+
+    # 863.
+
+    state_863_actions,
+
+    # 864.
+
+    state_864_actions,
+
+    # 865.
+
+    state_865_actions,
+
+    # 866.
+
+    state_866_actions,
+
+    # 867.
+
+    state_867_actions,
+
+    # 868.
+
+    state_868_actions,
+
+    # 869.
+
+    state_869_actions,
+
+    # 870.
+
+    state_870_actions,
+
+    # 871.
+
+    state_871_actions,
+
+    # 872.
+
+    state_872_actions,
+
+    # 873.
+
+    state_873_actions,
+
+    # 874.
+
+    state_874_actions,
+
+    # 875.
+
+    state_875_actions,
+
+    # 876.
+
+    state_876_actions,
+
+    # 877.
+
+    state_877_actions,
+
+    # 878.
+
+    state_878_actions,
+
+    # 879.
+
+    state_879_actions,
+
+    # 880.
+
+    state_880_actions,
+
+    # 881.
+
+    state_881_actions,
+
+    # 882.
+
+    state_882_actions,
+
+    # 883.
+
+    state_883_actions,
+
+    # 884.
+
+    state_884_actions,
+
+    # 885.
+
+    state_885_actions,
+
+    # 886.
+
+    state_886_actions,
+
+    # 887.
+
+    state_887_actions,
+
+    # 888.
+
+    state_888_actions,
+
+    # 889.
+
+    state_889_actions,
+
+    # 890.
+
+    state_890_actions,
+
+    # 891.
+
+    state_891_actions,
+
+    # 892.
+
+    state_892_actions,
+
+    # 893.
+
+    state_893_actions,
+
+    # 894.
+
+    state_894_actions,
+
+    # 895.
+
+    state_895_actions,
+
+    # 896.
+
+    state_896_actions,
+
+    # 897.
+
+    state_897_actions,
+
+    # 898.
+
+    state_898_actions,
+
+    # 899.
+
+    state_899_actions,
+
+    # 900.
+
+    state_900_actions,
+
+    # 901.
+
+    state_901_actions,
+
+    # 902.
+
+    state_902_actions,
+
+    # 903.
+
+    state_903_actions,
+
+    # 904.
+
+    state_904_actions,
+
+    # 905.
+
+    state_905_actions,
+
+    # 906.
+
+    state_906_actions,
+
+    # 907.
+
+    state_907_actions,
+
+    # 908.
+
+    state_908_actions,
+
+    # 909.
+
+    state_909_actions,
+
+    # 910.
+
+    state_910_actions,
+
+    # 911.
+
+    state_911_actions,
+
+    # 912.
+
+    state_912_actions,
+
+    # 913.
+
+    state_913_actions,
+
+    # 914.
+
+    state_914_actions,
+
+    # 915.
+
+    state_915_actions,
+
+    # 916.
+
+    state_916_actions,
+
+    # 917.
+
+    state_917_actions,
+
+    # 918.
+
+    state_918_actions,
+
+    # 919.
+
+    state_919_actions,
+
+    # 920.
+
+    state_920_actions,
+
+    # 921.
+
+    state_921_actions,
+
+    # 922.
+
+    state_922_actions,
+
+    # 923.
+
+    state_923_actions,
+
+    # 924.
+
+    state_924_actions,
+
+    # 925.
+
+    state_925_actions,
+
+    # 926.
+
+    state_926_actions,
+
+    # 927.
+
+    state_927_actions,
+
+    # 928.
+
+    state_928_actions,
+
+    # 929.
+
+    state_929_actions,
+
+    # 930.
+
+    state_930_actions,
+
+    # 931.
+
+    state_931_actions,
+
+    # 932.
+
+    state_932_actions,
+
+    # 933.
+
+    state_933_actions,
+
+    # 934.
+
+    state_934_actions,
+
+    # 935.
+
+    state_935_actions,
+
+    # 936.
+
+    state_936_actions,
+
+    # 937.
+
+    state_937_actions,
+
+    # 938.
+
+    state_938_actions,
+
+    # 939.
+
+    state_939_actions,
+
+    # 940.
+
+    state_940_actions,
+
+    # 941.
+
+    state_941_actions,
+
+    # 942.
+
+    state_942_actions,
+
+    # 943.
+
+    state_943_actions,
+
+    # 944.
+
+    state_944_actions,
+
+    # 945.
+
+    state_945_actions,
+
+    # 946.
+
+    state_946_actions,
+
+    # 947.
+
+    state_947_actions,
+
+    # 948.
+
+    state_948_actions,
+
+    # 949.
+
+    state_949_actions,
+
+    # 950.
+
+    state_950_actions,
+
+    # 951.
+
+    state_951_actions,
+
+    # 952.
+
+    state_952_actions,
+
+    # 953.
+
+    state_953_actions,
+
+    # 954.
+
+    state_954_actions,
+
+    # 955.
+
+    state_955_actions,
+
+    # 956.
+
+    state_956_actions,
+
+    # 957.
+
+    state_957_actions,
+
+    # 958.
+
+    state_958_actions,
+
+    # 959.
+
+    state_959_actions,
+
+    # 960.
+
+    state_960_actions,
+
+    # 961.
+
+    state_961_actions,
+
+    # 962.
+
+    state_962_actions,
+
+    # 963.
+
+    state_963_actions,
+
+    # 964.
+
+    state_964_actions,
+
+    # 965.
+
+    state_965_actions,
+
+    # 966.
+
+    state_966_actions,
+
+    # 967.
+
+    state_967_actions,
+
+    # 968.
+
+    state_968_actions,
+
+    # 969.
+
+    state_969_actions,
+
+    # 970.
+
+    state_970_actions,
+
+    # 971.
+
+    state_971_actions,
+
+    # 972.
+
+    state_972_actions,
+
+    # 973.
+
+    state_973_actions,
+
+    # 974.
+
+    state_974_actions,
+
+    # 975.
+
+    state_975_actions,
+
+    # 976.
+
+    state_976_actions,
+
+    # 977.
+
+    state_977_actions,
+
+    # 978.
+
+    state_978_actions,
+
+    # 979.
+
+    state_979_actions,
+
+    # 980.
+
+    state_980_actions,
+
+    # 981.
+
+    state_981_actions,
+
+    # 982.
+
+    state_982_actions,
+
+    # 983.
+
+    state_983_actions,
+
+    # 984.
+
+    state_984_actions,
+
+    # 985.
+
+    state_985_actions,
+
+    # 986.
+
+    state_986_actions,
+
+    # 987.
+
+    state_987_actions,
+
+    # 988.
+
+    state_988_actions,
+
+    # 989.
+
+    state_989_actions,
+
+    # 990.
+
+    state_990_actions,
+
+    # 991.
+
+    state_991_actions,
+
+    # 992.
+
+    state_992_actions,
+
+    # 993.
+
+    state_993_actions,
+
+    # 994.
+
+    state_994_actions,
+
+    # 995.
+
+    state_995_actions,
+
+    # 996.
+
+    state_996_actions,
+
+    # 997.
+
+    state_997_actions,
+
+    # 998.
+
+    state_998_actions,
+
+    # 999.
+
+    state_999_actions,
+
+    # 1000.
+
+    state_1000_actions,
+
+    # 1001.
+
+    state_1001_actions,
+
+    # 1002.
+
+    state_1002_actions,
+
+    # 1003.
+
+    state_1003_actions,
+
+    # 1004.
+
+    state_1004_actions,
+
+    # 1005.
+
+    state_1005_actions,
+
+    # 1006.
+
+    state_1006_actions,
+
+    # 1007.
+
+    state_1007_actions,
+
+    # 1008.
+
+    state_1008_actions,
+
+    # 1009.
+
+    state_1009_actions,
+
+    # 1010.
+
+    state_1010_actions,
+
+    # 1011.
+
+    state_1011_actions,
+
+    # 1012.
+
+    state_1012_actions,
+
+    # 1013.
+
+    state_1013_actions,
+
+    # 1014.
+
+    state_1014_actions,
+
+    # 1015.
+
+    state_1015_actions,
+
+    # 1016.
+
+    state_1016_actions,
+
+    # 1017.
+
+    state_1017_actions,
+
+    # 1018.
+
+    state_1018_actions,
+
+    # 1019.
+
+    state_1019_actions,
+
+    # 1020.
+
+    state_1020_actions,
+
+    # 1021.
+
+    state_1021_actions,
+
+    # 1022.
+
+    state_1022_actions,
+
+    # 1023.
+
+    state_1023_actions,
+
+    # 1024.
+
+    state_1024_actions,
+
+    # 1025.
+
+    state_1025_actions,
+
+    # 1026.
+
+    state_1026_actions,
+
+    # 1027.
+
+    state_1027_actions,
+
+    # 1028.
+
+    state_1028_actions,
+
+    # 1029.
+
+    state_1029_actions,
+
+    # 1030.
+
+    state_1030_actions,
+
+    # 1031.
+
+    state_1031_actions,
+
+    # 1032.
+
+    state_1032_actions,
+
+    # 1033.
+
+    state_1033_actions,
+
+    # 1034.
+
+    state_1034_actions,
+
+    # 1035.
+
+    state_1035_actions,
+
+    # 1036.
+
+    state_1036_actions,
+
+    # 1037.
+
+    state_1037_actions,
+
+    # 1038.
+
+    state_1038_actions,
+
+    # 1039.
+
+    state_1039_actions,
+
+    # 1040.
+
+    state_1040_actions,
+
+    # 1041.
+
+    state_1041_actions,
+
+    # 1042.
+
+    state_1042_actions,
+
+    # 1043.
+
+    state_1043_actions,
+
+    # 1044.
+
+    state_1044_actions,
+
+    # 1045.
+
+    state_1045_actions,
+
+    # 1046.
+
+    state_1046_actions,
+
+    # 1047.
+
+    state_1047_actions,
+
+    # 1048.
+
+    state_1048_actions,
+
+    # 1049.
+
+    state_1049_actions,
+
+    # 1050.
+
+    state_1050_actions,
+
+    # 1051.
+
+    state_1051_actions,
+
+    # 1052.
+
+    state_1052_actions,
+
+    # 1053.
+
+    state_1053_actions,
+
+    # 1054.
+
+    state_1054_actions,
+
+    # 1055.
+
+    state_1055_actions,
+
+    # 1056.
+
+    state_1056_actions,
+
+    # 1057.
+
+    state_1057_actions,
+
+    # 1058.
+
+    state_1058_actions,
+
+    # 1059.
+
+    state_1059_actions,
+
+    # 1060.
+
+    state_1060_actions,
+
+    # 1061.
+
+    state_1061_actions,
+
+    # 1062.
+
+    state_1062_actions,
+
+    # 1063.
+
+    state_1063_actions,
+
+    # 1064.
+
+    state_1064_actions,
+
+    # 1065.
+
+    state_1065_actions,
+
+    # 1066.
+
+    state_1066_actions,
+
+    # 1067.
+
+    state_1067_actions,
+
+    # 1068.
+
+    state_1068_actions,
+
+    # 1069.
+
+    state_1069_actions,
+
+    # 1070.
+
+    state_1070_actions,
+
+    # 1071.
+
+    state_1071_actions,
+
+    # 1072.
+
+    state_1072_actions,
+
+    # 1073.
+
+    state_1073_actions,
+
+    # 1074.
+
+    state_1074_actions,
+
+    # 1075.
+
+    state_1075_actions,
+
+    # 1076.
+
+    state_1076_actions,
+
+    # 1077.
+
+    state_1077_actions,
+
+    # 1078.
+
+    state_1078_actions,
+
+    # 1079.
+
+    state_1079_actions,
+
+    # 1080.
+
+    state_1080_actions,
+
+    # 1081.
+
+    state_1081_actions,
+
+    # 1082.
+
+    state_1082_actions,
+
+    # 1083.
+
+    state_1083_actions,
+
+    # 1084.
+
+    state_1084_actions,
+
+    # 1085.
+
+    state_1085_actions,
+
+    # 1086.
+
+    state_1086_actions,
+
+    # 1087.
+
+    state_1087_actions,
+
+    # 1088.
+
+    state_1088_actions,
+
+    # 1089.
+
+    state_1089_actions,
+
+    # 1090.
+
+    state_1090_actions,
+
+    # 1091.
+
+    state_1091_actions,
+
+    # 1092.
+
+    state_1092_actions,
+
+    # 1093.
+
+    state_1093_actions,
+
+    # 1094.
+
+    state_1094_actions,
+
+    # 1095.
+
+    state_1095_actions,
+
+    # 1096.
+
+    state_1096_actions,
+
+    # 1097.
+
+    state_1097_actions,
+
+    # 1098.
+
+    state_1098_actions,
+
+    # 1099.
+
+    state_1099_actions,
+
+    # 1100.
+
+    state_1100_actions,
+
+    # 1101.
+
+    state_1101_actions,
+
+    # 1102.
+
+    state_1102_actions,
+
+    # 1103.
+
+    state_1103_actions,
+
+    # 1104.
+
+    state_1104_actions,
+
+    # 1105.
+
+    state_1105_actions,
+
+    # 1106.
+
+    state_1106_actions,
+
+    # 1107.
+
+    state_1107_actions,
+
+    # 1108.
+
+    state_1108_actions,
+
+    # 1109.
+
+    state_1109_actions,
+
+    # 1110.
+
+    state_1110_actions,
+
+    # 1111.
+
+    state_1111_actions,
+
+    # 1112.
+
+    state_1112_actions,
+
+    # 1113.
+
+    state_1113_actions,
+
+    # 1114.
+
+    state_1114_actions,
+
+    # 1115.
+
+    state_1115_actions,
+
+    # 1116.
+
+    state_1116_actions,
+
+    # 1117.
+
+    state_1117_actions,
+
+    # 1118.
+
+    state_1118_actions,
+
+    # 1119.
+
+    state_1119_actions,
+
+    # 1120.
+
+    state_1120_actions,
+
+    # 1121.
+
+    state_1121_actions,
+
+    # 1122.
+
+    state_1122_actions,
+
+    # 1123.
+
+    state_1123_actions,
+
+    # 1124.
+
+    state_1124_actions,
+
+    # 1125.
+
+    state_1125_actions,
+
+    # 1126.
+
+    state_1126_actions,
+
+    # 1127.
+
+    state_1127_actions,
+
+    # 1128.
+
+    state_1128_actions,
+
+    # 1129.
+
+    state_1129_actions,
+
+    # 1130.
+
+    state_1130_actions,
+
+    # 1131.
+
+    state_1131_actions,
+
+    # 1132.
+
+    state_1132_actions,
+
+    # 1133.
+
+    state_1133_actions,
+
+    # 1134.
+
+    state_1134_actions,
+
+    # 1135.
+
+    state_1135_actions,
+
+    # 1136.
+
+    state_1136_actions,
+
+    # 1137.
+
+    state_1137_actions,
+
+    # 1138.
+
+    state_1138_actions,
+
+    # 1139.
+
+    state_1139_actions,
+
+    # 1140.
+
+    state_1140_actions,
+
+    # 1141.
+
+    state_1141_actions,
+
+    # 1142.
+
+    state_1142_actions,
+
+    # 1143.
+
+    state_1143_actions,
+
+    # 1144.
+
+    state_1144_actions,
+
+    # 1145.
+
+    state_1145_actions,
+
+    # 1146.
+
+    state_1146_actions,
+
+    # 1147.
+
+    state_1147_actions,
+
+    # 1148.
+
+    state_1148_actions,
+
+    # 1149.
+
+    state_1149_actions,
+
+    # 1150.
+
+    state_1150_actions,
+
+    # 1151.
+
+    state_1151_actions,
+
+    # 1152.
+
+    state_1152_actions,
+
+    # 1153.
+
+    state_1153_actions,
+
+    # 1154.
+
+    state_1154_actions,
+
+    # 1155.
+
+    state_1155_actions,
+
+    # 1156.
+
+    state_1156_actions,
+
+    # 1157.
+
+    state_1157_actions,
+
+    # 1158.
+
+    state_1158_actions,
+
+    # 1159.
+
+    state_1159_actions,
+
+    # 1160.
+
+    state_1160_actions,
+
+    # 1161.
+
+    state_1161_actions,
+
+    # 1162.
+
+    state_1162_actions,
+
+    # 1163.
+
+    state_1163_actions,
+
+    # 1164.
+
+    state_1164_actions,
+
+    # 1165.
+
+    state_1165_actions,
+
+    # 1166.
+
+    state_1166_actions,
+
+    # 1167.
+
+    state_1167_actions,
+
+    # 1168.
+
+    state_1168_actions,
+
+    # 1169.
+
+    state_1169_actions,
+
+    # 1170.
+
+    state_1170_actions,
+
+    # 1171.
+
+    state_1171_actions,
+
+    # 1172.
+
+    state_1172_actions,
+
+    # 1173.
+
+    state_1173_actions,
+
+    # 1174.
+
+    state_1174_actions,
+
+    # 1175.
+
+    state_1175_actions,
+
+    # 1176.
+
+    state_1176_actions,
+
+    # 1177.
+
+    state_1177_actions,
+
+    # 1178.
+
+    state_1178_actions,
+
+    # 1179.
+
+    state_1179_actions,
+
+    # 1180.
+
+    state_1180_actions,
+
+    # 1181.
+
+    state_1181_actions,
+
+    # 1182.
+
+    state_1182_actions,
+
+    # 1183.
+
+    state_1183_actions,
+
+    # 1184.
+
+    state_1184_actions,
+
+    # 1185.
+
+    state_1185_actions,
+
+    # 1186.
+
+    state_1186_actions,
+
+    # 1187.
+
+    state_1187_actions,
+
+    # 1188.
+
+    state_1188_actions,
+
+    # 1189.
+
+    state_1189_actions,
+
+    # 1190.
+
+    state_1190_actions,
+
+    # 1191.
+
+    state_1191_actions,
+
+    # 1192.
+
+    state_1192_actions,
+
+    # 1193.
+
+    state_1193_actions,
+
+    # 1194.
+
+    state_1194_actions,
+
+]
+
+error_codes = [
+    None, None, None, None, None, None, None, None, None, None, None, 'asi', 'asi', 'asi', None, None,
+    'asi', 'asi', None, None, 'asi', None, None, None, None, None, None, None, None, 'asi', 'asi', None,
+    None, None, 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi',
+    'asi', 'asi', 'asi', None, None, None, None, None, 'asi', None, None, None, 'asi', 'asi', None, 'asi',
+    None, None, None, None, None, None, None, None, None, 'asi', None, 'asi', None, None, None, None,
+    None, None, None, None, None, None, None, None, None, 'asi', 'asi', None, None, None, None, None,
+    'asi', None, 'asi', None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 'asi', None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, 'asi', 'asi',
+    None, None, None, None, 'asi', None, None, None, None, None, None, None, None, None, None, None,
+    'asi', 'asi', 'asi', None, None, None, 'asi', None, None, None, None, None, None, 'asi', None, None,
+    None, None, None, 'asi', 'asi', None, None, None, None, None, None, None, None, None, None, None,
+    'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi', 'asi',
+    'asi', 'asi', 'asi', 'asi', 'asi', None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 'asi', 'asi', 'asi', 'asi', 'asi',
+    'asi', 'asi', None, None, None, None, None, None, None, None, None, None, 'asi', None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 'asi', 'asi', None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    'asi', None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 'asi', None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 'do_while_asi', None, None, None, None,
+    None, 'asi', None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 'asi', None, None,
+    None, 'asi', None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+]
+
+goal_nt_to_init_state = {'Script': 0, 'Module': 1}
+
+class DefaultMethods:
+    def script(self, x0):
+        return ('script', x0)
+    def statement_list_single(self, x0):
+        return ('statement_list_single', x0)
+    def block_statement(self, x0):
+        return ('block_statement', x0)
+    def empty_statement(self, x0):
+        return ('empty_statement', x0)
+    def label_identifier(self, x0):
+        return ('label_identifier', x0)
+    def const_kind(self, x0):
+        return ('const_kind', x0)
+    def module(self, x0):
+        return ('module', x0)
+    def module_item_list_single(self, x0):
+        return ('module_item_list_single', x0)
+    def statement_list_append(self, x0, x1):
+        return ('statement_list_append', x0, x1)
+    def block(self, x0, x1, x2):
+        return ('block', x0, x1, x2)
+    def variable_declaration_list_single(self, x0):
+        return ('variable_declaration_list_single', x0)
+    def binding_identifier(self, x0):
+        return ('binding_identifier', x0)
+    def binding_identifier_yield(self, x0):
+        return ('binding_identifier_yield', x0)
+    def binding_identifier_await(self, x0):
+        return ('binding_identifier_await', x0)
+    def this_expr(self, x0):
+        return ('this_expr', x0)
+    def identifier_expr(self, x0):
+        return ('identifier_expr', x0)
+    def null_literal(self, x0):
+        return ('null_literal', x0)
+    def boolean_literal(self, x0):
+        return ('boolean_literal', x0)
+    def numeric_literal(self, x0):
+        return ('numeric_literal', x0)
+    def bigint_literal(self, x0):
+        return ('bigint_literal', x0)
+    def string_literal(self, x0):
+        return ('string_literal', x0)
+    def regexp_literal(self, x0):
+        return ('regexp_literal', x0)
+    def untagged_template_expr(self, x0):
+        return ('untagged_template_expr', x0)
+    def template_literal(self, x0):
+        return ('template_literal', x0)
+    def arrow_parameters_bare(self, x0):
+        return ('arrow_parameters_bare', x0)
+    def continue_statement(self, x0, x1):
+        return ('continue_statement', x0, x1)
+    def break_statement(self, x0, x1):
+        return ('break_statement', x0, x1)
+    def return_statement(self, x0, x1):
+        return ('return_statement', x0, x1)
+    def debugger_statement(self, x0):
+        return ('debugger_statement', x0)
+    def module_item_list_append(self, x0, x1):
+        return ('module_item_list_append', x0, x1)
+    def import_clause(self, x0, x1, x2):
+        return ('import_clause', x0, x1, x2)
+    def import_clause(self, x0, x1, x2):
+        return ('import_clause', x0, x1, x2)
+    def module_specifier(self, x0):
+        return ('module_specifier', x0)
+    def export_vars(self, x0):
+        return ('export_vars', x0)
+    def export_declaration(self, x0):
+        return ('export_declaration', x0)
+    def let_kind(self, x0):
+        return ('let_kind', x0)
+    def block(self, x0, x1, x2):
+        return ('block', x0, x1, x2)
+    def variable_statement(self, x0, x1):
+        return ('variable_statement', x0, x1)
+    def binding_identifier_to_binding(self, x0):
+        return ('binding_identifier_to_binding', x0)
+    def variable_declaration(self, x0, x1):
+        return ('variable_declaration', x0, x1)
+    def variable_declaration(self, x0, x1):
+        return ('variable_declaration', x0, x1)
+    def binding_property_list_empty(self, ):
+        return ('binding_property_list_empty', )
+    def object_binding_pattern(self, x0, x1, x2, x3):
+        return ('object_binding_pattern', x0, x1, x2, x3)
+    def binding_property_list_single(self, x0):
+        return ('binding_property_list_single', x0)
+    def binding_property_shorthand(self, x0):
+        return ('binding_property_shorthand', x0)
+    def property_name_identifier(self, x0):
+        return ('property_name_identifier', x0)
+    def property_name_string(self, x0):
+        return ('property_name_string', x0)
+    def property_name_numeric(self, x0):
+        return ('property_name_numeric', x0)
+    def property_name_bigint(self, x0):
+        return ('property_name_bigint', x0)
+    def binding_element_list_empty(self, ):
+        return ('binding_element_list_empty', )
+    def array_binding_pattern(self, x0, x1, x2, x3, x4):
+        return ('array_binding_pattern', x0, x1, x2, x3, x4)
+    def elision_single(self, x0):
+        return ('elision_single', x0)
+    def binding_elision_element(self, x0, x1):
+        return ('binding_elision_element', x0, x1)
+    def expression_statement(self, x0):
+        return ('expression_statement', x0)
+    def mul_op(self, x0):
+        return ('mul_op', x0)
+    def box_op(self, x0):
+        return ('box_op', x0)
+    def div_op(self, x0):
+        return ('div_op', x0)
+    def mod_op(self, x0):
+        return ('mod_op', x0)
+    def mul_assign_op(self, x0):
+        return ('mul_assign_op', x0)
+    def box_assign_op(self, x0):
+        return ('box_assign_op', x0)
+    def div_assign_op(self, x0):
+        return ('div_assign_op', x0)
+    def mod_assign_op(self, x0):
+        return ('mod_assign_op', x0)
+    def add_assign_op(self, x0):
+        return ('add_assign_op', x0)
+    def sub_assign_op(self, x0):
+        return ('sub_assign_op', x0)
+    def left_shift_assign_op(self, x0):
+        return ('left_shift_assign_op', x0)
+    def right_shift_assign_op(self, x0):
+        return ('right_shift_assign_op', x0)
+    def right_shift_ext_assign_op(self, x0):
+        return ('right_shift_ext_assign_op', x0)
+    def bitwise_and_assign_op(self, x0):
+        return ('bitwise_and_assign_op', x0)
+    def bitwise_xor_assign_op(self, x0):
+        return ('bitwise_xor_assign_op', x0)
+    def bitwise_or_assign_op(self, x0):
+        return ('bitwise_or_assign_op', x0)
+    def pow_assign_op(self, x0):
+        return ('pow_assign_op', x0)
+    def tagged_template_expr(self, x0, x1):
+        return ('tagged_template_expr', x0, x1)
+    def call_expr(self, x0, x1):
+        return ('call_expr', x0, x1)
+    def array_literal_empty(self, x0, x1, x2):
+        return ('array_literal_empty', x0, x1, x2)
+    def element_list_first(self, x0, x1):
+        return ('element_list_first', x0, x1)
+    def element_list_first_spread(self, x0, x1):
+        return ('element_list_first_spread', x0, x1)
+    def object_literal_empty(self, x0, x1):
+        return ('object_literal_empty', x0, x1)
+    def property_definition_list_single(self, x0):
+        return ('property_definition_list_single', x0)
+    def identifier_reference(self, x0):
+        return ('identifier_reference', x0)
+    def property_definition_method(self, x0):
+        return ('property_definition_method', x0)
+    def class_expression(self, x0, x1, x2):
+        return ('class_expression', x0, x1, x2)
+    def empty_parameter_list(self, ):
+        return ('empty_parameter_list', )
+    def cover_arrow_parameter_list(self, x0, x1, x2, x3):
+        return ('cover_arrow_parameter_list', x0, x1, x2, x3)
+    def super_call(self, x0, x1):
+        return ('super_call', x0, x1)
+    def uncover_parenthesized_expression(self, x0):
+        return ('uncover_parenthesized_expression', x0)
+    def new_expr_without_arguments(self, x0, x1):
+        return ('new_expr_without_arguments', x0, x1)
+    def pre_decrement_expr(self, x0, x1):
+        return ('pre_decrement_expr', x0, x1)
+    def delete_expr(self, x0, x1):
+        return ('delete_expr', x0, x1)
+    def void_expr(self, x0, x1):
+        return ('void_expr', x0, x1)
+    def typeof_expr(self, x0, x1):
+        return ('typeof_expr', x0, x1)
+    def unary_plus_expr(self, x0, x1):
+        return ('unary_plus_expr', x0, x1)
+    def unary_minus_expr(self, x0, x1):
+        return ('unary_minus_expr', x0, x1)
+    def bitwise_not_expr(self, x0, x1):
+        return ('bitwise_not_expr', x0, x1)
+    def logical_not_expr(self, x0, x1):
+        return ('logical_not_expr', x0, x1)
+    def await_expr(self, x0, x1):
+        return ('await_expr', x0, x1)
+    def labelled_statement(self, x0, x1):
+        return ('labelled_statement', x0, x1)
+    def try_statement(self, x0, x1, x2, x3):
+        return ('try_statement', x0, x1, x2, x3)
+    def class_declaration(self, x0, x1, x2):
+        return ('class_declaration', x0, x1, x2)
+    def lexical_declaration(self, x0, x1):
+        return ('lexical_declaration', x0, x1)
+    def imports_list_empty(self, ):
+        return ('imports_list_empty', )
+    def imports_list_empty(self, ):
+        return ('imports_list_empty', )
+    def imports_list_append(self, x0, x1):
+        return ('imports_list_append', x0, x1)
+    def import_specifier(self, x0):
+        return ('import_specifier', x0)
+    def import_declaration(self, x0, x1):
+        return ('import_declaration', x0, x1)
+    def export_set(self, x0):
+        return ('export_set', x0)
+    def exports_list_empty(self, ):
+        return ('exports_list_empty', )
+    def exports_list_empty(self, ):
+        return ('exports_list_empty', )
+    def exports_list_append(self, x0, x1):
+        return ('exports_list_append', x0, x1)
+    def export_default_hoistable(self, x0):
+        return ('export_default_hoistable', x0)
+    def export_default_class(self, x0):
+        return ('export_default_class', x0)
+    def variable_declaration_list_append(self, x0, x1):
+        return ('variable_declaration_list_append', x0, x1)
+    def object_binding_pattern(self, x0, x1, x2, x3):
+        return ('object_binding_pattern', x0, x1, x2, x3)
+    def object_binding_pattern(self, x0, x1, x2, x3):
+        return ('object_binding_pattern', x0, x1, x2, x3)
+    def single_name_binding(self, x0, x1):
+        return ('single_name_binding', x0, x1)
+    def array_binding_pattern(self, x0, x1, x2, x3, x4):
+        return ('array_binding_pattern', x0, x1, x2, x3, x4)
+    def elision_append(self, x0, x1):
+        return ('elision_append', x0, x1)
+    def binding_elision_element(self, x0, x1):
+        return ('binding_elision_element', x0, x1)
+    def array_binding_pattern(self, x0, x1, x2, x3, x4):
+        return ('array_binding_pattern', x0, x1, x2, x3, x4)
+    def binding_identifier_to_binding(self, x0):
+        return ('binding_identifier_to_binding', x0)
+    def array_binding_pattern(self, x0, x1, x2, x3, x4):
+        return ('array_binding_pattern', x0, x1, x2, x3, x4)
+    def binding_element_pattern(self, x0, x1):
+        return ('binding_element_pattern', x0, x1)
+    def comma_op(self, x0):
+        return ('comma_op', x0)
+    def binary_expr(self, x0, x1, x2):
+        return ('binary_expr', x0, x1, x2)
+    def multiplicative_expr(self, x0, x1, x2):
+        return ('multiplicative_expr', x0, x1, x2)
+    def pow_op(self, x0):
+        return ('pow_op', x0)
+    def post_increment_expr(self, x0, x1):
+        return ('post_increment_expr', x0, x1)
+    def post_decrement_expr(self, x0, x1):
+        return ('post_decrement_expr', x0, x1)
+    def assignment_expr(self, x0, x1):
+        return ('assignment_expr', x0, x1)
+    def compound_assignment_expr(self, x0, x1, x2):
+        return ('compound_assignment_expr', x0, x1, x2)
+    def static_member_expr(self, x0, x1):
+        return ('static_member_expr', x0, x1)
+    def private_field_expr(self, x0, x1):
+        return ('private_field_expr', x0, x1)
+    def arguments_empty(self, x0, x1):
+        return ('arguments_empty', x0, x1)
+    def arguments_single(self, x0):
+        return ('arguments_single', x0)
+    def optional_call_expr(self, x0, x1):
+        return ('optional_call_expr', x0, x1)
+    def error_optional_chain_with_template(self, ):
+        return ('error_optional_chain_with_template', )
+    def optional_static_member_expr_tail(self, x0, x1):
+        return ('optional_static_member_expr_tail', x0, x1)
+    def optional_call_expr_tail(self, x0, x1):
+        return ('optional_call_expr_tail', x0, x1)
+    def array_literal_empty(self, x0, x1, x2):
+        return ('array_literal_empty', x0, x1, x2)
+    def element_list_first(self, x0, x1):
+        return ('element_list_first', x0, x1)
+    def element_list_first_spread(self, x0, x1):
+        return ('element_list_first_spread', x0, x1)
+    def array_literal(self, x0, x1, x2):
+        return ('array_literal', x0, x1, x2)
+    def spread_element(self, x0):
+        return ('spread_element', x0)
+    def object_literal(self, x0, x1, x2):
+        return ('object_literal', x0, x1, x2)
+    def cover_initialized_name(self, x0, x1):
+        return ('cover_initialized_name', x0, x1)
+    def property_definition_spread(self, x0):
+        return ('property_definition_spread', x0)
+    def empty_formal_parameters(self, ):
+        return ('empty_formal_parameters', )
+    def with_rest_parameter(self, x0, x1):
+        return ('with_rest_parameter', x0, x1)
+    def formal_parameter_list_single(self, x0):
+        return ('formal_parameter_list_single', x0)
+    def class_tail(self, x0, x1, x2):
+        return ('class_tail', x0, x1, x2)
+    def class_element(self, x0):
+        return ('class_element', x0)
+    def class_element_name_private(self, x0):
+        return ('class_element_name_private', x0)
+    def class_element_empty(self, ):
+        return ('class_element_empty', )
+    def class_expression(self, x0, x1, x2):
+        return ('class_expression', x0, x1, x2)
+    def substitution_template(self, x0, x1, x2):
+        return ('substitution_template', x0, x1, x2)
+    def template_spans(self, x0, x1):
+        return ('template_spans', x0, x1)
+    def cover_parenthesized_expression(self, x0, x1, x2):
+        return ('cover_parenthesized_expression', x0, x1, x2)
+    def super_property_static(self, x0, x1):
+        return ('super_property_static', x0, x1)
+    def new_target_expr(self, x0, x1):
+        return ('new_target_expr', x0, x1)
+    def new_expr_with_arguments(self, x0, x1, x2):
+        return ('new_expr_with_arguments', x0, x1, x2)
+    def yield_expr(self, x0, x1):
+        return ('yield_expr', x0, x1)
+    def for_declaration(self, x0, x1):
+        return ('for_declaration', x0, x1)
+    def continue_statement(self, x0, x1):
+        return ('continue_statement', x0, x1)
+    def break_statement(self, x0, x1):
+        return ('break_statement', x0, x1)
+    def return_statement(self, x0, x1):
+        return ('return_statement', x0, x1)
+    def throw_statement(self, x0, x1):
+        return ('throw_statement', x0, x1)
+    def try_statement(self, x0, x1, x2, x3):
+        return ('try_statement', x0, x1, x2, x3)
+    def catch_no_param(self, x0, x1):
+        return ('catch_no_param', x0, x1)
+    def import_declaration(self, x0, x1):
+        return ('import_declaration', x0, x1)
+    def import_clause(self, x0, x1, x2):
+        return ('import_clause', x0, x1, x2)
+    def import_clause(self, x0, x1, x2):
+        return ('import_clause', x0, x1, x2)
+    def name_space_import(self, x0):
+        return ('name_space_import', x0)
+    def export_all_from(self, x0):
+        return ('export_all_from', x0)
+    def export_set_from(self, x0, x1):
+        return ('export_set_from', x0, x1)
+    def class_declaration(self, x0, x1, x2):
+        return ('class_declaration', x0, x1, x2)
+    def binding_property_list_append(self, x0, x1):
+        return ('binding_property_list_append', x0, x1)
+    def object_binding_pattern(self, x0, x1, x2, x3):
+        return ('object_binding_pattern', x0, x1, x2, x3)
+    def binding_property(self, x0, x1):
+        return ('binding_property', x0, x1)
+    def computed_property_name(self, x0, x1, x2):
+        return ('computed_property_name', x0, x1, x2)
+    def array_binding_pattern(self, x0, x1, x2, x3, x4):
+        return ('array_binding_pattern', x0, x1, x2, x3, x4)
+    def binding_element_list_append(self, x0, x1):
+        return ('binding_element_list_append', x0, x1)
+    def array_binding_pattern(self, x0, x1, x2, x3, x4):
+        return ('array_binding_pattern', x0, x1, x2, x3, x4)
+    def computed_member_expr(self, x0, x1, x2):
+        return ('computed_member_expr', x0, x1, x2)
+    def arguments(self, x0, x1, x2):
+        return ('arguments', x0, x1, x2)
+    def arguments_spread_single(self, x0):
+        return ('arguments_spread_single', x0)
+    def optional_static_member_expr(self, x0, x1):
+        return ('optional_static_member_expr', x0, x1)
+    def element_list_append(self, x0, x1, x2):
+        return ('element_list_append', x0, x1, x2)
+    def element_list_append_spread(self, x0, x1, x2):
+        return ('element_list_append_spread', x0, x1, x2)
+    def array_literal_with_trailing_elision(self, x0, x1, x2, x3):
+        return ('array_literal_with_trailing_elision', x0, x1, x2, x3)
+    def property_definition_list_append(self, x0, x1):
+        return ('property_definition_list_append', x0, x1)
+    def object_literal(self, x0, x1, x2):
+        return ('object_literal', x0, x1, x2)
+    def property_definition(self, x0, x1):
+        return ('property_definition', x0, x1)
+    def unique_formal_parameters(self, x0):
+        return ('unique_formal_parameters', x0)
+    def class_tail(self, x0, x1, x2):
+        return ('class_tail', x0, x1, x2)
+    def class_element_list_append(self, x0, x1):
+        return ('class_element_list_append', x0, x1)
+    def class_element_static(self, x0, x1):
+        return ('class_element_static', x0, x1)
+    def class_element_to_vec(self, x0):
+        return ('class_element_to_vec', x0)
+    def class_field_definition(self, x0, x1):
+        return ('class_field_definition', x0, x1)
+    def class_tail(self, x0, x1, x2):
+        return ('class_tail', x0, x1, x2)
+    def template_spans(self, x0, x1):
+        return ('template_spans', x0, x1)
+    def expression_to_parameter_list(self, x0):
+        return ('expression_to_parameter_list', x0)
+    def cover_arrow_parameter_list(self, x0, x1, x2, x3):
+        return ('cover_arrow_parameter_list', x0, x1, x2, x3)
+    def binding_identifier_to_binding(self, x0):
+        return ('binding_identifier_to_binding', x0)
+    def cover_arrow_parameter_list(self, x0, x1, x2, x3):
+        return ('cover_arrow_parameter_list', x0, x1, x2, x3)
+    def cover_arrow_parameter_list(self, x0, x1, x2, x3):
+        return ('cover_arrow_parameter_list', x0, x1, x2, x3)
+    def super_property_computed(self, x0, x1, x2):
+        return ('super_property_computed', x0, x1, x2)
+    def async_arrow_function(self, x0, x1):
+        return ('async_arrow_function', x0, x1)
+    def import_call(self, x0, x1, x2):
+        return ('import_call', x0, x1, x2)
+    def yield_star_expr(self, x0, x1):
+        return ('yield_star_expr', x0, x1)
+    def arrow_function(self, x0, x1):
+        return ('arrow_function', x0, x1)
+    def while_statement(self, x0, x1, x2):
+        return ('while_statement', x0, x1, x2)
+    def for_lexical_declaration(self, x0, x1):
+        return ('for_lexical_declaration', x0, x1)
+    def switch_statement(self, x0, x1, x2):
+        return ('switch_statement', x0, x1, x2)
+    def with_statement(self, x0, x1, x2):
+        return ('with_statement', x0, x1, x2)
+    def imports_list_append(self, x0, x1):
+        return ('imports_list_append', x0, x1)
+    def import_specifier_renaming(self, x0, x1):
+        return ('import_specifier_renaming', x0, x1)
+    def exports_list_append(self, x0, x1):
+        return ('exports_list_append', x0, x1)
+    def export_specifier_renaming(self, x0, x1):
+        return ('export_specifier_renaming', x0, x1)
+    def export_default_value(self, x0):
+        return ('export_default_value', x0)
+    def object_binding_pattern(self, x0, x1, x2, x3):
+        return ('object_binding_pattern', x0, x1, x2, x3)
+    def array_binding_pattern(self, x0, x1, x2, x3, x4):
+        return ('array_binding_pattern', x0, x1, x2, x3, x4)
+    def array_binding_pattern(self, x0, x1, x2, x3, x4):
+        return ('array_binding_pattern', x0, x1, x2, x3, x4)
+    def conditional_expr(self, x0, x1, x2):
+        return ('conditional_expr', x0, x1, x2)
+    def arguments_append(self, x0, x1):
+        return ('arguments_append', x0, x1)
+    def arguments(self, x0, x1, x2):
+        return ('arguments', x0, x1, x2)
+    def optional_computed_member_expr(self, x0, x1, x2):
+        return ('optional_computed_member_expr', x0, x1, x2)
+    def optional_computed_member_expr_tail(self, x0, x1, x2):
+        return ('optional_computed_member_expr_tail', x0, x1, x2)
+    def element_list_append(self, x0, x1, x2):
+        return ('element_list_append', x0, x1, x2)
+    def element_list_append_spread(self, x0, x1, x2):
+        return ('element_list_append_spread', x0, x1, x2)
+    def array_literal_with_trailing_elision(self, x0, x1, x2, x3):
+        return ('array_literal_with_trailing_elision', x0, x1, x2, x3)
+    def formal_parameter_list_append(self, x0, x1):
+        return ('formal_parameter_list_append', x0, x1)
+    def with_rest_parameter(self, x0, x1):
+        return ('with_rest_parameter', x0, x1)
+    def class_element_static_field(self, x0, x1):
+        return ('class_element_static_field', x0, x1)
+    def class_tail(self, x0, x1, x2):
+        return ('class_tail', x0, x1, x2)
+    def concise_body_expression(self, x0):
+        return ('concise_body_expression', x0)
+    def function_body(self, x0):
+        return ('function_body', x0)
+    def unbox_for_lexical_declaration(self, x0):
+        return ('unbox_for_lexical_declaration', x0)
+    def for_statement_lexical(self, x0, x1, x2, x3, x4):
+        return ('for_statement_lexical', x0, x1, x2, x3, x4)
+    def case_block(self, x0, x1, x2):
+        return ('case_block', x0, x1, x2)
+    def case_clauses_single(self, x0):
+        return ('case_clauses_single', x0)
+    def array_binding_pattern(self, x0, x1, x2, x3, x4):
+        return ('array_binding_pattern', x0, x1, x2, x3, x4)
+    def arguments_append_spread(self, x0, x1):
+        return ('arguments_append_spread', x0, x1)
+    def async_arrow_function_bare(self, x0, x1, x2):
+        return ('async_arrow_function_bare', x0, x1, x2)
+    def expression_to_parameter_list(self, x0):
+        return ('expression_to_parameter_list', x0)
+    def cover_arrow_parameter_list(self, x0, x1, x2, x3):
+        return ('cover_arrow_parameter_list', x0, x1, x2, x3)
+    def cover_arrow_parameter_list(self, x0, x1, x2, x3):
+        return ('cover_arrow_parameter_list', x0, x1, x2, x3)
+    def concise_body_block(self, x0, x1, x2):
+        return ('concise_body_block', x0, x1, x2)
+    def if_statement(self, x0, x1, x2, x3):
+        return ('if_statement', x0, x1, x2, x3)
+    def make_block_stmt_from_function_decl(self, x0):
+        return ('make_block_stmt_from_function_decl', x0)
+    def if_statement(self, x0, x1, x2, x3):
+        return ('if_statement', x0, x1, x2, x3)
+    def make_block_stmt_from_function_decl(self, x0):
+        return ('make_block_stmt_from_function_decl', x0)
+    def if_statement(self, x0, x1, x2, x3):
+        return ('if_statement', x0, x1, x2, x3)
+    def if_statement(self, x0, x1, x2, x3):
+        return ('if_statement', x0, x1, x2, x3)
+    def do_while_statement(self, x0, x1, x2, x3):
+        return ('do_while_statement', x0, x1, x2, x3)
+    def for_expression(self, x0):
+        return ('for_expression', x0)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def unbox_for_lexical_declaration(self, x0):
+        return ('unbox_for_lexical_declaration', x0)
+    def for_statement_lexical(self, x0, x1, x2, x3, x4):
+        return ('for_statement_lexical', x0, x1, x2, x3, x4)
+    def for_statement_lexical(self, x0, x1, x2, x3, x4):
+        return ('for_statement_lexical', x0, x1, x2, x3, x4)
+    def unbox_for_declaration(self, x0):
+        return ('unbox_for_declaration', x0)
+    def for_in_statement_lexical(self, x0, x1, x2, x3):
+        return ('for_in_statement_lexical', x0, x1, x2, x3)
+    def for_of_statement_lexical(self, x0, x1, x2, x3):
+        return ('for_of_statement_lexical', x0, x1, x2, x3)
+    def case_block(self, x0, x1, x2):
+        return ('case_block', x0, x1, x2)
+    def case_clauses_append(self, x0, x1):
+        return ('case_clauses_append', x0, x1)
+    def case_block_with_default(self, x0, x1, x2, x3, x4):
+        return ('case_block_with_default', x0, x1, x2, x3, x4)
+    def catch(self, x0, x1, x2):
+        return ('catch', x0, x1, x2)
+    def function(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('function', x0, x1, x2, x3, x4, x5, x6, x7)
+    def function_expr(self, x0):
+        return ('function_expr', x0)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def for_expression(self, x0):
+        return ('for_expression', x0)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def for_assignment_target(self, x0):
+        return ('for_assignment_target', x0)
+    def for_in_statement(self, x0, x1, x2, x3):
+        return ('for_in_statement', x0, x1, x2, x3)
+    def for_var_declaration(self, x0, x1):
+        return ('for_var_declaration', x0, x1)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def for_in_or_of_var_declaration(self, x0, x1, x2):
+        return ('for_in_or_of_var_declaration', x0, x1, x2)
+    def for_in_statement(self, x0, x1, x2, x3):
+        return ('for_in_statement', x0, x1, x2, x3)
+    def for_of_statement(self, x0, x1, x2, x3):
+        return ('for_of_statement', x0, x1, x2, x3)
+    def unbox_for_lexical_declaration(self, x0):
+        return ('unbox_for_lexical_declaration', x0)
+    def for_statement_lexical(self, x0, x1, x2, x3, x4):
+        return ('for_statement_lexical', x0, x1, x2, x3, x4)
+    def for_of_statement(self, x0, x1, x2, x3):
+        return ('for_of_statement', x0, x1, x2, x3)
+    def for_await_of_statement_lexical(self, x0, x1, x2, x3):
+        return ('for_await_of_statement_lexical', x0, x1, x2, x3)
+    def case_block_with_default(self, x0, x1, x2, x3, x4):
+        return ('case_block_with_default', x0, x1, x2, x3, x4)
+    def case_block_with_default(self, x0, x1, x2, x3, x4):
+        return ('case_block_with_default', x0, x1, x2, x3, x4)
+    def catch_block(self, x0, x1, x2):
+        return ('catch_block', x0, x1, x2)
+    def function(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('function', x0, x1, x2, x3, x4, x5, x6, x7)
+    def function_decl(self, x0):
+        return ('function_decl', x0)
+    def getter(self, x0, x1, x2, x3, x4):
+        return ('getter', x0, x1, x2, x3, x4)
+    def method_definition(self, x0, x1, x2, x3, x4, x5, x6):
+        return ('method_definition', x0, x1, x2, x3, x4, x5, x6)
+    def generator(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('generator', x0, x1, x2, x3, x4, x5, x6, x7)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def for_expression(self, x0):
+        return ('for_expression', x0)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def for_var_declaration(self, x0, x1):
+        return ('for_var_declaration', x0, x1)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def binding_identifier_to_binding(self, x0):
+        return ('binding_identifier_to_binding', x0)
+    def for_in_or_of_var_declaration(self, x0, x1, x2):
+        return ('for_in_or_of_var_declaration', x0, x1, x2)
+    def for_in_statement(self, x0, x1, x2, x3):
+        return ('for_in_statement', x0, x1, x2, x3)
+    def for_await_of_statement(self, x0, x1, x2, x3):
+        return ('for_await_of_statement', x0, x1, x2, x3)
+    def for_await_of_statement(self, x0, x1, x2, x3):
+        return ('for_await_of_statement', x0, x1, x2, x3)
+    def case_block_with_default(self, x0, x1, x2, x3, x4):
+        return ('case_block_with_default', x0, x1, x2, x3, x4)
+    def catch_block(self, x0, x1, x2):
+        return ('catch_block', x0, x1, x2)
+    def generator(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('generator', x0, x1, x2, x3, x4, x5, x6, x7)
+    def async_function(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('async_function', x0, x1, x2, x3, x4, x5, x6, x7)
+    def setter(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('setter', x0, x1, x2, x3, x4, x5, x6, x7)
+    def generator_method(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('generator_method', x0, x1, x2, x3, x4, x5, x6, x7)
+    def for_expression(self, x0):
+        return ('for_expression', x0)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def for_var_declaration(self, x0, x1):
+        return ('for_var_declaration', x0, x1)
+    def for_statement(self, x0, x1, x2, x3, x4):
+        return ('for_statement', x0, x1, x2, x3, x4)
+    def async_function(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('async_function', x0, x1, x2, x3, x4, x5, x6, x7)
+    def async_function(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('async_function', x0, x1, x2, x3, x4, x5, x6, x7)
+    def async_method(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('async_method', x0, x1, x2, x3, x4, x5, x6, x7)
+    def async_generator(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('async_generator', x0, x1, x2, x3, x4, x5, x6, x7)
+    def async_function(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('async_function', x0, x1, x2, x3, x4, x5, x6, x7)
+    def async_generator_method(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('async_generator_method', x0, x1, x2, x3, x4, x5, x6, x7)
+    def async_generator(self, x0, x1, x2, x3, x4, x5, x6, x7):
+        return ('async_generator', x0, x1, x2, x3, x4, x5, x6, x7)
+    def script(self, x0):
+        return ('script', x0)
+    def module(self, x0):
+        return ('module', x0)
+    def script_body(self, x0):
+        return ('script_body', x0)
+    def let_kind(self, x0):
+        return ('let_kind', x0)
+    def binding_identifier_to_binding(self, x0):
+        return ('binding_identifier_to_binding', x0)
+    def variable_declaration(self, x0, x1):
+        return ('variable_declaration', x0, x1)
+    def binding_identifier(self, x0):
+        return ('binding_identifier', x0)
+    def identifier_reference(self, x0):
+        return ('identifier_reference', x0)
+    def uncover_arrow_parameters(self, x0):
+        return ('uncover_arrow_parameters', x0)
+    def uncover_parenthesized_expression(self, x0):
+        return ('uncover_parenthesized_expression', x0)
+    def binding_identifier_await(self, x0):
+        return ('binding_identifier_await', x0)
+    def binding_identifier_yield(self, x0):
+        return ('binding_identifier_yield', x0)
+    def yield_expr(self, x0, x1):
+        return ('yield_expr', x0, x1)
+    def import_clause(self, x0, x1, x2):
+        return ('import_clause', x0, x1, x2)
+    def single_name_binding(self, x0, x1):
+        return ('single_name_binding', x0, x1)
+    def binding_element_pattern(self, x0, x1):
+        return ('binding_element_pattern', x0, x1)
+    def optional_expr(self, x0, x1):
+        return ('optional_expr', x0, x1)
+    def shorthand_property(self, x0):
+        return ('shorthand_property', x0)
+    def empty_formal_parameters(self, ):
+        return ('empty_formal_parameters', )
+    def try_statement(self, x0, x1, x2, x3):
+        return ('try_statement', x0, x1, x2, x3)
+    def export_specifier(self, x0):
+        return ('export_specifier', x0)
+    def logical_or_op(self, x0):
+        return ('logical_or_op', x0)
+    def binary_expr(self, x0, x1, x2):
+        return ('binary_expr', x0, x1, x2)
+    def logical_and_op(self, x0):
+        return ('logical_and_op', x0)
+    def bitwise_or_op(self, x0):
+        return ('bitwise_or_op', x0)
+    def bitwise_xor_op(self, x0):
+        return ('bitwise_xor_op', x0)
+    def bitwise_and_op(self, x0):
+        return ('bitwise_and_op', x0)
+    def equals_op(self, x0):
+        return ('equals_op', x0)
+    def not_equals_op(self, x0):
+        return ('not_equals_op', x0)
+    def strict_equals_op(self, x0):
+        return ('strict_equals_op', x0)
+    def strict_not_equals_op(self, x0):
+        return ('strict_not_equals_op', x0)
+    def less_than_op(self, x0):
+        return ('less_than_op', x0)
+    def greater_than_op(self, x0):
+        return ('greater_than_op', x0)
+    def less_than_or_equal_op(self, x0):
+        return ('less_than_or_equal_op', x0)
+    def greater_than_or_equal_op(self, x0):
+        return ('greater_than_or_equal_op', x0)
+    def instanceof_op(self, x0):
+        return ('instanceof_op', x0)
+    def in_op(self, x0):
+        return ('in_op', x0)
+    def left_shift_op(self, x0):
+        return ('left_shift_op', x0)
+    def right_shift_op(self, x0):
+        return ('right_shift_op', x0)
+    def right_shift_ext_op(self, x0):
+        return ('right_shift_ext_op', x0)
+    def add_op(self, x0):
+        return ('add_op', x0)
+    def sub_op(self, x0):
+        return ('sub_op', x0)
+    def property_name_to_class_element_name(self, x0):
+        return ('property_name_to_class_element_name', x0)
+    def class_field_definition(self, x0, x1):
+        return ('class_field_definition', x0, x1)
+    def coalesce_op(self, x0):
+        return ('coalesce_op', x0)
+    def binding_identifier_to_binding(self, x0):
+        return ('binding_identifier_to_binding', x0)
+    def template_middle_list_single(self, x0, x1):
+        return ('template_middle_list_single', x0, x1)
+    def function_statement_list(self, x0):
+        return ('function_statement_list', x0)
+    def if_statement(self, x0, x1, x2, x3):
+        return ('if_statement', x0, x1, x2, x3)
+    def make_block_stmt_from_function_decl(self, x0):
+        return ('make_block_stmt_from_function_decl', x0)
+    def if_statement(self, x0, x1, x2, x3):
+        return ('if_statement', x0, x1, x2, x3)
+    def binding_identifier_to_binding(self, x0):
+        return ('binding_identifier_to_binding', x0)
+    def variable_declaration(self, x0, x1):
+        return ('variable_declaration', x0, x1)
+    def template_middle_list_append(self, x0, x1, x2):
+        return ('template_middle_list_append', x0, x1, x2)
+    def function_statement_list(self, x0):
+        return ('function_statement_list', x0)
+    def default_clause(self, x0, x1, x2):
+        return ('default_clause', x0, x1, x2)
+    def case_clause(self, x0, x1, x2, x3):
+        return ('case_clause', x0, x1, x2, x3)
+    def default_clause(self, x0, x1, x2):
+        return ('default_clause', x0, x1, x2)
+    def case_clause(self, x0, x1, x2, x3):
+        return ('case_clause', x0, x1, x2, x3)
+    def let_kind(self, x0):
+        return ('let_kind', x0)
+    def label_identifier(self, x0):
+        return ('label_identifier', x0)
+
+class Parser(runtime.Parser):
+    def __init__(self, goal, builder=None):
+        if builder is None:
+            builder = DefaultMethods()
+        super().__init__(actions, error_codes, goal_nt_to_init_state[goal], builder)
+
@@ -1,11 +1,12 @@
 """Emit code and parser tables in Rust."""
 
+import bisect
 import json
 import re
 import unicodedata
 import sys
 
-from ..runtime import (ERROR, ErrorToken, SPECIAL_CASE_TAG)
+from ..runtime import (ERROR, ErrorToken)
 from ..ordered import OrderedSet
 
 from ..grammar import (CallMethod, Some, is_concrete_element, Nt, InitNt, Optional, End,
@@ -72,8 +73,20 @@ TERMINAL_NAMES = {
     '...': 'Ellipsis',
 }
 
+# Used by RustParserWriter.to_snek_case to split words.
+# https://stackoverflow.com/questions/1175208
+SNEK_CASE_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+SNEK_CASE_LOWER_UPPER_RE = re.compile('([a-z0-9])([A-Z])')
+
+# Indentation prefixes used by RustParserWriter.write, indexed by depth.
+INDENTS = ["    " * depth for depth in range(16)]
+
+
 class RustActionWriter:
     """Write epsilon state transitions for a given action function."""
+    __slots__ = ['writer', 'traits', 'indent', 'has_ast_builder', 'used_variables',
+                 'implemented_traits']
+
     ast_builder = types.Type("AstBuilderDelegate", (types.Lifetime("alloc"),))
 
     def __init__(self, writer, traits, indent):
@@ -82,10 +95,20 @@ class RustActionWriter:
         self.indent = indent
         self.has_ast_builder = self.ast_builder in traits
         self.used_variables = set()
+        # Whether each trait is implemented, by trait type. The answer depends
+        # only on self.traits, and the same few traits are asked about for
+        # every function call of every action.
+        self.implemented_traits = {}
 
     def implement_trait(self, funcall):
         "Returns True if this function call should be encoded"
         ty = funcall.trait
+        implemented = self.implemented_traits.get(ty)
+        if implemented is None:
+            implemented = self.implemented_traits[ty] = self.trait_is_implemented(ty)
+        return implemented
+
+    def trait_is_implemented(self, ty):
         if ty.name == "AstBuilder":
             return "AstBuilderDelegate<'alloc>" in map(str, self.traits)
         if ty in self.traits:
@@ -96,41 +119,43 @@ class RustActionWriter:
 
     def reset(self, act):
         "Traverse all action to collect preliminary information."
-        self.used_variables = set(self.collect_uses(act))
-
-    def collect_uses(self, act):
-        "Generator which visit all used variables."
-        assert isinstance(act, Action)
-        if isinstance(act, Reduce):
-            yield "value"
-        elif isinstance(act, FunCall):
-            def map_with_offset(args):
-                for a in args:
-                    if isinstance(a, int):
-                        yield a + act.offset
-                    if isinstance(a, str):
-                        yield a
-                    elif isinstance(a, Some):
-                        for offset in map_with_offset([a.inner]):
-                            yield offset
-            if self.implement_trait(act):
-                for var in map_with_offset(act.args):
-                    yield var
-        elif isinstance(act, Seq):
-            for a in act.actions:
-                for var in self.collect_uses(a):
-                    yield var
+        # The set is reused from one action to the next.
+        self.used_variables.clear()
+        self.collect_uses(act, self.used_variables)
+
+    def collect_uses(self, act, used):
+        "Add all variables used by an action to the set `used`."
+        todo = [act]
+        while todo:
+            act = todo.pop()
+            assert isinstance(act, Action)
+            if isinstance(act, Reduce):
+                used.add("value")
+            elif isinstance(act, FunCall):
+                if self.implement_trait(act):
+                    args = list(act.args)
+                    while args:
+                        a = args.pop()
+                        if isinstance(a, int):
+                            used.add(a + act.offset)
+                        elif isinstance(a, str):
+                            used.add(a)
+                        elif isinstance(a, Some):
+                            args.append(a.inner)
+            elif isinstance(act, Seq):
+                todo.extend(act.actions)
 
     def write(self, string, *format_args):
         "Delegate to the RustParserWriter.write function"
         self.writer.write(self.indent, string, *format_args)
 
     def write_state_transitions(self, state):
-        "Given a state, generate the code corresponding to all outgoing epsilon edges."
-        assert not state.is_inconsistent()
-        assert len(list(state.shifted_edges())) == 0
-        for ctx in self.writer.parse_table.debug_context(state.index, None):
-            self.write("// {}", ctx)
+        """Given a state, generate the code corresponding to all outgoing epsilon edges.
+
+        The caller checks that the state is consistent and has no shifted edges.
+        """
+        for ctx in self.writer.debug_context(state):
+            self.write(f"// {ctx}")
         try:
             first, dest = next(state.edges(), (None, None))
             if first is None:
@@ -148,11 +173,11 @@ class RustActionWriter:
             raise exc
 
     def write_epsilon_transition(self, dest):
-        self.write("// --> {}", dest)
+        self.write(f"// --> {dest}")
         if dest >= self.writer.shift_count:
-            self.write("state = {}", dest)
+            self.write(f"state = {dest}")
         else:
-            self.write("parser.epsilon({});", dest)
+            self.write(f"parser.epsilon({dest});")
             self.write("return Ok(false)")
 
     def write_condition(self, state, first_act):
@@ -172,7 +197,7 @@ class RustActionWriter:
             assert len(list(state.edges())) == 1
             act, dest = next(state.edges())
             assert -act.offset > 0
-            self.write("// {}", str(act))
+            self.write(f"// {act}")
             self.write("if !parser.check_not_on_new_line({})? {{", -act.offset)
             self.indent += 1
             self.write("return Ok(false);")
@@ -186,40 +211,94 @@ class RustActionWriter:
         assert isinstance(act, Action)
         assert not act.is_condition()
         is_packed = {}
+        # Seq actions are written as their flat list of actions; anything else
+        # as a list of one. These are computed once, as on a Seq each of them
+        # walks the whole list.
+        update_stack = act.update_stack()
+        contains_accept = act.contains_accept()
         if isinstance(act, Seq):
+            actions = act.actions
+            if self.is_identity_reduce(act):
+                self.write_identity_reduce(act)
+                return
             # Do not pop any of the stack elements if the reduce action has
             # an accept function call. Ideally we should be returning the
             # result instead of keeping it on the parser stack.
-            if act.update_stack() and not act.contains_accept():
-                assert not act.contains_accept()
+            if update_stack and not contains_accept:
                 reducer = act.reduce_with()
                 start = 0
                 depth = reducer.pop
                 if reducer.replay > 0:
-                    self.write("parser.rewind({});", reducer.replay)
+                    self.write(f"parser.rewind({reducer.replay});")
                     start = reducer.replay
                     depth += start
-                for i in range(start, depth):
-                    name = 's'
-                    if i + 1 not in self.used_variables:
-                        name = '_s'
-                    self.write("let {}{} = parser.pop();", name, i + 1)
-
-            for a in act.actions:
-                self.write_single_action(a, is_packed)
-                if a.contains_accept():
-                    break
+                self.writer.write_lines(self.indent, self.pop_lines(start + 1, depth + 1))
         else:
-            self.write_single_action(act, is_packed)
+            actions = (act,)
+
+        for a in actions:
+            self.write_single_action(a, is_packed)
+            if contains_accept and a.contains_accept():
+                break
 
         # If we fallthrough the execution of the action, then generate an
         # epsilon transition.
-        if not act.update_stack() and not act.contains_accept():
+        if not update_stack and not contains_accept:
             assert 0 <= dest < self.writer.shift_count + self.writer.action_count
             self.write_epsilon_transition(dest)
 
+    def pop_lines(self, start, stop):
+        """Yield the lines popping the stack elements s{start} to s{stop - 1}.
+
+        Runs of consecutive elements which are not used are discarded with a
+        single call instead of being popped one by one.
+        """
+        used = self.used_variables
+        unused = 0
+        for i in range(start, stop):
+            if i not in used:
+                unused += 1
+                continue
+            yield from self.discard_lines(i, unused)
+            unused = 0
+            yield f"let s{i} = parser.pop();"
+        yield from self.discard_lines(stop, unused)
+
+    @staticmethod
+    def discard_lines(stop, count):
+        if count == 1:
+            yield f"let _s{stop - 1} = parser.pop();"
+        elif count > 1:
+            yield f"parser.discard({count}); // s{stop - count} to s{stop - 1}"
+
+    @staticmethod
+    def is_identity_reduce(act):
+        """True if `act` reduces a single stack element to a nonterminal and
+        keeps its value as is, as in `A ::= B => $0`."""
+        if len(act.actions) != 2:
+            return False
+        funcall, reduce = act.actions
+        return (isinstance(funcall, FunCall)
+                and funcall.method == "id"
+                and funcall.set_to == "value"
+                and len(funcall.args) == 1
+                and isinstance(funcall.args[0], int)
+                and funcall.args[0] + funcall.offset == 1
+                and isinstance(reduce, Reduce)
+                and reduce.pop == 1
+                and reduce.replay == 0)
+
+    def write_identity_reduce(self, act):
+        # These are common enough that they share a single method of the
+        # ParserTrait, instead of each popping and replaying the value inline.
+        for a in act.actions:
+            self.write(f"// {a}")
+        nt = self.writer.nonterminal_to_camel(act.actions[1].nt)
+        self.write(f"parser.reduce_identity(NonterminalId::{nt});")
+        self.write("return Ok(false)")
+
     def write_single_action(self, act, is_packed):
-        self.write("// {}", str(act))
+        self.write(f"// {act}")
         if isinstance(act, Reduce):
             self.write_reduce(act, is_packed)
         elif isinstance(act, Accept):
@@ -235,9 +314,8 @@ class RustActionWriter:
 
     def write_reduce(self, act, is_packed):
         value = "value"
-        if value in is_packed:
-            packed = is_packed[value]
-        else:
+        packed = is_packed.get(value)
+        if packed is None:
             packed = False
             value = "None"
 
@@ -251,10 +329,10 @@ class RustActionWriter:
             # Convert into a StackValue (when no ast-builder)
             value = "value"
 
-        self.write("let term = Term::Nonterminal(NonterminalId::{});",
-                   self.writer.nonterminal_to_camel(act.nt))
+        nt = self.writer.nonterminal_to_camel(act.nt)
+        self.write(f"let term = Term::Nonterminal(NonterminalId::{nt});")
         if value != "value":
-            self.write("let value = {};", value)
+            self.write(f"let value = {value};")
         self.write("parser.replay(TermValue { term, value });")
         self.write("return Ok(false)")
 
@@ -266,11 +344,7 @@ class RustActionWriter:
             return val
 
         def unpack(val):
-            if val in is_packed:
-                packed = is_packed[val]
-            else:
-                packed = True
-            if packed:
+            if is_packed.get(val, True):
                 return "{}.value.to_ast()?".format(val)
             return val
 
@@ -298,7 +372,7 @@ class RustActionWriter:
         # not use the trait on which this function is implemented, then replace
         # the value by `()`.
         if not self.implement_trait(act):
-            self.write("{}();", set_var)
+            self.write(f"{set_var}();")
             return
 
         # NOTE: Currently "AstBuilder" is implemented through the
@@ -332,26 +406,60 @@ class RustActionWriter:
                 assert isinstance(act.args[0], int)
                 packed = True
 
-        self.write("{}{}{};", set_var, value, forward_errors)
+        self.write(f"{set_var}{value}{forward_errors};")
         is_packed[act.set_to] = packed
 
 
 class RustParserWriter:
+    __slots__ = ['out', 'lines', 'fallible_methods', 'parse_table', 'states', 'shift_count',
+                 'action_count', 'shift_type', 'init_state_map', 'terminals', 'terminal_names',
+                 'terminal_reprs', 'nonterminals', 'camel_names', 'nonterminal_names',
+                 'term_index', 'debug_contexts', 'check_type', 'displacement_type']
+
     def __init__(self, out, pt, fallible_methods):
         self.out = out
+        # Output lines are collected here and written to `out` at the end of
+        # emit(), with writelines, so that the whole output is never copied
+        # into a single string.
+        self.lines = []
         self.fallible_methods = fallible_methods
         assert pt.exec_modes is not None
         self.parse_table = pt
         self.states = pt.states
         self.shift_count = pt.count_shift_states()
         self.action_count = pt.count_action_states()
+        # SHIFT table entries are state indexes or ERROR, and the parser only
+        # checks ERROR for being negative, so use the narrowest signed type
+        # which holds every state index.
+        num_states = len(self.states)
+        if num_states <= 0x7f:
+            self.shift_type = "i8"
+        elif num_states <= 0x7fff:
+            self.shift_type = "i16"
+        elif num_states <= 0x7fff_ffff:
+            self.shift_type = "i32"
+        else:
+            self.shift_type = "i64"
         self.init_state_map = pt.named_goals
-        self.terminals = list(OrderedSet(pt.terminals))
+        # dict.fromkeys drops duplicates and keeps the order, without going
+        # through OrderedSet.add() for each element.
+        self.terminals = list(dict.fromkeys(pt.terminals))
         # This extra terminal is used to represent any ErrorySymbol transition,
         # knowing that we assert that there is only one ErrorSymbol kind per
         # state.
         self.terminals.append("ErrorToken")
-        self.nonterminals = list(OrderedSet(pt.nonterminals))
+        self.terminal_names = [self.terminal_name(t) for t in self.terminals]
+        self.terminal_reprs = [repr(t) for t in self.terminals]
+        self.nonterminals = list(dict.fromkeys(pt.nonterminals))
+        # See nonterminal_to_camel().
+        self.camel_names = {}
+        self.nonterminal_names = [self.nonterminal_to_camel(nt) for nt in self.nonterminals]
+        # Column of each terminal and nonterminal in the SHIFT table.
+        self.term_index = {t: i for i, t in enumerate(self.terminals)}
+        self.term_index.update(
+            (nt, i) for i, nt in enumerate(self.nonterminals, len(self.terminals)))
+        # See debug_context().
+        self.debug_contexts = {}
 
     def emit(self):
         self.header()
@@ -362,13 +470,31 @@ class RustParserWriter:
         self.parser_trait()
         self.actions()
         self.entry()
+        self.out.writelines(self.lines)
+        self.lines = []
 
     def write(self, indentation, string, *format_args):
-        if len(format_args) == 0:
-            formatted = string
-        else:
-            formatted = string.format(*format_args)
-        self.out.write("    " * indentation + formatted + "\n")
+        if format_args:
+            string = string.format(*format_args)
+        self.lines.append(INDENTS[indentation] + string + "\n")
+
+    def write_lines(self, indentation, lines):
+        """Write many already-formatted lines at the same indentation."""
+        prefix = INDENTS[indentation]
+        self.lines.append("".join(prefix + line + "\n" for line in lines))
+
+    def debug_context(self, state):
+        """Return the debug comments for a state, computing them at most once.
+
+        These are written in several places (the SHIFT table, the error codes
+        and each execution mode's actions), and can be slow to compute.
+        """
+        try:
+            return self.debug_contexts[state.index]
+        except KeyError:
+            ctx = self.parse_table.debug_context(state.index, None)
+            self.debug_contexts[state.index] = ctx
+            return ctx
 
     def header(self):
         self.write(0, "// WARNING: This file is autogenerated.")
@@ -389,16 +515,21 @@ class RustParserWriter:
         else:
             self.write(0, "use crate::traits::{{{}}};", ", ".join(ty.name for ty in traits))
         self.write(0, "")
-        self.write(0, "const ERROR: i64 = {};", hex(ERROR))
+        if self.shift_type == "i64":
+            self.write(0, "const ERROR: i64 = {};", hex(ERROR))
+        else:
+            self.write(0, "const ERROR: {} = -1;", self.shift_type)
         self.write(0, "")
 
     def terminal_name(self, value):
-        if isinstance(value, End) or value is None:
+        # Punctuators are the most common case; check for them first.
+        name = TERMINAL_NAMES.get(value)
+        if name is not None:
+            return name
+        elif isinstance(value, End) or value is None:
             return "End"
         elif isinstance(value, ErrorSymbol) or value is ErrorToken:
             return "ErrorToken"
-        elif value in TERMINAL_NAMES:
-            return TERMINAL_NAMES[value]
         elif value.isalpha():
             if value.islower():
                 return value.capitalize()
@@ -416,16 +547,17 @@ class RustParserWriter:
     def terms_id(self):
         self.write(0, "#[derive(Copy, Clone, Debug, PartialEq)]")
         self.write(0, "pub enum TerminalId {")
-        for i, t in enumerate(self.terminals):
-            name = self.terminal_name(t)
-            self.write(1, "{} = {}, // {}", name, i, repr(t))
+        self.write_lines(1, (
+            "{} = {}, // {}".format(name, i, t_repr)
+            for i, (name, t_repr) in enumerate(zip(self.terminal_names, self.terminal_reprs))))
         self.write(0, "}")
         self.write(0, "")
         self.write(0, "#[derive(Clone, Copy, Debug, PartialEq)]")
         self.write(0, "pub enum NonterminalId {")
         offset = len(self.terminals)
-        for i, nt in enumerate(self.nonterminals):
-            self.write(1, "{} = {},", self.nonterminal_to_camel(nt), i + offset)
+        self.write_lines(1, (
+            "{} = {},".format(name, i)
+            for i, name in enumerate(self.nonterminal_names, offset)))
         self.write(0, "}")
         self.write(0, "")
         self.write(0, "#[derive(Clone, Copy, Debug, PartialEq)]")
@@ -443,128 +575,193 @@ class RustParserWriter:
         self.write(1, "}")
         self.write(0, "}")
         self.write(0, "")
+        # Term names are looked up in an array indexed by the term's number,
+        # rather than with a match on every variant.
+        names = [f"\"{t_repr}\"," for t_repr in self.terminal_reprs]
+        names += [f"\"{nt.name!s}\"," for nt in self.nonterminals]
+        self.write(0, "static TERM_NAMES: [&'static str; {}] = [", len(names))
+        self.write_lines(1, names)
+        self.write(0, "];")
+        self.write(0, "")
         self.write(0, "impl From<Term> for &'static str {")
         self.write(1, "fn from(term: Term) -> Self {")
-        self.write(2, "match term {")
-        for t in self.terminals:
-            name = self.terminal_name(t)
-            self.write(3, "Term::Terminal(TerminalId::{}) => &\"{}\",", name, repr(t))
-        for nt in self.nonterminals:
-            name = self.nonterminal_to_camel(nt)
-            self.write(3, "Term::Nonterminal(NonterminalId::{}) => &\"{}\",", name, str(nt.name))
-        self.write(2, "}")
+        self.write(2, "TERM_NAMES[usize::from(term)]")
         self.write(1, "}")
         self.write(0, "}")
         self.write(0, "")
 
-    def shift(self):
-        self.write(0, "#[rustfmt::skip]")
-        width = len(self.terminals) + len(self.nonterminals)
-        num_shifted_edges = 0
-
-        def state_get(state, t):
-            nonlocal num_shifted_edges
-            res = state.get(t, "ERROR")
-            if res == "ERROR":
-                error_symbol = state.get_error_symbol()
-                if t == "ErrorToken" and error_symbol:
-                    res = state[error_symbol]
-                    num_shifted_edges += 1
-            else:
-                num_shifted_edges += 1
-            return res
-
-        self.write(0, "static SHIFT: [i64; {}] = [", self.shift_count * width)
+    def shift_rows(self):
+        """Return the edges of each shift state, as a list of (column, dest) pairs
+        per state, where column is the term's column in the SHIFT table."""
         assert self.terminals[-1] == "ErrorToken"
-        for i, state in enumerate(self.states[:self.shift_count]):
-            num_shifted_edges = 0
-            self.write(1, "// {}.", i)
-            for ctx in self.parse_table.debug_context(state.index, None):
-                self.write(1, "// {}", ctx)
-            self.write(1, "{}",
-                       ' '.join("{},".format(state_get(state, t)) for t in self.terminals))
-            self.write(1, "{}",
-                       ' '.join("{},".format(state_get(state, t)) for t in self.nonterminals))
+        error_column = len(self.terminals) - 1
+        columns = self.term_index
+
+        rows = []
+        for state in self.states[:self.shift_count]:
             try:
-                assert sum(1 for _ in state.shifted_edges()) == num_shifted_edges
-            except Exception:
+                row = [(columns[t], dest) for t, dest in state.terminals.items()]
+                row += [(columns[nt], dest) for nt, dest in state.nonterminals.items()]
+            except KeyError:
                 print("Some edges are not encoded.")
                 print("List of terminals: {}".format(', '.join(map(repr, self.terminals))))
                 print("List of nonterminals: {}".format(', '.join(map(repr, self.nonterminals))))
                 print("State having the issue: {}".format(str(state)))
                 raise
-        self.write(0, "];")
-        self.write(0, "")
+            error_symbol = state.get_error_symbol()
+            if error_symbol:
+                row.append((error_column, state.errors[error_symbol]))
+            row.sort()
+            rows.append(row)
+        return rows
+
+    def pack_shift_table(self):
+        """Compress the SHIFT table using row displacement.
+
+        Most entries of the (shift_count x shift_width) SHIFT matrix are
+        ERROR. Instead, each row is split in two halves, its terminal columns
+        and its nonterminal columns, and the entries of each half are stored
+        in a shared `values` array starting at its displacement, while `check`
+        records which column each slot of `values` belongs to. The entry for
+        (state, column) is values[d + column] if check[d + column] is column,
+        and ERROR otherwise, where d is displacements[2 * state] for terminals
+        and displacements[2 * state + 1] for nonterminals. Splitting the rows
+        lets many more of them interleave, as the terminal and nonterminal
+        edges of a state vary independently.
+
+        Each half is placed at the lowest displacement where its entries do not
+        collide with those already placed, densest first. Every distinct half
+        gets its own displacement, so that a missing entry can never be
+        mistaken for the entry of another half with the same columns;
+        identical halves share one. The arrays are padded so that any column
+        of any half can be looked up without going out of bounds.
+
+        Returns (displacements, check, values), where unused check slots hold
+        `width`, which is not a valid column.
+        """
+        num_terminals = len(self.terminals)
+        width = num_terminals + len(self.nonterminals)
+        halves = []
+        for row in self.shift_rows():
+            split = bisect.bisect_left(row, (num_terminals,))
+            halves.append((0, row[:split]))
+            halves.append((1, row[split:]))
+
+        displacements = [0] * len(halves)
+        size = 0
+        placed = {}
+        # Bit k of `occupied` is set when slot k of `values` is in use, and bit
+        # d of `used[kind]` when a half of that kind was placed at displacement
+        # d. The free displacements for a half are then the zero bits of the
+        # union of `used[kind]` and `occupied >> column` for all its columns.
+        occupied = 0
+        used = [0, 0]
+        entries = {}
+        order = sorted(range(len(halves)), key=lambda i: -len(halves[i][1]))
+        for i in order:
+            kind, half = halves[i]
+            key = (kind, tuple(half))
+            if key in placed:
+                displacements[i] = placed[key]
+                continue
+            blocked = used[kind]
+            for column, _ in half:
+                blocked |= occupied >> column
+            free = ~blocked
+            d = (free & -free).bit_length() - 1
+            for column, dest in half:
+                occupied |= 1 << (d + column)
+                entries[d + column] = (column, dest)
+            used[kind] |= 1 << d
+            placed[key] = d
+            displacements[i] = d
+            size = max(size, d + (width if kind else num_terminals))
+
+        check = [width] * size
+        values = ["ERROR"] * size
+        for index, (column, dest) in entries.items():
+            check[index] = column
+            values[index] = dest
+        return displacements, check, values
 
-    def render_action(self, action):
-        if isinstance(action, tuple):
-            if action[0] == 'IfSameLine':
-                _, a1, a2 = action
-                if a1 is None:
-                    a1 = 'ERROR'
-                if a2 is None:
-                    a2 = 'ERROR'
-                index = self.add_special_case(
-                    "if token.is_on_new_line { %s } else { %s }"
-                    % (a2, a1))
-            else:
-                raise ValueError("unrecognized kind of special case: {!r}".format(action))
-            return SPECIAL_CASE_TAG + index
-        elif action == 'ERROR':
-            return action
-        else:
-            assert isinstance(action, int)
-            return action
-
-    def emit_special_cases(self):
-        self.write(0, "static SPECIAL_CASES: [fn(&Token) -> i64; {}] = [",
-                   len(self.special_cases))
-        for i, code in enumerate(self.special_cases):
-            self.write(1, "|token| {{ {} }},", code)
+    def shift(self):
+        width = len(self.terminals) + len(self.nonterminals)
+        displacements, check, values = self.pack_shift_table()
+        self.check_type = "u16" if width < 0xffff else "u32"
+        # Displacements are at most len(check) - shift_terminal_count.
+        self.displacement_type = "u16" if len(check) <= 0xffff else "u32"
+
+        self.write(0, "#[rustfmt::skip]")
+        self.write(0, "static SHIFT_DISPLACEMENTS: [{}; {}] = [",
+                   self.displacement_type, len(displacements))
+        for i in range(self.shift_count):
+            self.write(1, f"// {i}.")
+            for ctx in self.debug_context(self.states[i]):
+                self.write(1, f"// {ctx}")
+            self.write(1, f"{displacements[2 * i]}, {displacements[2 * i + 1]},")
         self.write(0, "];")
         self.write(0, "")
 
+        for name, ty, array in [("SHIFT_CHECK", self.check_type, check),
+                                ("SHIFT_VALUES", self.shift_type, values)]:
+            self.write(0, "#[rustfmt::skip]")
+            self.write(0, "static {}: [{}; {}] = [", name, ty, len(array))
+            self.write_lines(1, (
+                ", ".join(map(str, array[start:start + 32])) + ","
+                for start in range(0, len(array), 32)))
+            self.write(0, "];")
+            self.write(0, "")
+
     def error_codes(self):
         self.write(0, "#[derive(Clone, Copy, Debug, PartialEq)]")
         self.write(0, "pub enum ErrorCode {")
-        error_symbols = (s.get_error_symbol() for s in self.states[:self.shift_count])
+        shift_states = self.states[:self.shift_count]
+        error_symbols = [s.get_error_symbol() for s in shift_states]
         error_codes = (e.error_code for e in error_symbols if e is not None)
         for error_code in OrderedSet(error_codes):
             self.write(1, "{},", self.to_camel_case(error_code))
         self.write(0, "}")
         self.write(0, "")
 
+        # ErrorCode has no fields, so Rust stores Option<ErrorCode> in a
+        # single byte; this table is as compact as a table of u8 codes.
         self.write(0, "static STATE_TO_ERROR_CODE: [Option<ErrorCode>; {}] = [",
                    self.shift_count)
-        for i, state in enumerate(self.states[:self.shift_count]):
-            error_symbol = state.get_error_symbol()
+        for i, (state, error_symbol) in enumerate(zip(shift_states, error_symbols)):
             if error_symbol is None:
                 self.write(1, "None,")
             else:
-                self.write(1, "// {}.", i)
-                for ctx in self.parse_table.debug_context(state.index, None):
-                    self.write(1, "// {}", ctx)
+                self.write(1, f"// {i}.")
+                for ctx in self.debug_context(state):
+                    self.write(1, f"// {ctx}")
                 self.write(1, "Some(ErrorCode::{}),",
                            self.to_camel_case(error_symbol.error_code))
         self.write(0, "];")
         self.write(0, "")
 
     def nonterminal_to_snake(self, ident):
+        to_snek_case = self.to_snek_case
         if isinstance(ident, Nt):
             if isinstance(ident.name, InitNt):
                 name = "Start" + ident.name.goal.name
             else:
                 name = ident.name
-            base_name = self.to_snek_case(name)
-            args = ''.join((("_" + self.to_snek_case(name))
+            base_name = to_snek_case(name)
+            args = ''.join((("_" + to_snek_case(name))
                             for name, value in ident.args if value))
             return base_name + args
         else:
             assert isinstance(ident, str)
-            return self.to_snek_case(ident)
+            return to_snek_case(ident)
 
     def nonterminal_to_camel(self, nt):
-        return self.to_camel_case(self.nonterminal_to_snake(nt))
+        # This is called for each reduce action, with the same few hundred
+        # nonterminals over and over, so the names are kept in camel_names.
+        name = self.camel_names.get(nt)
+        if name is None:
+            name = self.to_camel_case(self.nonterminal_to_snake(nt))
+            self.camel_names[nt] = name
+        return name
 
     def to_camel_case(self, ident):
         if '_' in ident:
@@ -576,17 +773,15 @@ class RustParserWriter:
 
     def check_camel_case(self):
         seen = {}
-        for nt in self.nonterminals:
-            cc = self.nonterminal_to_camel(nt)
+        for nt, cc in zip(self.nonterminals, self.nonterminal_names):
             if cc in seen:
                 raise ValueError("{} and {} have the same camel-case spelling ({})".format(
                     seen[cc], nt, cc))
             seen[cc] = nt
 
     def to_snek_case(self, ident):
-        # https://stackoverflow.com/questions/1175208
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', ident)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        s1 = SNEK_CASE_WORD_RE.sub(r'\1_\2', ident)
+        return SNEK_CASE_LOWER_UPPER_RE.sub(r'\1_\2', s1).lower()
 
     def type_to_rust(self, ty, namespace="", boxed=False):
         """
@@ -606,20 +801,20 @@ class RustParserWriter:
             # We auto-translate `Box<Option<T>>` to `Option<Box<T>>` since
             # that's basically the same thing but more efficient.
             [arg] = ty.args
-            return 'Option<{}>'.format(self.type_to_rust(arg, namespace, boxed))
+            return f"Option<{self.type_to_rust(arg, namespace, boxed)}>"
         elif ty.name == 'Vec' and len(ty.args) == 1:
             [arg] = ty.args
-            rty = "Vec<'alloc, {}>".format(self.type_to_rust(arg, namespace, boxed=False))
+            rty = f"Vec<'alloc, {self.type_to_rust(arg, namespace, boxed=False)}>"
         else:
             if namespace == "":
                 rty = ty.name
             else:
-                rty = namespace + '::' + ty.name
+                rty = f"{namespace}::{ty.name}"
             if ty.args:
-                rty += '<{}>'.format(', '.join(self.type_to_rust(arg, namespace, boxed)
-                                               for arg in ty.args))
+                args = ', '.join([self.type_to_rust(arg, namespace, boxed) for arg in ty.args])
+                rty = f"{rty}<{args}>"
         if boxed:
-            return "Box<'alloc, {}>".format(rty)
+            return f"Box<'alloc, {rty}>"
         else:
             return rty
 
@@ -640,6 +835,15 @@ class RustParserWriter:
         self.write(1, "}")
         self.write(1, "fn pop(&mut self) -> TermValue<Value>;")
         self.write(1, "fn replay(&mut self, tv: TermValue<Value>);")
+        self.write(1, "fn discard(&mut self, n: usize) {")
+        self.write(2, "for _ in 0..n {")
+        self.write(3, "self.pop();")
+        self.write(2, "}")
+        self.write(1, "}")
+        self.write(1, "fn reduce_identity(&mut self, nt: NonterminalId) {")
+        self.write(2, "let tv = self.pop();")
+        self.write(2, "self.replay(TermValue { term: Term::Nonterminal(nt), value: tv.value });")
+        self.write(1, "}")
         self.write(1, "fn epsilon(&mut self, state: usize);")
         self.write(1, "fn check_not_on_new_line(&mut self, peek: usize) -> Result<'alloc, bool>;")
         self.write(0, "}")
@@ -649,8 +853,26 @@ class RustParserWriter:
         # For each execution mode, add a corresponding function which
         # implements various traits. The trait list is used for filtering which
         # function is added in the generated code.
-        for mode, traits in self.parse_table.exec_modes.items():
-            action_writer = RustActionWriter(self, traits, 4)
+        #
+        # The action states are walked once, and the match arms for each mode
+        # are collected in a separate buffer, then written out one function
+        # after the other.
+        modes = list(self.parse_table.exec_modes.items())
+        action_writers = [RustActionWriter(self, traits, 4) for _, traits in modes]
+        bodies = [[] for _ in modes]
+        lines = self.lines
+        assert len(self.states[self.shift_count:]) == self.action_count
+        for state in self.states[self.shift_count:]:
+            assert not state.is_inconsistent()
+            assert len(list(state.shifted_edges())) == 0
+            for action_writer, body in zip(action_writers, bodies):
+                self.lines = body
+                self.write(3, f"{state.index} => {{")
+                action_writer.write_state_transitions(state)
+                self.write(3, "}")
+        self.lines = lines
+
+        for (mode, traits), body in zip(modes, bodies):
             self.write(0,
                        "pub fn {}<'alloc, Handler>(parser: &mut Handler, state: usize) "
                        "-> Result<'alloc, bool>",
@@ -661,11 +883,7 @@ class RustParserWriter:
             self.write(1, "let mut state = state;")
             self.write(1, "loop {")
             self.write(2, "match state {")
-            assert len(self.states[self.shift_count:]) == self.action_count
-            for state in self.states[self.shift_count:]:
-                self.write(3, "{} => {{", state.index)
-                action_writer.write_state_transitions(state)
-                self.write(3, "}")
+            self.lines.extend(body)
             self.write(3, '_ => panic!("no such state: {}", state),')
             self.write(2, "}")
             self.write(1, "}")
@@ -677,18 +895,38 @@ class RustParserWriter:
         self.write(0, "pub struct ParseTable<'a> {")
         self.write(1, "pub shift_count: usize,")
         self.write(1, "pub action_count: usize,")
-        self.write(1, "pub shift_table: &'a [i64],")
         self.write(1, "pub shift_width: usize,")
+        self.write(1, "pub shift_terminal_count: usize,")
+        self.write(1, "pub shift_displacements: &'a [{}],", self.displacement_type)
+        self.write(1, "pub shift_check: &'a [{}],", self.check_type)
+        self.write(1, "pub shift_values: &'a [{}],", self.shift_type)
         self.write(1, "pub error_codes: &'a [Option<ErrorCode>],")
         self.write(0, "}")
         self.write(0, "")
 
         self.write(0, "impl<'a> ParseTable<'a> {")
         self.write(1, "pub fn check(&self) {")
-        self.write(2, "assert_eq!(")
-        self.write(3, "self.shift_table.len(),")
-        self.write(3, "(self.shift_count * self.shift_width) as usize")
-        self.write(2, ");")
+        self.write(2, "assert_eq!(self.shift_displacements.len(), 2 * self.shift_count);")
+        self.write(2, "assert_eq!(self.shift_check.len(), self.shift_values.len());")
+        self.write(2, "// Every lookup is bounds-checked anyway, so checking each")
+        self.write(2, "// displacement up front is only done in debug builds.")
+        self.write(2, "debug_assert!(self.shift_displacements.chunks(2).all(|d| {")
+        self.write(3, "d[0] as usize + self.shift_terminal_count <= self.shift_check.len()")
+        self.write(4, "&& d[1] as usize + self.shift_width <= self.shift_check.len()")
+        self.write(2, "}));")
+        self.write(1, "}")
+        self.write(0, "")
+        self.write(1, "/// Returns the state reached from `state` by shifting the term")
+        self.write(1, "/// `term_index`, or a negative value if there is no such edge.")
+        self.write(1, "#[inline]")
+        self.write(1, "pub fn shift(&self, state: usize, term_index: usize) -> {} {{", self.shift_type)
+        self.write(2, "let half = (term_index >= self.shift_terminal_count) as usize;")
+        self.write(2, "let index = self.shift_displacements[2 * state + half] as usize + term_index;")
+        self.write(2, "if self.shift_check[index] as usize == term_index {")
+        self.write(3, "self.shift_values[index]")
+        self.write(2, "} else {")
+        self.write(3, "ERROR")
+        self.write(2, "}")
         self.write(1, "}")
         self.write(0, "}")
         self.write(0, "")
@@ -696,15 +934,18 @@ class RustParserWriter:
         self.write(0, "pub static TABLES: ParseTable<'static> = ParseTable {")
         self.write(1, "shift_count: {},", self.shift_count)
         self.write(1, "action_count: {},", self.action_count)
-        self.write(1, "shift_table: &SHIFT,")
         self.write(1, "shift_width: {},", len(self.terminals) + len(self.nonterminals))
+        self.write(1, "shift_terminal_count: {},", len(self.terminals))
+        self.write(1, "shift_displacements: &SHIFT_DISPLACEMENTS,")
+        self.write(1, "shift_check: &SHIFT_CHECK,")
+        self.write(1, "shift_values: &SHIFT_VALUES,")
         self.write(1, "error_codes: &STATE_TO_ERROR_CODE,")
         self.write(0, "};")
         self.write(0, "")
 
         for init_nt, index in self.init_state_map:
             assert init_nt.args == ()
-            self.write(0, "pub static START_STATE_{}: usize = {};",
+            self.write(0, "pub const START_STATE_{}: usize = {};",
                        self.nonterminal_to_snake(init_nt).upper(), index)
             self.write(0, "")
 
@@ -5,6 +5,10 @@ import linecache
 from builtins import SyntaxError as BaseSyntaxError
 
 
+# Characters that count as a LineTerminator for saw_line_terminator().
+LINE_TERMINATOR_RE = re.compile('[\r\n\u2028\u2029]')
+
+
 class SyntaxError(BaseSyntaxError):
     pass
 
@@ -13,6 +17,22 @@ class UnexpectedEndError(SyntaxError):
     pass
 
 
+# The flags of a regexp without global inline flags like `(?i)`.
+_DEFAULT_FLAGS = re.compile('').flags
+
+
+def _can_fuse(name, pattern):
+    """True if `pattern` matches the same way as the group `(?P<name>...)` in
+    an alternation of several regexps.
+
+    Groups of its own would be renumbered, breaking numbered backreferences,
+    and global inline flags are only allowed at the start of a regexp.
+    """
+    return (name.isidentifier()
+            and pattern.groups == 0
+            and pattern.flags == _DEFAULT_FLAGS)
+
+
 class LexicalGrammar:
     """Quick and dirty lexer implementation.
 
@@ -24,6 +44,13 @@ class LexicalGrammar:
 
     This requirement is not enforced by assertions; if it's not met, the
     tokenizer will just have bugs when sent multiple chunks of data.
+
+    The regexps in `regexps` are tried in order, and the first one that
+    matches wins. When possible, they are compiled into a single alternation
+    of named groups, which is faster. This is only done if every name is a
+    valid group name and no regexp has groups of its own or global inline
+    flags like `(?i)`, since those would change meaning inside the
+    alternation; otherwise each regexp is compiled and tried separately.
     """
     def __init__(self, tokens, ignore=r'[ \t]*', **regexps):
         def token_to_re(token):
@@ -35,8 +62,18 @@ class LexicalGrammar:
         token_list = sorted(tokens.split(), key=len, reverse=True)
         self.ignore_re = re.compile(ignore)
         self.token_re = re.compile("|".join(token_to_re(token) for token in token_list))
+
         self.parser_pairs = [(k, re.compile(v)) for k, v in regexps.items()]
 
+        # The first of the named regexps that matches wins, which is exactly
+        # how alternation works, so they are fused into a single regexp when
+        # that does not change what they match. `match.lastgroup` is then the
+        # name of the one that matched.
+        self.regexp_re = None
+        if self.parser_pairs and all(_can_fuse(k, pattern) for k, pattern in self.parser_pairs):
+            self.regexp_re = re.compile("|".join(
+                "(?P<{}>{})".format(name, regexp) for name, regexp in regexps.items()))
+
     def __call__(self, parser, filename=None):
         return Tokenizer(self, parser, filename)
 
@@ -77,11 +114,10 @@ class FlatStringLexer:
             terminal_id = self._match(closing)
 
         # Update position info.
-        discarded_text = self.src[:self.point]
-        newline_count = self.src[:self.point].count('\n')
+        newline_count = self.src.count('\n', 0, self.point)
         self.start_lineno += newline_count
         if newline_count > 0:
-            self.start_column = self.point - discarded_text.rindex('\n')
+            self.start_column = self.point - self.src.rindex('\n', 0, self.point)
         else:
             self.start_column += self.point
 
@@ -94,6 +130,13 @@ class FlatStringLexer:
         self.previous_token_end = 0
         self.current_token_start = 0
 
+    def saw_line_terminator(self):
+        """True if there's a LineTerminator before the current token."""
+        # This is called for every token, so search the source in place rather
+        # than slicing out the whitespace in between.
+        return LINE_TERMINATOR_RE.search(
+            self.src, self.previous_token_end, self.current_token_start) is not None
+
     def current_token_position(self):
         src_pre = self.src[:self.current_token_start]
         lineno = self.start_lineno + src_pre.count("\n")
@@ -151,6 +194,7 @@ class Tokenizer(FlatStringLexer):
         super().__init__(parser, filename)
         self.ignore_re = lexical_grammar.ignore_re
         self.token_re = lexical_grammar.token_re
+        self.regexp_re = lexical_grammar.regexp_re
         self.parser_pairs = lexical_grammar.parser_pairs
         self.src = ''
         self.filename = filename
@@ -161,13 +205,6 @@ class Tokenizer(FlatStringLexer):
     def take(self):
         return self._current_match.group()
 
-    def saw_line_terminator(self):
-        """True if there's a LineTerminator before the current token."""
-        i = self.previous_token_end
-        j = self.current_token_start
-        ws_between = self.src[i:j]
-        return any(c in ws_between for c in '\r\n\u2028\u2029')
-
     def _match(self, closing):
         # Advance over text matching ignore_re.
         ignore_match = self.ignore_re.match(self.src, self.point)
@@ -183,13 +220,17 @@ class Tokenizer(FlatStringLexer):
         # Try the token_re.
         token_match = self.token_re.match(self.src, point)
 
-        # Try all the parser_pairs.
-        for name, pattern in self.parser_pairs:
-            match = pattern.match(self.src, point)
-            if match is not None:
-                break
+        # Try the named regexps.
+        if self.regexp_re is not None:
+            match = self.regexp_re.match(self.src, point)
+            name = None if match is None else match.lastgroup
         else:
-            name = match = None
+            for name, pattern in self.parser_pairs:
+                match = pattern.match(self.src, point)
+                if match is not None:
+                    break
+            else:
+                name = match = None
 
         if match is not None and token_match is not None and match.end() > token_match.end():
             pass
@@ -136,6 +136,18 @@ class GenTestCase(unittest.TestCase):
                         'lazy'),
                     'dog')))
 
+    def testLexerRegexpsWithGroups(self):
+        # These regexps have a group and a global flag of their own, so they
+        # are not fused into a single alternation.
+        tokenize = lexer.LexicalGrammar(
+            "+",
+            STR=r'(["\'])[a-z]*\1',
+            WORD=r'(?i)[a-z]+')
+        self.assertIsNone(tokenize.regexp_re)
+        self.compile(tokenize, Grammar({'expr': [['STR', '+', 'WORD']]}))
+        self.assertParse("'abc' + Hello", ('expr', "'abc'", '+', 'Hello'))
+        self.assertNoParse("'abc\" + Hello", message="unexpected characters")
+
     def testArithmetic(self):
         tokenize = lexer.LexicalGrammar(
             "+ - * / ( )",
@@ -886,6 +898,43 @@ class GenTestCase(unittest.TestCase):
         self.assertRaisesRegex(ValueError, "missing parameters for 'Bar'",
                                lambda: Grammar(grammar))
 
+    def testTerminalNonterminalInOtherGrammar(self):
+        # Terminals of the lexical grammar do not conflict with nonterminals of
+        # the syntactic grammar, whether one grammar or both are selected.
+        parse_esgrammar(
+            """
+            goal :
+                Foo
+
+            Foo :
+                `x`
+
+            Bar ::
+                `Foo`
+            """)
+        parse_esgrammar(
+            """
+            goal :
+                `x`
+
+            x ::
+                `y`
+            """, goals=['goal', 'x'], single_grammar=False)
+
+    def testParseEsgrammarReturnsNewGrammar(self):
+        text = """
+            goal :
+                `x` Foo
+
+            Foo :
+                `y`
+            """
+        first = parse_esgrammar(text)
+        first.nonterminals.clear()
+        second = parse_esgrammar(text)
+        self.assertIsNot(first, second)
+        self.assertNotEqual(second.nonterminals, {})
+
     def testCanonicalLR(self):
         """Example 4.39 (grammar 4.20) from the book."""
 
@@ -1199,5 +1248,75 @@ LazyArrowFunction :
         try_it(['Script', 'LazyArrowFunction'])
         try_it(['Script'])
 
+    def assertShiftTablePacks(self, writer):
+        """Check that the packed SHIFT table of a RustParserWriter gives the same
+        entries as the dense table, using the lookup done by ParseTable::shift
+        in the generated Rust code."""
+        num_terminals = len(writer.terminals)
+        width = num_terminals + len(writer.nonterminals)
+        rows = writer.shift_rows()
+        displacements, check, values = writer.pack_shift_table()
+        self.assertEqual(len(displacements), 2 * len(rows))
+        self.assertEqual(len(check), len(values))
+
+        def shift(state, column):
+            half = int(column >= num_terminals)
+            index = displacements[2 * state + half] + column
+            if check[index] == column:
+                return values[index]
+            return "ERROR"
+
+        for state, row in enumerate(rows):
+            dense = ["ERROR"] * width
+            for column, dest in row:
+                dense[column] = dest
+            self.assertEqual([shift(state, column) for column in range(width)], dense)
+
+    def testRustShiftTablePacking(self):
+        from jsparagus.emit.rust import RustParserWriter
+
+        class Writer(RustParserWriter):
+            def __init__(self, terminals, nonterminals, rows):
+                self.terminals = terminals
+                self.nonterminals = nonterminals
+                self.rows = rows
+
+            def shift_rows(self):
+                return self.rows
+
+        self.assertShiftTablePacks(Writer(["a", "b", "c"], ["X", "Y"], [
+            # Rows with no edges at all, or no edges of one kind.
+            [],
+            [(0, 1)],
+            [(3, 2)],
+            # Full rows, which no other row can interleave with.
+            [(0, 3), (1, 4), (2, 5), (3, 6), (4, 7)],
+            [(0, 8), (1, 9), (2, 10), (3, 11), (4, 12)],
+            # The same columns with different destinations, so that a lookup
+            # in the wrong half would find the wrong entry.
+            [(1, 13), (4, 14)],
+            [(1, 15), (4, 16)],
+            [(1, 13), (4, 14)],
+            [(2, 17)],
+            [(0, 18), (2, 19), (3, 20)],
+        ]))
+
+        grammar = parse_esgrammar(
+            """
+            expr :
+                term
+                expr `+` term
+
+            term :
+                prim
+                term `*` prim
+
+            prim :
+                `x`
+                `(` expr `)`
+            """, goals=['expr'])
+        writer = RustParserWriter(io.StringIO(), gen.generate_parser_states(grammar), [])
+        self.assertShiftTablePacks(writer)
+
 if __name__ == '__main__':
     unittest.main()
@@ -28,6 +28,24 @@ class ParsePgenTestCase(unittest.TestCase):
         self.maxDiff = None
         self.assertEqual(pre_generated, generated_from_file)
 
+    def test_esgrammar(self):
+        import os
+        from js_parser import esgrammar_generated
+        filename = os.path.join(os.path.dirname(esgrammar_generated.__file__),
+                                "esgrammar.pgen")
+        grammar = parse_pgen.load_grammar(filename)
+
+        with open(esgrammar_generated.__file__) as f:
+            pre_generated = f.read()
+
+        import io
+        out = io.StringIO()
+        jsparagus.gen.generate_parser(out, grammar)
+        generated_from_file = out.getvalue()
+
+        self.maxDiff = None
+        self.assertEqual(pre_generated, generated_from_file)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 #!/bin/bash
 
-# update.sh - Rebuild generated files from parse_pgen.py and pgen.pgen.
+# update.sh - Rebuild generated files from parse_pgen.py and pgen.pgen, and
+# from js_parser/esgrammar.pgen.
 #
 # These generated files are not actually used to generate themselves,
 # so the process isn't as tricky as it could otherwise be. (They are used
@@ -22,5 +23,7 @@ set -eu
 cd $(dirname "$0")
 python3 -m jsparagus.parse_pgen --regenerate > jsparagus/parse_pgen_generated_NEW.py
 mv jsparagus/parse_pgen_generated_NEW.py jsparagus/parse_pgen_generated.py
+python3 -m js_parser.parse_esgrammar --regenerate > js_parser/esgrammar_generated_NEW.py
+mv js_parser/esgrammar_generated_NEW.py js_parser/esgrammar_generated.py
 
 ./test.sh